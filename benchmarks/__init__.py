@@ -0,0 +1,4 @@
+"""Offline performance benchmarks for shared_kernel.
+
+Run with ``python -m benchmarks``; see ``python -m benchmarks --help``.
+"""
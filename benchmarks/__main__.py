@@ -0,0 +1,65 @@
+import argparse
+import importlib
+import pkgutil
+import sys
+
+from benchmarks import harness
+
+
+def _load_suites() -> None:
+    package = importlib.import_module("benchmarks")
+    for module in pkgutil.iter_modules(package.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run shared_kernel benchmarks."
+    )
+    parser.add_argument("-k", dest="pattern", help="only run cases containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply iterations per repeat"
+    )
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown against the baseline (0.2 = 20%%)",
+    )
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    args = parser.parse_args(argv)
+
+    _load_suites()
+    selected = harness.cases(args.pattern)
+    if args.list:
+        print("\n".join(case.name for case in selected))
+        return 0
+
+    baseline = harness.load_baseline(args.baseline) if args.baseline else {}
+    measurements: dict[str, harness.Measurement] = {}
+    for case in selected:
+        measurement = harness.measure(case, args.repeat, args.scale)
+        measurements[case.name] = measurement
+        reference = baseline.get(case.name)
+        delta = f"  {measurement.ns_per_op / reference:5.2f}x" if reference else ""
+        print(f"{case.name:<48} {measurement.ns_per_op:12.1f} ns/op{delta}")
+
+    if args.output:
+        harness.dump(measurements, args.output)
+
+    regressions = harness.compare(measurements, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline_ns:.1f} -> "
+            f"{regression.current_ns:.1f} ns/op ({regression.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""`ArgumentException` guards on the passing path and the raise/catch path."""
+
+from shared_kernel import ArgumentException
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+def _raise_catch(guard, arg):
+    def run() -> None:
+        try:
+            guard(arg, "param")
+        except ArgumentException:
+            pass
+
+    return run
+
+
+@bench("arguments.construct", NUMBER)
+def construct():
+    return lambda: ArgumentException(ArgumentException.NONE_ARGUMENT_MESSAGE, "p")
+
+
+@bench("arguments.raise_if_none.pass", NUMBER)
+def none_pass():
+    return lambda: ArgumentException.raise_if_none("value", "param")
+
+
+@bench("arguments.raise_if_none.raise_catch", NUMBER // 10)
+def none_raise():
+    return _raise_catch(ArgumentException.raise_if_none, None)
+
+
+@bench("arguments.raise_if_none_or_empty.pass", NUMBER)
+def empty_pass():
+    return lambda: ArgumentException.raise_if_none_or_empty("value", "param")
+
+
+@bench("arguments.raise_if_none_or_empty.raise_catch", NUMBER // 10)
+def empty_raise():
+    return _raise_catch(ArgumentException.raise_if_none_or_empty, "")
+
+
+@bench("arguments.raise_if_none_or_whitespace.pass", NUMBER)
+def whitespace_pass():
+    return lambda: ArgumentException.raise_if_none_or_whitespace("value", "param")
+
+
+@bench("arguments.raise_if_none_or_whitespace.raise_catch", NUMBER // 10)
+def whitespace_raise():
+    return _raise_catch(ArgumentException.raise_if_none_or_whitespace, "   ")
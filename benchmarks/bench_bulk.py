@@ -0,0 +1,57 @@
+"""`try_from_many` next to a hand-written loop, sequentially and in thread and
+process pools of 1 to N workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Self
+
+from shared_kernel import Err, Ok, Result, try_from_many
+
+from .harness import bench
+
+NUMBER = 3
+ITEMS = 20_000
+CHUNKSIZE = 2_000
+WORKERS = sorted({1, 2, 4, os.cpu_count() or 1})
+ROWS = [f"{number},{number * 3 % 997}" for number in range(ITEMS)]
+
+
+@dataclass(frozen=True, slots=True)
+class Reading:
+    sensor: int
+    value: int
+
+    @classmethod
+    def try_from(cls, source: str) -> Result[Self, str]:
+        sensor, _, value = source.partition(",")
+        if not value.isdigit():
+            return Err(source)
+        return Ok(cls(int(sensor), sum(int(digit) for digit in value * 20)))
+
+
+@bench("bulk.loop", NUMBER, ops=ITEMS)
+def loop():
+    return lambda: Result.collect(Reading.try_from(row) for row in ROWS)
+
+
+@bench("bulk.try_from_many", NUMBER, ops=ITEMS)
+def sequential():
+    return lambda: try_from_many(Reading, ROWS)
+
+
+def _register(kind: str, executor_type: type, workers: int) -> None:
+    @bench(f"bulk.{kind}.{workers}", NUMBER, ops=ITEMS)
+    @contextmanager
+    def parallel():
+        with executor_type(max_workers=workers) as pool:
+            yield lambda: try_from_many(
+                Reading, ROWS, executor=pool, chunksize=CHUNKSIZE
+            )
+
+
+for _workers in WORKERS:
+    _register("threads", ThreadPoolExecutor, _workers)
+    _register("processes", ProcessPoolExecutor, _workers)
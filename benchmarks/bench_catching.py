@@ -0,0 +1,72 @@
+"""`catch` next to a hand-written try/except with an isinstance ladder."""
+
+from http import HTTPStatus
+
+from shared_kernel import Err, Error, Ok, Result, catch
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+def fetch(kind: int) -> int:
+    if kind == 1:
+        raise FileNotFoundError(kind)
+    if kind == 2:
+        raise ConnectionResetError(kind)
+    return kind
+
+
+def manual(kind: int) -> Result[int, Error]:
+    try:
+        return Ok(fetch(kind))
+    except Exception as error:
+        if isinstance(error, KeyError):
+            return Err(Error("E422", "unknown key"))
+        if isinstance(error, ValueError):
+            return Err(Error("E400", "bad value"))
+        if isinstance(error, FileNotFoundError):
+            return Err(Error("E404", "missing"))
+        if isinstance(error, OSError):
+            return Err(Error.from_(HTTPStatus.SERVICE_UNAVAILABLE))
+        raise
+
+
+caught = catch(
+    {
+        KeyError: Error("E422", "unknown key"),
+        ValueError: Error("E400", "bad value"),
+        FileNotFoundError: Error("E404", "missing"),
+        OSError: HTTPStatus.SERVICE_UNAVAILABLE,
+    }
+)(fetch)
+
+
+@bench("catch.manual.ok", NUMBER)
+def manual_ok():
+    return lambda: manual(0)
+
+
+@bench("catch.decorator.ok", NUMBER)
+def decorator_ok():
+    return lambda: caught(0)
+
+
+@bench("catch.manual.exact", NUMBER)
+def manual_exact():
+    return lambda: manual(1)
+
+
+@bench("catch.decorator.exact", NUMBER)
+def decorator_exact():
+    return lambda: caught(1)
+
+
+@bench("catch.manual.subclass", NUMBER)
+def manual_subclass():
+    return lambda: manual(2)
+
+
+@bench("catch.decorator.subclass", NUMBER)
+def decorator_subclass():
+    return lambda: caught(2)
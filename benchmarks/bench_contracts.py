@@ -0,0 +1,62 @@
+"""Wrapper cost of `@requires`/`@ensures` in each contract mode."""
+
+from shared_kernel import (
+    ArgumentException,
+    ContractMode,
+    configure_contracts,
+    contract_mode,
+    ensures,
+    requires,
+)
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+def _decorated(mode: ContractMode):
+    previous = contract_mode()
+    configure_contracts(mode)
+    try:
+
+        @requires(name=ArgumentException.raise_if_none_or_whitespace)
+        @ensures(ArgumentException.raise_if_none)
+        def greet(name: str) -> str:
+            return name
+
+    finally:
+        configure_contracts(*previous)
+    return lambda: greet("bob")
+
+
+@bench("contracts.baseline", NUMBER)
+def baseline():
+    def greet(name: str) -> str:
+        return name
+
+    return lambda: greet("bob")
+
+
+@bench("contracts.manual_guards", NUMBER)
+def manual_guards():
+    def greet(name: str) -> str:
+        ArgumentException.raise_if_none_or_whitespace(name, "name")
+        ArgumentException.raise_if_none(name, "return")
+        return name
+
+    return lambda: greet("bob")
+
+
+@bench("contracts.off", NUMBER)
+def off():
+    return _decorated(ContractMode.OFF)
+
+
+@bench("contracts.on", NUMBER)
+def on():
+    return _decorated(ContractMode.ON)
+
+
+@bench("contracts.sampled_100", NUMBER)
+def sampled():
+    return _decorated(ContractMode.SAMPLED)
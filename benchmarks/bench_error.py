@@ -0,0 +1,108 @@
+"""`Error` construction, parsing, hashing and equality.
+
+Cases suffixed with ``.legacy`` use `LegacyError`, a replica of the original
+dict-backed `Error` that hashes code and description on every call.
+"""
+
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from shared_kernel import Error, ErrorCatalog, hash_combine
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+@dataclass(frozen=True)
+class LegacyError:
+    code: str
+    description: str = ""
+
+    def __eq__(self, other: object) -> bool:
+        return False if not isinstance(other, LegacyError) else self.code == other.code
+
+    def __hash__(self) -> int:
+        return hash_combine(self.code, self.description)
+
+
+@bench("error.construct", NUMBER)
+def construct():
+    return lambda: Error("404", "Not Found")
+
+
+@bench("error.construct.legacy", NUMBER)
+def construct_legacy():
+    return lambda: LegacyError("404", "Not Found")
+
+
+@bench("error.from_.str", NUMBER)
+def from_str():
+    return lambda: Error.from_("404:Not Found")
+
+
+@bench("error.from_.http_status", NUMBER)
+def from_http_status():
+    return lambda: Error.from_(HTTPStatus.NOT_FOUND)
+
+
+@bench("error.str", NUMBER)
+def to_str():
+    error = Error("404", "Not Found")
+    return lambda: str(error)
+
+
+@bench("error.hash", NUMBER)
+def hash_error():
+    error = Error("404", "Not Found")
+    return lambda: hash(error)
+
+
+@bench("error.hash.legacy", NUMBER)
+def hash_error_legacy():
+    error = LegacyError("404", "Not Found")
+    return lambda: hash(error)
+
+
+@bench("error.eq", NUMBER)
+def eq():
+    left, right = Error("404", "Not Found"), Error("404", "Not Found")
+    return lambda: left == right
+
+
+@bench("error.dict_lookup", NUMBER)
+def dict_lookup():
+    table = {Error(str(code)): code for code in range(100, 600)}
+    key = Error("404")
+    return lambda: table[key]
+
+
+@bench("error.dict_lookup.legacy", NUMBER)
+def dict_lookup_legacy():
+    table = {LegacyError(str(code)): code for code in range(100, 600)}
+    key = LegacyError("404")
+    return lambda: table[key]
+
+
+def _wire_errors() -> list[Error]:
+    statuses = [HTTPStatus.NOT_FOUND, HTTPStatus.CONFLICT, HTTPStatus.BAD_GATEWAY]
+    return [Error.from_(statuses[i % 3]) for i in range(1000)]
+
+
+@bench("error.catalog.encode_1000", NUMBER // 100, 1000)
+def catalog_encode():
+    catalog, errors = ErrorCatalog.from_http_status(), _wire_errors()
+    return lambda: catalog.encode(errors)
+
+
+@bench("error.catalog.decode_1000", NUMBER // 100, 1000)
+def catalog_decode():
+    catalog = ErrorCatalog.from_http_status()
+    encoded = catalog.encode(_wire_errors())
+    return lambda: catalog.decode(encoded)
+
+
+@bench("error.catalog.decode_1000.string", NUMBER // 100, 1000)
+def string_decode():
+    encoded = [str(error) for error in _wire_errors()]
+    return lambda: [Error.from_(text) for text in encoded]
@@ -0,0 +1,88 @@
+"""`hash_combine` across argument counts."""
+
+from shared_kernel import (
+    Hasher,
+    Partitioner,
+    hash_combine,
+    hash_combine_columns,
+    stable_hash_combine,
+)
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+@bench("hash_combine.args_1", NUMBER)
+def args_1():
+    return lambda: hash_combine(1)
+
+
+@bench("hash_combine.args_2", NUMBER)
+def args_2():
+    return lambda: hash_combine(1, "two")
+
+
+@bench("hash_combine.args_3", NUMBER)
+def args_3():
+    return lambda: hash_combine(True, 1, None)
+
+
+@bench("hash_combine.args_16", NUMBER // 10)
+def args_16():
+    args = tuple(range(16))
+    return lambda: hash_combine(*args)
+
+
+@bench("hash_combine.args_256", NUMBER // 100)
+def args_256():
+    args = tuple(range(256))
+    return lambda: hash_combine(*args)
+
+
+@bench("hasher.update_256", NUMBER // 100)
+def hasher_256():
+    args = tuple(range(256))
+
+    def run() -> int:
+        hasher = Hasher()
+        for arg in args:
+            hasher.update(arg)
+        return hasher.digest()
+
+    return run
+
+
+ROWS = 1_000_000
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional extra.
+    np = None
+
+if np is not None:
+
+    @bench("hash_combine_columns.rows_1m_3_columns", 1, ROWS)
+    def columns_3():
+        rng = np.random.default_rng(0)
+        columns = [rng.integers(-(2**62), 2**62, ROWS) for _ in range(3)]
+        return lambda: hash_combine_columns(*columns)
+
+    @bench("hash_combine_columns.rows_1m_3_columns.scalar", 1, ROWS)
+    def columns_3_scalar():
+        rng = np.random.default_rng(0)
+        rows = list(
+            zip(*(rng.integers(-(2**62), 2**62, ROWS).tolist() for _ in range(3)))
+        )
+        return lambda: [hash_combine(*row) for row in rows]
+
+
+@bench("stable_hash_combine.args_3", NUMBER)
+def stable_args_3():
+    return lambda: stable_hash_combine("tenant", 42, b"id")
+
+
+@bench("partitioner.shard_for", NUMBER)
+def shard_for():
+    partitioner = Partitioner(64)
+    return lambda: partitioner.shard_for("tenant", 42)
@@ -0,0 +1,55 @@
+"""Result instrumentation: uninstrumented baseline, disabled, enabled and sampled.
+
+Each call runs a batch, so the enabled cases can switch instrumentation on and off
+around the batch without leaking it into other benchmarks.
+"""
+
+from shared_kernel import (
+    CounterSink,
+    Ok,
+    disable_instrumentation,
+    enable_instrumentation,
+)
+
+from .harness import bench
+
+NUMBER = 10
+BATCH = 10_000
+
+
+def _work() -> None:
+    for value in range(BATCH):
+        Ok(value).map(str).and_then(Ok)
+
+
+def _instrumented(sample_rate: int):
+    def run() -> None:
+        enable_instrumentation(CounterSink(), sample_rate)
+        try:
+            _work()
+        finally:
+            disable_instrumentation()
+
+    return run
+
+
+@bench("instrumentation.baseline", NUMBER, ops=BATCH)
+def baseline():
+    return _work
+
+
+@bench("instrumentation.disabled", NUMBER, ops=BATCH)
+def disabled():
+    enable_instrumentation(CounterSink())
+    disable_instrumentation()
+    return _work
+
+
+@bench("instrumentation.enabled", NUMBER, ops=BATCH)
+def enabled():
+    return _instrumented(0)
+
+
+@bench("instrumentation.sampled_1_in_100", NUMBER, ops=BATCH)
+def sampled():
+    return _instrumented(100)
@@ -0,0 +1,52 @@
+"""Cache-hit cost of `memoize_result` next to `functools.lru_cache`."""
+
+from functools import lru_cache
+
+from shared_kernel import Ok, Result, memoize_result
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+def lookup(key: int) -> Result[int, str]:
+    return Ok(key)
+
+
+def pair(key: int, scope: str) -> Result[int, str]:
+    return Ok(key)
+
+
+@bench("memoize.uncached", NUMBER)
+def uncached():
+    return lambda: lookup(7)
+
+
+@bench("memoize.lru_cache.hit", NUMBER)
+def lru_cache_hit():
+    cached = lru_cache(maxsize=128)(lookup)
+    return lambda: cached(7)
+
+
+@bench("memoize.hit", NUMBER)
+def memoize_hit():
+    cached = memoize_result()(lookup)
+    return lambda: cached(7)
+
+
+@bench("memoize.hit.two_args", NUMBER)
+def memoize_hit_two_args():
+    cached = memoize_result()(pair)
+    return lambda: cached(7, "users")
+
+
+@bench("memoize.hit.thread_safe", NUMBER)
+def memoize_hit_thread_safe():
+    cached = memoize_result(thread_safe=True)(lookup)
+    return lambda: cached(7)
+
+
+@bench("memoize.hit.ttl", NUMBER)
+def memoize_hit_ttl():
+    cached = memoize_result(ttl=60)(lookup)
+    return lambda: cached(7)
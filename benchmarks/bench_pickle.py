@@ -0,0 +1,58 @@
+"""Pickle round trips of Result lists: generic slot-state pickling, the compact
+`__reduce__` and the columnar `ResultBatch`.
+
+Bytes per item are printed by ``python -m benchmarks.size_pickle``.
+"""
+
+import copyreg
+import io
+import pickle
+from http import HTTPStatus
+
+from shared_kernel import Err, Error, Ok, Result, ResultBatch
+
+from .harness import bench
+
+NUMBER = 20
+BATCH = 1_000
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class LegacyPickler(pickle.Pickler):
+    """Pickles Results and Errors through the generic path used before `__reduce__`."""
+
+    def reducer_override(self, obj: object) -> object:
+        if isinstance(obj, (Result, Error)):
+            return copyreg.__newobj__, (type(obj),), obj.__getstate__()
+        return NotImplemented
+
+
+def legacy_dumps(obj: object) -> bytes:
+    buffer = io.BytesIO()
+    LegacyPickler(buffer, PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+def results() -> list[Result[str, Error]]:
+    return [
+        Err(Error.from_(HTTPStatus.BAD_GATEWAY)) if i % 10 == 0 else Ok(f"v{i}")
+        for i in range(BATCH)
+    ]
+
+
+@bench("pickle.round_trip.list.legacy", NUMBER, ops=BATCH)
+def round_trip_legacy():
+    batch = results()
+    return lambda: pickle.loads(legacy_dumps(batch))
+
+
+@bench("pickle.round_trip.list", NUMBER, ops=BATCH)
+def round_trip_list():
+    batch = results()
+    return lambda: pickle.loads(pickle.dumps(batch, PROTOCOL))
+
+
+@bench("pickle.round_trip.result_batch", NUMBER, ops=BATCH)
+def round_trip_batch():
+    batch = ResultBatch(results())
+    return lambda: pickle.loads(pickle.dumps(batch, PROTOCOL))
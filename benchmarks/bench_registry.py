@@ -0,0 +1,82 @@
+"""Cached `ConversionRegistry.convert` next to a hand-written isinstance chain."""
+
+from dataclasses import dataclass
+from typing import Self
+
+from shared_kernel import ConversionRegistry, Err, Ok, Result
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class Celsius:
+    value: float
+
+    @classmethod
+    def try_from(cls, source: str) -> Result[Self, str]:
+        try:
+            return Ok(cls(float(source)))
+        except ValueError:
+            return Err("not a number")
+
+
+@dataclass(frozen=True, slots=True)
+class Kelvin:
+    value: float
+
+    @classmethod
+    def from_(cls, source: Celsius) -> Self:
+        return cls(source.value + 273.15)
+
+
+def manual(value: object) -> Result[Kelvin, str]:
+    if isinstance(value, Kelvin):
+        return Ok(value)
+    if isinstance(value, Celsius):
+        return Ok(Kelvin.from_(value))
+    if isinstance(value, str):
+        return Celsius.try_from(value).map(Kelvin.from_)
+    raise TypeError(value)
+
+
+def registry() -> ConversionRegistry:
+    registry = ConversionRegistry()
+    registry.register_try_from(Celsius, str)
+    registry.register_from(Kelvin, Celsius)
+    return registry
+
+
+@bench("registry.manual.one_hop", NUMBER)
+def manual_one_hop():
+    value = Celsius(21.5)
+    return lambda: manual(value)
+
+
+@bench("registry.convert.one_hop", NUMBER)
+def convert_one_hop():
+    convert, value = registry().convert, Celsius(21.5)
+    return lambda: convert(value, Kelvin)
+
+
+@bench("registry.manual.two_hops", NUMBER)
+def manual_two_hops():
+    return lambda: manual("21.5")
+
+
+@bench("registry.convert.two_hops", NUMBER)
+def convert_two_hops():
+    convert = registry().convert
+    return lambda: convert("21.5", Kelvin)
+
+
+@bench("registry.convert.uncached", 10_000)
+def convert_uncached():
+    conversions = registry()
+
+    def run() -> None:
+        conversions._paths.clear()
+        conversions.convert("21.5", Kelvin)
+
+    return run
@@ -0,0 +1,143 @@
+"""Core `Result` costs: construction, combinators, hashing, equality, unwrap failures.
+
+Cases suffixed with ``.legacy`` run the same operation on plain `Result(...)`
+instances, which go through the branching base-class methods instead of the
+`Ok`/`Err` subclasses.
+"""
+
+from shared_kernel import (
+    ArgumentException,
+    Err,
+    Ok,
+    Result,
+    UnwrapFailedException,
+)
+
+from .harness import bench
+
+NUMBER = 100_000
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _bind(x: int) -> Result[int, str]:
+    return Ok(x)
+
+
+def _legacy_ok(value: int) -> Result[int, str]:
+    ArgumentException.raise_if_none(value, "Ok.value")
+    return Result(True, value, None)
+
+
+@bench("result.construct.ok", NUMBER)
+def construct_ok():
+    return lambda: Ok(1)
+
+
+@bench("result.construct.ok.legacy", NUMBER)
+def construct_ok_legacy():
+    return lambda: _legacy_ok(1)
+
+
+@bench("result.construct.err", NUMBER)
+def construct_err():
+    return lambda: Err("e")
+
+
+@bench("result.map.ok", NUMBER)
+def map_ok():
+    ok: Result[int, str] = Ok(1)
+    return lambda: ok.map(_inc)
+
+
+@bench("result.map.ok.legacy", NUMBER)
+def map_ok_legacy():
+    ok: Result[int, str] = Result(True, 1, None)
+    return lambda: ok.map(_inc)
+
+
+@bench("result.map.err", NUMBER)
+def map_err():
+    err: Result[int, str] = Err("e")
+    return lambda: err.map(_inc)
+
+
+@bench("result.map.err.legacy", NUMBER)
+def map_err_legacy():
+    err: Result[int, str] = Result(False, None, "e")
+    return lambda: err.map(_inc)
+
+
+@bench("result.and_then.ok", NUMBER)
+def and_then_ok():
+    ok: Result[int, str] = Ok(1)
+    return lambda: ok.and_then(_bind)
+
+
+@bench("result.and_then.ok.legacy", NUMBER)
+def and_then_ok_legacy():
+    ok: Result[int, str] = Result(True, 1, None)
+    return lambda: ok.and_then(_bind)
+
+
+@bench("result.expect.ok", NUMBER)
+def expect_ok():
+    ok: Result[int, str] = Ok(1)
+    return lambda: ok.expect("")
+
+
+@bench("result.expect.ok.legacy", NUMBER)
+def expect_ok_legacy():
+    ok: Result[int, str] = Result(True, 1, None)
+    return lambda: ok.expect("")
+
+
+@bench("result.chain.ok", NUMBER)
+def chain_ok():
+    ok: Result[int, str] = Ok(1)
+    return lambda: ok.map(_inc).and_then(_bind).map(_inc).map_err(len)
+
+
+@bench("result.chain.err", NUMBER)
+def chain_err():
+    err: Result[int, str] = Err("e")
+    return lambda: err.map(_inc).and_then(_bind).map(_inc).map_err(len)
+
+
+@bench("result.hash.ok", NUMBER)
+def hash_ok():
+    ok = Ok(1)
+    return lambda: hash(ok)
+
+
+@bench("result.hash.err", NUMBER)
+def hash_err():
+    err = Err("error")
+    return lambda: hash(err)
+
+
+@bench("result.eq.equal", NUMBER)
+def eq_equal():
+    left, right = Ok(1), Ok(1)
+    return lambda: left == right
+
+
+@bench("result.eq.different", NUMBER)
+def eq_different():
+    left, right = Ok(1), Err("e")
+    return lambda: left == right
+
+
+@bench("result.expect.raise_catch", NUMBER // 10)
+def expect_raise_catch():
+    err: Result[int, str] = Err("e")
+
+    def run() -> None:
+        try:
+            err.expect("failed")
+        except UnwrapFailedException:
+            pass
+
+    return run
@@ -0,0 +1,61 @@
+"""`ResultArray` column operations versus the same work on a `list[Result]`.
+
+Memory per Result is printed by ``python -m benchmarks.memory_result_array``.
+"""
+
+import importlib.util
+
+from shared_kernel import Err, Ok, Result, ResultArray
+
+from .harness import bench
+
+NUMBER = 10
+SIZE = 10_000
+
+
+def results(size: int = SIZE) -> list[Result[int, str]]:
+    return [Err("failed") if i % 10 == 0 else Ok(i) for i in range(size)]
+
+
+@bench("result_array.from_results", NUMBER, ops=SIZE)
+def from_results():
+    items = results()
+    return lambda: ResultArray(items, "q")
+
+
+@bench("result_array.partition.list", NUMBER, ops=SIZE)
+def partition_list():
+    items = results()
+    return lambda: Result.partition(items)
+
+
+@bench("result_array.partition", NUMBER, ops=SIZE)
+def partition_array():
+    array = ResultArray(results(), "q")
+    return array.partition
+
+
+@bench("result_array.map.list", NUMBER, ops=SIZE)
+def map_list():
+    items = results()
+    return lambda: [result.map(lambda x: x * 2) for result in items]
+
+
+@bench("result_array.map", NUMBER, ops=SIZE)
+def map_array():
+    array = ResultArray(results(), "q")
+    return lambda: array.map(lambda x: x * 2, typecode="q")
+
+
+if importlib.util.find_spec("numpy") is not None:
+
+    @bench("result_array.map.vectorized", NUMBER, ops=SIZE)
+    def map_vectorized():
+        array = ResultArray(results(), "q")
+        return lambda: array.map(lambda column: column * 2, vectorized=True)
+
+
+@bench("result_array.iterate", NUMBER, ops=SIZE)
+def iterate():
+    array = ResultArray(results(), "q")
+    return lambda: sum(1 for _ in array)
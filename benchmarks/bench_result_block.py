@@ -0,0 +1,132 @@
+"""`result_block` next to the equivalent nested `and_then` chain."""
+
+import asyncio
+
+from shared_kernel import Err, Ok, Result, async_result_block, result_block
+
+from .harness import bench
+
+NUMBER = 100_000
+ASYNC_NUMBER = 20
+ASYNC_CALLS = 1_000
+
+
+def parse(raw: str) -> Result[int, str]:
+    return Ok(int(raw)) if raw.isdigit() else Err("not a number")
+
+
+def check(value: int) -> Result[int, str]:
+    return Ok(value) if value < 1000 else Err("too large")
+
+
+def scale(value: int) -> Result[int, str]:
+    return Ok(value * 2)
+
+
+async def scale_async(value: int) -> Result[int, str]:
+    return Ok(value * 2)
+
+
+def nested(raw: str) -> Result[int, str]:
+    return parse(raw).and_then(
+        lambda a: check(a).and_then(lambda b: scale(b).map(lambda c: a + b + c))
+    )
+
+
+@result_block
+def block(raw: str):
+    a = yield parse(raw)
+    b = yield check(a)
+    c = yield scale(b)
+    return a + b + c
+
+
+def nested_deep(raw: str) -> Result[int, str]:
+    return parse(raw).and_then(
+        lambda a: check(a).and_then(
+            lambda b: scale(b).and_then(
+                lambda c: check(c).and_then(
+                    lambda d: scale(d).and_then(
+                        lambda e: check(e).map(lambda f: a + b + c + d + e + f)
+                    )
+                )
+            )
+        )
+    )
+
+
+@result_block
+def block_deep(raw: str):
+    a = yield parse(raw)
+    b = yield check(a)
+    c = yield scale(b)
+    d = yield check(c)
+    e = yield scale(d)
+    f = yield check(e)
+    return a + b + c + d + e + f
+
+
+async def nested_async(raw: str) -> Result[int, str]:
+    return await parse(raw).and_then_async(
+        lambda a: check(a).and_then_async(lambda b: _map_sum(scale_async(b), a + b))
+    )
+
+
+async def _map_sum(step, offset: int) -> Result[int, str]:
+    return (await step).map(lambda c: offset + c)
+
+
+@async_result_block
+def block_async(raw: str):
+    a = yield parse(raw)
+    b = yield check(a)
+    c = yield scale_async(b)
+    return a + b + c
+
+
+@bench("result_block.nested.ok", NUMBER)
+def nested_ok():
+    return lambda: nested("12")
+
+
+@bench("result_block.block.ok", NUMBER)
+def block_ok():
+    return lambda: block("12")
+
+
+@bench("result_block.nested.err", NUMBER)
+def nested_err():
+    return lambda: nested("x")
+
+
+@bench("result_block.block.err", NUMBER)
+def block_err():
+    return lambda: block("x")
+
+
+@bench("result_block.nested.deep.ok", NUMBER)
+def nested_deep_ok():
+    return lambda: nested_deep("12")
+
+
+@bench("result_block.block.deep.ok", NUMBER)
+def block_deep_ok():
+    return lambda: block_deep("12")
+
+
+def _run_many(function) -> None:
+    async def main() -> None:
+        for _ in range(ASYNC_CALLS):
+            await function("12")
+
+    asyncio.run(main())
+
+
+@bench("result_block.nested_async.ok", ASYNC_NUMBER, ops=ASYNC_CALLS)
+def nested_async_ok():
+    return lambda: _run_many(nested_async)
+
+
+@bench("result_block.block_async.ok", ASYNC_NUMBER, ops=ASYNC_CALLS)
+def block_async_ok():
+    return lambda: _run_many(block_async)
@@ -0,0 +1,54 @@
+"""Bulk Result combinators versus hand-written loops on 1M items."""
+
+from shared_kernel import Err, Ok, Result
+
+from .harness import bench
+
+SIZE = 1_000_000
+
+
+def _manual_collect(results: list[Result[int, str]]) -> Result[list[int], str]:
+    values = []
+    for result in results:
+        if result.is_err():
+            return Err(result.expect_err("checked"))
+        values.append(result.expect("checked"))
+    return Ok(values)
+
+
+def _manual_partition(results: list[Result[int, str]]) -> tuple[list[int], list[str]]:
+    oks = [r.expect("checked") for r in results if r.is_ok()]
+    errs = [r.expect_err("checked") for r in results if r.is_err()]
+    return oks, errs
+
+
+def _all_ok() -> list[Result[int, str]]:
+    return [Ok(i) for i in range(SIZE)]
+
+
+def _mixed() -> list[Result[int, str]]:
+    return [Ok(i) if i % 10 else Err(str(i)) for i in range(SIZE)]
+
+
+@bench("result.bulk.collect", 1, SIZE)
+def collect():
+    results = _all_ok()
+    return lambda: Result.collect(results)
+
+
+@bench("result.bulk.collect.loop", 1, SIZE)
+def collect_loop():
+    results = _all_ok()
+    return lambda: _manual_collect(results)
+
+
+@bench("result.bulk.partition", 1, SIZE)
+def partition():
+    results = _mixed()
+    return lambda: Result.partition(results)
+
+
+@bench("result.bulk.partition.loop", 1, SIZE)
+def partition_loop():
+    results = _mixed()
+    return lambda: _manual_partition(results)
@@ -0,0 +1,48 @@
+"""Eager combinator chains versus a compiled `Result.pipeline()`."""
+
+from shared_kernel import Err, Ok, Result
+
+from .harness import bench
+
+SIZE = 200_000
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _half(x: int) -> Result[int, str]:
+    return Ok(x // 2) if x % 2 == 0 else Err("odd")
+
+
+def _results() -> list[Result[int, str]]:
+    return [Ok(i) if i % 10 else Err("bad") for i in range(SIZE)]
+
+
+def _eager(results: list[Result[int, str]]) -> list[Result[str, int]]:
+    return [
+        r.map(_inc).map(_inc).and_then(_half).map(str).map_err(len) for r in results
+    ]
+
+
+@bench("result.pipeline.eager", 1, SIZE)
+def eager():
+    results = _results()
+    return lambda: _eager(results)
+
+
+@bench("result.pipeline.compiled", 1, SIZE)
+def compiled():
+    results = _results()
+    pipeline = (
+        Result[int, str]
+        .pipeline()
+        .map(_inc)
+        .map(_inc)
+        .and_then(_half)
+        .map(str)
+        .map_err(len)
+    )
+    # Outside the timed region: the compiled pipeline must match the chain.
+    assert list(pipeline.stream(results)) == _eager(results)
+    return lambda: list(pipeline.stream(results))
@@ -0,0 +1,61 @@
+"""Compiled `Schema` versus hand-composed `raise_if_*` guards on dict records."""
+
+from shared_kernel import ArgumentException, Schema, in_range
+
+from .harness import bench
+
+NUMBER = 50_000
+BATCH = 1_000
+VALID = {"id": 1, "name": "bob", "tags": ["a"], "age": 42}
+INVALID = {"id": 1, "name": "  ", "tags": ["a"], "age": 42}
+SCHEMA = Schema(
+    {
+        "id": ArgumentException.raise_if_none,
+        "name": ArgumentException.raise_if_none_or_whitespace,
+        "tags": ArgumentException.raise_if_none_or_empty,
+        "age": in_range(0, 150),
+    }
+)
+
+
+def _by_hand(record: dict) -> bool:
+    try:
+        ArgumentException.raise_if_none(record.get("id"), "id")
+        ArgumentException.raise_if_none_or_whitespace(record.get("name"), "name")
+        ArgumentException.raise_if_none_or_empty(record.get("tags"), "tags")
+        ArgumentException.raise_if_out_of_range(record.get("age"), 0, 150, "age")
+    except ArgumentException:
+        return False
+    return True
+
+
+@bench("schema.by_hand.valid", NUMBER)
+def by_hand_valid():
+    return lambda: _by_hand(VALID)
+
+
+@bench("schema.by_hand.invalid", NUMBER)
+def by_hand_invalid():
+    return lambda: _by_hand(INVALID)
+
+
+@bench("schema.validate.valid", NUMBER)
+def validate_valid():
+    return lambda: SCHEMA.validate(VALID)
+
+
+@bench("schema.validate.invalid", NUMBER)
+def validate_invalid():
+    return lambda: SCHEMA.validate(INVALID)
+
+
+@bench("schema.by_hand.batch", NUMBER // BATCH, ops=BATCH)
+def by_hand_batch():
+    records = [VALID] * BATCH
+    return lambda: [_by_hand(record) for record in records]
+
+
+@bench("schema.validate_many.batch", NUMBER // BATCH, ops=BATCH)
+def validate_many_batch():
+    records = [VALID] * BATCH
+    return lambda: SCHEMA.validate_many(records)
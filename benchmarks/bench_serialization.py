@@ -0,0 +1,91 @@
+"""Binary `encode_results`/`decode_results` versus dicts plus JSON, and pickle.
+
+Bytes per item are printed by ``python -m benchmarks.size_serialization``.
+"""
+
+import json
+import pickle
+
+from shared_kernel import (
+    STR_CODEC,
+    Err,
+    Error,
+    Ok,
+    Result,
+    decode_results,
+    encode_results,
+)
+
+from .harness import bench
+
+NUMBER = 20
+BATCH = 1_000
+
+
+def results() -> list[Result[str, Error]]:
+    return [
+        Err(Error(f"E{i % 16:03}", "Upstream failed")) if i % 10 == 0 else Ok(f"v{i}")
+        for i in range(BATCH)
+    ]
+
+
+def to_json(batch: list[Result[str, Error]]) -> bytes:
+    return json.dumps(
+        [
+            {"ok": True, "value": result.ok()}
+            if result.is_ok()
+            else {
+                "ok": False,
+                "error": {
+                    "code": result.err().code,
+                    "description": result.err().description,
+                },
+            }
+            for result in batch
+        ]
+    ).encode()
+
+
+def from_json(data: bytes) -> list[Result[str, Error]]:
+    return [
+        Ok(item["value"])
+        if item["ok"]
+        else Err(Error(item["error"]["code"], item["error"]["description"]))
+        for item in json.loads(data)
+    ]
+
+
+@bench("serialization.encode.json", NUMBER, ops=BATCH)
+def encode_json():
+    batch = results()
+    return lambda: to_json(batch)
+
+
+@bench("serialization.encode.pickle", NUMBER, ops=BATCH)
+def encode_pickle():
+    batch = results()
+    return lambda: pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+
+
+@bench("serialization.encode.binary", NUMBER, ops=BATCH)
+def encode_binary():
+    batch = results()
+    return lambda: encode_results(batch, STR_CODEC)
+
+
+@bench("serialization.decode.json", NUMBER, ops=BATCH)
+def decode_json():
+    data = to_json(results())
+    return lambda: from_json(data)
+
+
+@bench("serialization.decode.pickle", NUMBER, ops=BATCH)
+def decode_pickle():
+    data = pickle.dumps(results(), pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
+
+
+@bench("serialization.decode.binary", NUMBER, ops=BATCH)
+def decode_binary():
+    data = memoryview(encode_results(results(), STR_CODEC))
+    return lambda: decode_results(data, STR_CODEC)
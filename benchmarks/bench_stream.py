@@ -0,0 +1,41 @@
+"""`ResultStream` scaling: a CPU-bound `and_then` stage run sequentially and in
+thread and process pools of 1 to N workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from shared_kernel import Err, Ok, Result, ResultStream
+
+from .harness import bench
+
+NUMBER = 3
+ITEMS = 2_000
+CHUNKSIZE = 100
+WORKERS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+def checksum(value: int) -> Result[int, str]:
+    total = sum(i * value for i in range(500))
+    return Err("odd") if total % 7 == 0 else Ok(total)
+
+
+@bench("stream.sequential", NUMBER, ops=ITEMS)
+def sequential():
+    return lambda: sum(ResultStream(range(ITEMS)).and_then(checksum))
+
+
+def _register(kind: str, executor_type: type, workers: int) -> None:
+    @bench(f"stream.{kind}.{workers}", NUMBER, ops=ITEMS)
+    @contextmanager
+    def parallel():
+        with executor_type(max_workers=workers) as pool:
+            yield lambda: sum(
+                ResultStream(range(ITEMS)).and_then(checksum, pool, chunksize=CHUNKSIZE)
+            )
+
+
+for _workers in WORKERS:
+    _register("threads", ThreadPoolExecutor, _workers)
+    _register("processes", ProcessPoolExecutor, _workers)
@@ -0,0 +1,79 @@
+"""Non-raising validators versus the raising guards.
+
+The invalid record fails a single field, so every approach builds one exception;
+the raising guards also skip the checks after the failing field.
+"""
+
+from shared_kernel import (
+    ArgumentException,
+    collect_none,
+    collect_none_or_empty,
+    collect_none_or_whitespace,
+    collected,
+    try_none,
+    try_none_or_empty,
+    try_none_or_whitespace,
+    validate_all,
+)
+
+from .harness import bench
+
+NUMBER = 50_000
+VALID = {"id": 1, "name": "bob", "tags": ["a"]}
+INVALID = {"id": 1, "name": "  ", "tags": ["a"]}
+
+
+def _raising(record: dict) -> bool:
+    try:
+        ArgumentException.raise_if_none(record["id"], "id")
+        ArgumentException.raise_if_none_or_whitespace(record["name"], "name")
+        ArgumentException.raise_if_none_or_empty(record["tags"], "tags")
+    except ArgumentException:
+        return False
+    return True
+
+
+def _results(record: dict) -> bool:
+    return validate_all(
+        try_none(record["id"], "id"),
+        try_none_or_whitespace(record["name"], "name"),
+        try_none_or_empty(record["tags"], "tags"),
+    ).is_ok()
+
+
+def _collecting(record: dict) -> bool:
+    failures: list = []
+    record_id = collect_none(failures, record["id"], "id")
+    name = collect_none_or_whitespace(failures, record["name"], "name")
+    tags = collect_none_or_empty(failures, record["tags"], "tags")
+    return collected(failures, (record_id, name, tags)).is_ok()
+
+
+@bench("validation.raising.valid", NUMBER)
+def raising_valid():
+    return lambda: _raising(VALID)
+
+
+@bench("validation.raising.invalid", NUMBER)
+def raising_invalid():
+    return lambda: _raising(INVALID)
+
+
+@bench("validation.try.valid", NUMBER)
+def try_valid():
+    return lambda: _results(VALID)
+
+
+@bench("validation.try.invalid", NUMBER)
+def try_invalid():
+    return lambda: _results(INVALID)
+
+
+@bench("validation.collect.valid", NUMBER)
+def collect_valid():
+    return lambda: _collecting(VALID)
+
+
+@bench("validation.collect.invalid", NUMBER)
+def collect_invalid():
+    return lambda: _collecting(INVALID)
@@ -0,0 +1,107 @@
+import json
+import platform
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict, dataclass
+from timeit import Timer
+from typing import Callable
+
+type Timed = Callable[[], object]
+type Setup = Callable[[], Timed | AbstractContextManager[Timed]]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Setup
+    number: int
+    ops: int
+
+
+@dataclass(frozen=True)
+class Measurement:
+    name: str
+    ns_per_op: float
+    number: int
+    ops: int
+    repeat: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+_REGISTRY: dict[str, Case] = {}
+
+
+def bench(name: str, number: int = 10_000, ops: int = 1) -> Callable[[Setup], Setup]:
+    """
+    Register a benchmark case.
+
+    The decorated function runs once, outside the timed region, and returns the
+    zero-argument callable that is timed `number` times per repeat. `ops` is the
+    number of operations one call performs, e.g. the size of a processed batch.
+    A setup that holds resources, such as an executor, returns a context
+    manager instead, which yields the callable and is exited after the case.
+    """
+
+    def register(setup: Setup) -> Setup:
+        if name in _REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        _REGISTRY[name] = Case(name, setup, number, ops)
+        return setup
+
+    return register
+
+
+def cases(pattern: str | None = None) -> list[Case]:
+    return [
+        case
+        for name, case in sorted(_REGISTRY.items())
+        if pattern is None or pattern in name
+    ]
+
+
+def measure(case: Case, repeat: int = 5, scale: float = 1.0) -> Measurement:
+    number = max(1, int(case.number * scale))
+    prepared = case.setup()
+    if not isinstance(prepared, AbstractContextManager):
+        prepared = nullcontext(prepared)
+    with prepared as timed:
+        best = min(Timer(timed).repeat(repeat=repeat, number=number))
+    return Measurement(
+        case.name, best / (number * case.ops) * 1e9, number, case.ops, repeat
+    )
+
+
+def compare(
+    current: dict[str, Measurement], baseline: dict[str, float], threshold: float
+) -> list[Regression]:
+    return [
+        Regression(name, baseline[name], measurement.ns_per_op)
+        for name, measurement in current.items()
+        if name in baseline and measurement.ns_per_op > baseline[name] * (1 + threshold)
+    ]
+
+
+def dump(measurements: dict[str, Measurement], path: str) -> None:
+    document = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": {name: asdict(m) for name, m in measurements.items()},
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> dict[str, float]:
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    return {name: entry["ns_per_op"] for name, entry in document["results"].items()}
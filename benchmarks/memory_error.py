@@ -0,0 +1,32 @@
+"""Per-instance memory of `Error` versus the original dict-backed layout.
+
+Run with ``python -m benchmarks.memory_error``.
+"""
+
+import tracemalloc
+
+from shared_kernel import Error
+
+from .bench_error import LegacyError
+
+COUNT = 100_000
+
+
+def bytes_per_instance(factory: type) -> float:
+    codes = [f"E{i:05}" for i in range(COUNT)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(code, "description") for code in codes]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / COUNT
+
+
+def main() -> None:
+    for name, factory in (("legacy", LegacyError), ("slotted", Error)):
+        print(f"{name:<8} {bytes_per_instance(factory):6.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
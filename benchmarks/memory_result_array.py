@@ -0,0 +1,36 @@
+"""Memory held per Result by a `list[Result]` versus a typed `ResultArray`.
+
+Run with ``python -m benchmarks.memory_result_array``.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+
+from shared_kernel import ResultArray
+
+from .bench_result_array import results
+
+COUNT = 1_000_000
+
+
+def bytes_per_result(build: Callable[[], object]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / COUNT
+
+
+def main() -> None:
+    cases: tuple[tuple[str, Callable[[], object]], ...] = (
+        ("list", lambda: results(COUNT)),
+        ("array", lambda: ResultArray(results(COUNT), "q")),
+    )
+    for name, build in cases:
+        print(f"{name:<6} {bytes_per_result(build):6.1f} bytes/result")
+
+
+if __name__ == "__main__":
+    main()
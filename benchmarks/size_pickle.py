@@ -0,0 +1,25 @@
+"""Pickled bytes per Result: generic pickling, compact `__reduce__`, `ResultBatch`.
+
+Run with ``python -m benchmarks.size_pickle``.
+"""
+
+import pickle
+
+from shared_kernel import ResultBatch
+
+from .bench_pickle import BATCH, PROTOCOL, legacy_dumps, results
+
+
+def main() -> None:
+    batch = results()
+    sizes = (
+        ("legacy", len(legacy_dumps(batch))),
+        ("list", len(pickle.dumps(batch, PROTOCOL))),
+        ("batch", len(pickle.dumps(ResultBatch(batch), PROTOCOL))),
+    )
+    for name, size in sizes:
+        print(f"{name:<8} {size / BATCH:6.1f} bytes/result")
+
+
+if __name__ == "__main__":
+    main()
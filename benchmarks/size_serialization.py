@@ -0,0 +1,25 @@
+"""Encoded bytes per Result for JSON, pickle and `encode_results`.
+
+Run with ``python -m benchmarks.size_serialization``.
+"""
+
+import pickle
+
+from shared_kernel import STR_CODEC, encode_results
+
+from .bench_serialization import BATCH, results, to_json
+
+
+def main() -> None:
+    batch = results()
+    sizes = (
+        ("json", len(to_json(batch))),
+        ("pickle", len(pickle.dumps(batch, pickle.HIGHEST_PROTOCOL))),
+        ("binary", len(encode_results(batch, STR_CODEC))),
+    )
+    for name, size in sizes:
+        print(f"{name:<8} {size / BATCH:6.1f} bytes/result")
+
+
+if __name__ == "__main__":
+    main()
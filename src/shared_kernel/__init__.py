@@ -1,20 +1,223 @@
-from .abstractions import IDefault, IFrom, IInto, ITryFrom, ITryInto
-from .design_by_contract import ArgumentException
-from .error_struct import Error
-from .functions import hash_combine
-from .result_type import Err, Ok, Result, UnwrapFailedException
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abstractions import (
+        ConversionRegistry,
+        IDefault,
+        IFrom,
+        IInto,
+        ITryFrom,
+        ITryInto,
+        try_from_many,
+        try_into_many,
+    )
+    from .design_by_contract import (
+        ArgumentException,
+        ContractMode,
+        Schema,
+        configure_contracts,
+        contract_mode,
+        ensures,
+        in_range,
+        requires,
+    )
+    from .error_struct import Error, ErrorCatalog
+    from .functions import (
+        Hasher,
+        Partitioner,
+        hash_combine,
+        hash_combine_columns,
+        stable_hash_combine,
+    )
+    from .result_type import (
+        BYTES_CODEC,
+        ERROR_CODEC,
+        INT_CODEC,
+        PICKLE_CODEC,
+        STR_CODEC,
+        AsyncResult,
+        CachePolicy,
+        Codec,
+        CounterSink,
+        Err,
+        Failures,
+        Ok,
+        Pipeline,
+        Result,
+        ResultArray,
+        ResultBatch,
+        ResultCacheInfo,
+        ResultEvent,
+        ResultSink,
+        ResultStream,
+        UnwrapFailedException,
+        async_result_block,
+        catch,
+        decode_result,
+        decode_results,
+        disable_instrumentation,
+        enable_instrumentation,
+        encode_result,
+        encode_results,
+        gather_results,
+        instrumentation_enabled,
+        memoize_result,
+        result_block,
+        collect_none,
+        collect_none_or_empty,
+        collect_none_or_whitespace,
+        collected,
+        try_none,
+        try_none_or_empty,
+        try_none_or_whitespace,
+        validate_all,
+    )
+else:
+    from shared_kernel._lazy import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            ".abstractions": (
+                "ConversionRegistry",
+                "IDefault",
+                "IFrom",
+                "IInto",
+                "ITryFrom",
+                "ITryInto",
+                "try_from_many",
+                "try_into_many",
+            ),
+            ".design_by_contract": (
+                "ArgumentException",
+                "ContractMode",
+                "Schema",
+                "configure_contracts",
+                "contract_mode",
+                "ensures",
+                "in_range",
+                "requires",
+            ),
+            ".error_struct": (
+                "Error",
+                "ErrorCatalog",
+            ),
+            ".functions": (
+                "Hasher",
+                "Partitioner",
+                "hash_combine",
+                "hash_combine_columns",
+                "stable_hash_combine",
+            ),
+            ".result_type": (
+                "BYTES_CODEC",
+                "ERROR_CODEC",
+                "INT_CODEC",
+                "PICKLE_CODEC",
+                "STR_CODEC",
+                "AsyncResult",
+                "CachePolicy",
+                "Codec",
+                "CounterSink",
+                "Err",
+                "Failures",
+                "Ok",
+                "Pipeline",
+                "Result",
+                "ResultArray",
+                "ResultBatch",
+                "ResultCacheInfo",
+                "ResultEvent",
+                "ResultSink",
+                "ResultStream",
+                "UnwrapFailedException",
+                "async_result_block",
+                "catch",
+                "decode_result",
+                "decode_results",
+                "disable_instrumentation",
+                "enable_instrumentation",
+                "encode_result",
+                "encode_results",
+                "gather_results",
+                "instrumentation_enabled",
+                "memoize_result",
+                "result_block",
+                "collect_none",
+                "collect_none_or_empty",
+                "collect_none_or_whitespace",
+                "collected",
+                "try_none",
+                "try_none_or_empty",
+                "try_none_or_whitespace",
+                "validate_all",
+            ),
+        },
+    )
 
 __all__ = [
+    "ConversionRegistry",
     "IDefault",
     "IFrom",
     "IInto",
     "ITryFrom",
     "ITryInto",
+    "try_from_many",
+    "try_into_many",
     "ArgumentException",
+    "ContractMode",
+    "Schema",
+    "configure_contracts",
+    "contract_mode",
+    "ensures",
+    "in_range",
+    "requires",
     "Error",
+    "ErrorCatalog",
+    "Hasher",
+    "Partitioner",
     "hash_combine",
+    "hash_combine_columns",
+    "stable_hash_combine",
+    "BYTES_CODEC",
+    "ERROR_CODEC",
+    "INT_CODEC",
+    "PICKLE_CODEC",
+    "STR_CODEC",
+    "AsyncResult",
+    "CachePolicy",
+    "Codec",
+    "CounterSink",
     "Err",
+    "Failures",
     "Ok",
+    "Pipeline",
     "Result",
+    "ResultArray",
+    "ResultBatch",
+    "ResultCacheInfo",
+    "ResultEvent",
+    "ResultSink",
+    "ResultStream",
     "UnwrapFailedException",
+    "async_result_block",
+    "catch",
+    "decode_result",
+    "decode_results",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "encode_result",
+    "encode_results",
+    "gather_results",
+    "instrumentation_enabled",
+    "memoize_result",
+    "result_block",
+    "collect_none",
+    "collect_none_or_empty",
+    "collect_none_or_whitespace",
+    "collected",
+    "try_none",
+    "try_none_or_empty",
+    "try_none_or_whitespace",
+    "validate_all",
 ]
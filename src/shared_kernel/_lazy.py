@@ -0,0 +1,39 @@
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a package's `__getattr__` and `__dir__` for lazily imported names.
+
+    Args:
+        package: The `__name__` of the package.
+        exports: Maps each relative submodule to the names it provides.
+
+    Returns:
+        The module-level `__getattr__` and `__dir__`. A name is imported from
+        its submodule on first access and then stored on the package, so later
+        lookups never reach `__getattr__` again.
+    """
+    namespace = vars(sys.modules[package])
+    origins = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # `__import__` rather than `importlib.import_module`, so the import
+        # shows up under `python -X importtime`.
+        submodule = module.lstrip(".")
+        level = len(module) - len(submodule)
+        value = getattr(__import__(submodule, namespace, None, (name,), level), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *origins})
+
+    return __getattr__, __dir__
@@ -1,7 +1,36 @@
-from .idefault import IDefault
-from .ifrom import IFrom
-from .iinto import IInto
-from .itry_from import ITryFrom
-from .itry_into import ITryInto
+from typing import TYPE_CHECKING
 
-__all__ = ["IFrom", "IInto", "ITryInto", "ITryFrom", "IDefault"]
+if TYPE_CHECKING:
+    from .bulk import try_from_many, try_into_many
+    from .idefault import IDefault
+    from .ifrom import IFrom
+    from .iinto import IInto
+    from .itry_from import ITryFrom
+    from .itry_into import ITryInto
+    from .registry import ConversionRegistry
+else:
+    from shared_kernel._lazy import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            ".bulk": ("try_from_many", "try_into_many"),
+            ".idefault": ("IDefault",),
+            ".ifrom": ("IFrom",),
+            ".iinto": ("IInto",),
+            ".itry_from": ("ITryFrom",),
+            ".itry_into": ("ITryInto",),
+            ".registry": ("ConversionRegistry",),
+        },
+    )
+
+__all__ = [
+    "IFrom",
+    "IInto",
+    "ITryInto",
+    "ITryFrom",
+    "IDefault",
+    "ConversionRegistry",
+    "try_from_many",
+    "try_into_many",
+]
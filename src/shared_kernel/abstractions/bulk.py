@@ -0,0 +1,206 @@
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from itertools import islice
+from operator import methodcaller
+from typing import Any, Literal, overload
+
+from shared_kernel.abstractions.itry_from import ITryFrom
+from shared_kernel.abstractions.itry_into import ITryInto
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import Err, Ok, Result
+
+DEFAULT_CHUNKSIZE = 1024
+DEFAULT_MAX_IN_FLIGHT = 8
+
+type _Chunk = tuple[list[Any], list[Any]]
+
+_try_into = methodcaller("try_into")
+
+
+@overload
+def try_from_many[T: ITryFrom[Any, Any]](
+    cls: type[T],
+    sources: Iterable[Any],
+    executor: Executor | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    partition: Literal[False] = False,
+) -> Result[list[T], Any]: ...
+
+
+@overload
+def try_from_many[T: ITryFrom[Any, Any]](
+    cls: type[T],
+    sources: Iterable[Any],
+    executor: Executor | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    *,
+    partition: Literal[True],
+) -> tuple[list[T], list[Any]]: ...
+
+
+def try_from_many(
+    cls: type[Any],
+    sources: Iterable[Any],
+    executor: Executor | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    partition: bool = False,
+) -> Any:
+    """
+    Call `cls.try_from` on every source, optionally in chunks on an executor.
+
+    Args:
+        cls: The `ITryFrom` type to convert to.
+        sources: The values to convert; consumed lazily.
+        executor: Runs chunks of `chunksize` sources, at most `max_in_flight`
+            at a time. None converts in the calling thread. With a
+            `ProcessPoolExecutor`, `cls` must be importable and the sources
+            and results picklable.
+        fail_fast: Stop submitting work after the first Err.
+        partition: Return the Ok values and Err errors as two lists instead
+            of one Result.
+
+    Returns:
+        Result[list[T], E]: Ok with the converted values in input order, or
+        the first Err in input order. With `partition`, a `(values, errors)`
+        pair, each in input order; with `fail_fast` as well, it ends at the
+        first Err.
+    """
+    ArgumentException.raise_if_none(cls, "cls")
+    return _convert_many(
+        cls.try_from,
+        sources,
+        executor,
+        chunksize,
+        max_in_flight,
+        fail_fast,
+        partition,
+    )
+
+
+@overload
+def try_into_many[T, E](
+    sources: Iterable[ITryInto[T, E]],
+    executor: Executor | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    partition: Literal[False] = False,
+) -> Result[list[T], E]: ...
+
+
+@overload
+def try_into_many[T, E](
+    sources: Iterable[ITryInto[T, E]],
+    executor: Executor | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    *,
+    partition: Literal[True],
+) -> tuple[list[T], list[E]]: ...
+
+
+def try_into_many(
+    sources: Iterable[Any],
+    executor: Executor | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    fail_fast: bool = False,
+    partition: bool = False,
+) -> Any:
+    """Call `try_into` on every source; see `try_from_many` for the arguments."""
+    return _convert_many(
+        _try_into,
+        sources,
+        executor,
+        chunksize,
+        max_in_flight,
+        fail_fast,
+        partition,
+    )
+
+
+def _convert_many(
+    convert: Callable[[Any], Result[Any, Any]],
+    sources: Iterable[Any],
+    executor: Executor | None,
+    chunksize: int,
+    max_in_flight: int,
+    fail_fast: bool,
+    partition: bool,
+) -> Any:
+    ArgumentException.raise_if_none(sources, "sources")
+    ArgumentException.raise_if_out_of_range(chunksize, 1, param="chunksize")
+    ArgumentException.raise_if_out_of_range(max_in_flight, 1, param="max_in_flight")
+    if executor is None:
+        values, errors = _convert_chunk(convert, sources, fail_fast)
+    else:
+        values, errors = [], []
+        chunks = _run_chunks(
+            convert, iter(sources), executor, chunksize, max_in_flight, fail_fast
+        )
+        try:
+            for chunk_values, chunk_errors in chunks:
+                values += chunk_values
+                errors += chunk_errors
+                if chunk_errors and fail_fast:
+                    break
+        finally:
+            chunks.close()
+    if partition:
+        return values, errors
+    return Err(errors[0]) if errors else Ok(values)
+
+
+def _run_chunks(
+    convert: Callable[[Any], Result[Any, Any]],
+    sources: Iterator[Any],
+    executor: Executor,
+    chunksize: int,
+    max_in_flight: int,
+    fail_fast: bool,
+) -> Generator[_Chunk, None, None]:
+    pending: deque[Future[_Chunk]] = deque()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                chunk = list(islice(sources, chunksize))
+                if not chunk:
+                    break
+                pending.append(
+                    executor.submit(_convert_chunk, convert, chunk, fail_fast)
+                )
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _convert_chunk(
+    convert: Callable[[Any], Result[Any, Any]],
+    sources: Iterable[Any],
+    fail_fast: bool,
+) -> _Chunk:
+    # Workers send back plain value and error lists, which pickle far smaller
+    # than one Result per item.
+    values: list[Any] = []
+    errors: list[Any] = []
+    add_value, add_error = values.append, errors.append
+    for source in sources:
+        result = convert(source)
+        if result._is_ok:
+            add_value(result._value)
+        else:
+            add_error(result._error)
+            if fail_fast:
+                break
+    return values, errors
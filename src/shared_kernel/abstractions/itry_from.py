@@ -1,8 +1,9 @@
-from typing import Protocol, Self
+from typing import TYPE_CHECKING, Protocol, Self
 
-from shared_kernel.result_type import Result
+if TYPE_CHECKING:
+    from shared_kernel.result_type import Result
 
 
 class ITryFrom[T: object, E](Protocol):
     @classmethod
-    def try_from(cls, source: T) -> Result[Self, E]: ...
+    def try_from(cls, source: T) -> "Result[Self, E]": ...
@@ -1,7 +1,8 @@
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from shared_kernel.result_type import Result
+if TYPE_CHECKING:
+    from shared_kernel.result_type import Result
 
 
 class ITryInto[T: object, E](Protocol):
-    def try_into(self) -> Result[T, E]: ...
+    def try_into(self) -> "Result[T, E]": ...
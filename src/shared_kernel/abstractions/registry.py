@@ -0,0 +1,138 @@
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import Ok, Result
+
+NO_CONVERSION_PATH_MESSAGE = "No conversion path found"
+
+type _Step = tuple[Callable[[Any], Any], bool]
+type _Converter = Callable[[Any], Result[Any, Any]]
+
+
+class ConversionRegistry:
+    """
+    Finds and runs conversions between types registered as graph edges.
+
+    Each edge is a converter from one type to another, either infallible
+    (`from_`/`into`) or returning a `Result` (`try_from`/`try_into`). `convert`
+    follows the shortest path of edges, found by breadth-first search from the
+    value's type and then its base classes. The composed path is cached per
+    (source type, target type), so a repeated conversion costs a dict lookup
+    plus the converter calls. Registering an edge clears the cache.
+    """
+
+    __slots__ = ("_edges", "_paths")
+
+    def __init__(self) -> None:
+        self._edges: dict[type, dict[type, _Step]] = {}
+        self._paths: dict[tuple[type, type], tuple[tuple[type, ...], _Converter]] = {}
+
+    def register(
+        self,
+        source: type,
+        target: type,
+        converter: Callable[[Any], Any],
+        fallible: bool = False,
+    ) -> None:
+        """
+        Add or replace the edge from `source` to `target`.
+
+        Args:
+            converter: Called with a `source` value; returns a `target` value,
+                or a `Result` of one if `fallible`.
+        """
+        ArgumentException.raise_if_none(converter, "converter")
+        self._edges.setdefault(source, {})[target] = (converter, fallible)
+        self._paths.clear()
+
+    def register_from(self, target: type, source: type) -> None:
+        self.register(source, target, target.from_)  # type: ignore[attr-defined]
+
+    def register_try_from(self, target: type, source: type) -> None:
+        self.register(source, target, target.try_from, fallible=True)  # type: ignore[attr-defined]
+
+    def register_into(self, source: type, target: type) -> None:
+        self.register(source, target, source.into)  # type: ignore[attr-defined]
+
+    def register_try_into(self, source: type, target: type) -> None:
+        self.register(source, target, source.try_into, fallible=True)  # type: ignore[attr-defined]
+
+    def convert[T](self, value: object, target: type[T]) -> Result[T, Any]:
+        """
+        Convert `value` to `target` along the shortest registered path.
+
+        Returns:
+            Result[T, Any]: Ok with the converted value, or the first Err of a
+            fallible step.
+
+        Raises:
+            ArgumentException: If no path leads from the value's type to `target`.
+        """
+        key = (type(value), target)
+        entry = self._paths.get(key)
+        if entry is None:
+            entry = self._paths[key] = self._resolve(*key)
+        return entry[1](value)
+
+    def path(self, source: type, target: type) -> tuple[type, ...]:
+        """Return the types visited when converting from `source` to `target`."""
+        key = (source, target)
+        entry = self._paths.get(key)
+        if entry is None:
+            entry = self._paths[key] = self._resolve(source, target)
+        return entry[0]
+
+    def _resolve(
+        self, source: type, target: type
+    ) -> tuple[tuple[type, ...], _Converter]:
+        if issubclass(source, target):
+            return (source,), Ok
+        for start in source.__mro__:
+            hops = self._search(start, target)
+            if hops is not None:
+                steps = [self._edges[a][b] for a, b in zip(hops, hops[1:])]
+                return (source, *hops[1:]), _compose(steps)
+        raise ArgumentException(
+            NO_CONVERSION_PATH_MESSAGE,
+            f"{source.__qualname__} -> {target.__qualname__}",
+        )
+
+    def _search(self, start: type, target: type) -> tuple[type, ...] | None:
+        parents: dict[type, type | None] = {start: None}
+        queue = deque((start,))
+        while queue:
+            node = queue.popleft()
+            for neighbour in self._edges.get(node, ()):
+                if neighbour in parents:
+                    continue
+                parents[neighbour] = node
+                if neighbour is target:
+                    hops = [neighbour]
+                    while (parent := parents[hops[-1]]) is not None:
+                        hops.append(parent)
+                    return tuple(reversed(hops))
+                queue.append(neighbour)
+        return None
+
+
+def _compose(steps: list[_Step]) -> _Converter:
+    match steps:
+        case [(converter, True)]:
+            return converter
+        case [(converter, False)]:
+            return lambda value: Ok(converter(value))
+
+    def run(value: Any) -> Result[Any, Any]:
+        for converter, fallible in steps:
+            if fallible:
+                result = converter(value)
+                if not result._is_ok:
+                    return result  # type: ignore[no-any-return]
+                value = result._value
+            else:
+                value = converter(value)
+        return Ok(value)
+
+    return run
@@ -1,3 +1,40 @@
-from .arguments import ArgumentException
+from typing import TYPE_CHECKING
 
-__all__ = ["ArgumentException"]
+if TYPE_CHECKING:
+    from .arguments import ArgumentException
+    from .contracts import (
+        ContractMode,
+        configure_contracts,
+        contract_mode,
+        ensures,
+        requires,
+    )
+    from .schema import Schema, in_range
+else:
+    from shared_kernel._lazy import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            ".arguments": ("ArgumentException",),
+            ".contracts": (
+                "ContractMode",
+                "configure_contracts",
+                "contract_mode",
+                "ensures",
+                "requires",
+            ),
+            ".schema": ("Schema", "in_range"),
+        },
+    )
+
+__all__ = [
+    "ArgumentException",
+    "ContractMode",
+    "configure_contracts",
+    "contract_mode",
+    "ensures",
+    "requires",
+    "Schema",
+    "in_range",
+]
@@ -1,4 +1,5 @@
 from collections.abc import Sized
+from typing import Any
 
 
 class ArgumentException(Exception):
@@ -49,3 +50,19 @@ class ArgumentException(Exception):
                 cls.raise_if_none(arg, param)
             case str() as string if string.isspace():
                 raise cls(cls.WHITESPACE_ARGUMENT_MESSAGE, param)
+
+    @classmethod
+    def raise_if_out_of_range(
+        cls,
+        arg: Any,
+        minimum: Any = None,
+        maximum: Any = None,
+        param: str | None = None,
+    ) -> None:
+        match arg:
+            case None:
+                cls.raise_if_none(arg, param)
+            case _ if (minimum is not None and arg < minimum) or (
+                maximum is not None and arg > maximum
+            ):
+                raise cls(cls.DEFAULT_MESSAGE, param)
@@ -0,0 +1,216 @@
+import os
+from collections.abc import Callable, Sequence
+from enum import StrEnum
+from functools import wraps
+from inspect import Parameter, iscoroutinefunction, signature
+from itertools import count
+from typing import Any
+
+from shared_kernel.design_by_contract.arguments import ArgumentException
+
+type Guard = Callable[[Any, str | None], None]
+
+CONTRACTS_ENV_VAR = "SHARED_KERNEL_CONTRACTS"
+DEFAULT_SAMPLE_RATE = 100
+RETURN_PARAM = "return"
+UNKNOWN_PARAMETER_MESSAGE = "Contract refers to an unknown parameter."
+INVALID_MODE_MESSAGE = "Contract mode must be 'off', 'on' or 'sampled[:N]'."
+_SAMPLED_SEPARATOR = ":"
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+_VARIADIC = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+
+class ContractMode(StrEnum):
+    OFF = "off"
+    ON = "on"
+    SAMPLED = "sampled"
+
+
+def configure_contracts(mode: ContractMode | str, sample_rate: int = 0) -> None:
+    """
+    Set how functions decorated from now on check their contracts.
+
+    Functions that were already decorated keep the mode they were built with,
+    because the wrapper is specialised once, at decoration time.
+
+    Args:
+        mode: `off` returns functions undecorated, `on` checks every call and
+            `sampled` checks one call in `sample_rate`.
+        sample_rate: Check frequency for `sampled`; defaults to 100.
+    """
+    global _mode, _sample_rate
+    _mode, _sample_rate = _parse_mode(f"{mode}", sample_rate, "mode")
+
+
+def contract_mode() -> tuple[ContractMode, int]:
+    return _mode, _sample_rate
+
+
+def requires[F: Callable[..., Any]](
+    **guards: Guard | Sequence[Guard],
+) -> Callable[[F], F]:
+    """
+    Check arguments with `ArgumentException`-style guards before every call.
+
+    Each keyword names a parameter of the decorated function and maps it to one
+    guard, or a sequence of guards, called as `guard(value, parameter_name)`,
+    e.g. `ArgumentException.raise_if_none_or_whitespace`. Coroutine functions
+    stay coroutine functions and are checked when awaited.
+    """
+
+    def decorate(function: F) -> F:
+        if _mode is ContractMode.OFF:
+            return function
+        ArgumentException.raise_if_none_or_empty(guards, "guards")
+        check = _build_check(_resolve_parameters(function, guards))
+
+        if iscoroutinefunction(function):
+            calls, rate = count(), _sample_rate if _mode is ContractMode.SAMPLED else 1
+
+            @wraps(function)
+            async def checked_async(*args: Any, **kwargs: Any) -> Any:
+                if not next(calls) % rate:
+                    check(args, kwargs)
+                return await function(*args, **kwargs)
+
+            return checked_async  # type: ignore[return-value]
+
+        if _mode is ContractMode.ON:
+
+            @wraps(function)
+            def checked(*args: Any, **kwargs: Any) -> Any:
+                check(args, kwargs)
+                return function(*args, **kwargs)
+
+            return checked  # type: ignore[return-value]
+
+        calls, rate = count(), _sample_rate
+
+        @wraps(function)
+        def sampled(*args: Any, **kwargs: Any) -> Any:
+            if not next(calls) % rate:
+                check(args, kwargs)
+            return function(*args, **kwargs)
+
+        return sampled  # type: ignore[return-value]
+
+    return decorate
+
+
+def ensures[F: Callable[..., Any]](*guards: Guard) -> Callable[[F], F]:
+    """
+    Check the return value with `ArgumentException`-style guards after every call.
+
+    Guards are called as `guard(result, "return")`. Coroutine functions are
+    checked on the awaited result.
+    """
+
+    def decorate(function: F) -> F:
+        if _mode is ContractMode.OFF:
+            return function
+        ArgumentException.raise_if_none_or_empty(guards, "guards")
+        calls, rate = count(), _sample_rate if _mode is ContractMode.SAMPLED else 1
+
+        if iscoroutinefunction(function):
+
+            @wraps(function)
+            async def checked_async(*args: Any, **kwargs: Any) -> Any:
+                result = await function(*args, **kwargs)
+                if not next(calls) % rate:
+                    for guard in guards:
+                        guard(result, RETURN_PARAM)
+                return result
+
+            return checked_async  # type: ignore[return-value]
+
+        if _mode is ContractMode.ON:
+
+            @wraps(function)
+            def checked(*args: Any, **kwargs: Any) -> Any:
+                result = function(*args, **kwargs)
+                for guard in guards:
+                    guard(result, RETURN_PARAM)
+                return result
+
+            return checked  # type: ignore[return-value]
+
+        @wraps(function)
+        def sampled(*args: Any, **kwargs: Any) -> Any:
+            result = function(*args, **kwargs)
+            if not next(calls) % rate:
+                for guard in guards:
+                    guard(result, RETURN_PARAM)
+            return result
+
+        return sampled  # type: ignore[return-value]
+
+    return decorate
+
+
+def _build_check(
+    checks: tuple[tuple[int, str, Any, tuple[Guard, ...]], ...],
+) -> Callable[[tuple[Any, ...], dict[str, Any]], None]:
+    match checks:
+        case ((index, name, default, (guard,)),):
+
+            def check_one(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+                guard(
+                    args[index] if index < len(args) else kwargs.get(name, default),
+                    name,
+                )
+
+            return check_one
+        case _:
+
+            def check_all(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+                for index, name, default, parameter_guards in checks:
+                    value = (
+                        args[index] if index < len(args) else kwargs.get(name, default)
+                    )
+                    for guard in parameter_guards:
+                        guard(value, name)
+
+            return check_all
+
+
+def _resolve_parameters(
+    function: Callable[..., Any], guards: dict[str, Guard | Sequence[Guard]]
+) -> tuple[tuple[int, str, Any, tuple[Guard, ...]], ...]:
+    parameters = signature(function).parameters
+    positions = {
+        name: index
+        for index, (name, parameter) in enumerate(parameters.items())
+        if parameter.kind in _POSITIONAL
+    }
+    checks = []
+    for name, guard in guards.items():
+        parameter = parameters.get(name)
+        if parameter is None or parameter.kind in _VARIADIC:
+            raise ArgumentException(UNKNOWN_PARAMETER_MESSAGE, name)
+        default = None if parameter.default is Parameter.empty else parameter.default
+        parameter_guards = tuple(guard) if isinstance(guard, Sequence) else (guard,)
+        # Keyword-only parameters can never be found in *args.
+        index = positions.get(name, len(parameters))
+        checks.append((index, name, default, parameter_guards))
+    return tuple(checks)
+
+
+def _parse_mode(value: str, sample_rate: int, param: str) -> tuple[ContractMode, int]:
+    name, _, rate = value.strip().lower().partition(_SAMPLED_SEPARATOR)
+    try:
+        mode = ContractMode(name)
+        sample_rate = int(rate) if rate else sample_rate or DEFAULT_SAMPLE_RATE
+    except ValueError as error:
+        raise ArgumentException(INVALID_MODE_MESSAGE, param, error)
+    if sample_rate < 1 or (rate and mode is not ContractMode.SAMPLED):
+        raise ArgumentException(INVALID_MODE_MESSAGE, param)
+    return mode, sample_rate
+
+
+_mode, _sample_rate = (
+    _parse_mode(
+        os.environ.get(CONTRACTS_ENV_VAR, ContractMode.ON), 0, CONTRACTS_ENV_VAR
+    )
+    if __debug__
+    else (ContractMode.OFF, DEFAULT_SAMPLE_RATE)
+)
@@ -0,0 +1,166 @@
+from collections.abc import Callable, Iterable, Mapping, Sequence, Sized
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from shared_kernel.design_by_contract.arguments import ArgumentException
+from shared_kernel.design_by_contract.contracts import Guard
+
+if TYPE_CHECKING:
+    from shared_kernel.result_type import Failures, Result
+
+type Record = Mapping[str, Any]
+
+UNSUPPORTED_GUARD_MESSAGE = "Schema guards must be callable."
+
+
+@dataclass(frozen=True, slots=True)
+class _Range:
+    minimum: Any
+    maximum: Any
+
+    def __call__(self, arg: Any, param: str | None = None) -> None:
+        ArgumentException.raise_if_out_of_range(arg, self.minimum, self.maximum, param)
+
+
+def in_range(minimum: Any = None, maximum: Any = None) -> Guard:
+    """Guard for `ArgumentException.raise_if_out_of_range` with inclusive bounds."""
+    return _Range(minimum, maximum)
+
+
+class Schema:
+    """
+    Validates dict-shaped records against `ArgumentException`-style guards.
+
+    The guards of every field are compiled once into a single function, so the
+    built-in guards run inline without any call or raise. Other guards are
+    called as `guard(value, field)` and their `ArgumentException` is collected.
+    Each field reports at most one failure: the first guard that rejects it.
+    A missing key is validated as None.
+    """
+
+    _NONE: ClassVar[str] = "        failures.append(Exc(NONE, {key}))"
+    _FAIL: ClassVar[str] = "        failures.append(Exc({message}, {key}))"
+
+    __slots__ = ("_fields", "_validate", "_validate_many")
+
+    def __init__(self, fields: Mapping[str, Guard | Sequence[Guard]]) -> None:
+        ArgumentException.raise_if_none_or_empty(fields, "fields")
+        self._fields = {
+            name: tuple(guard) if isinstance(guard, Sequence) else (guard,)
+            for name, guard in fields.items()
+        }
+        for name, guards in self._fields.items():
+            if not all(callable(guard) for guard in guards):
+                raise ArgumentException(UNSUPPORTED_GUARD_MESSAGE, name)
+        self._validate, self._validate_many = self._generate()
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(self._fields)
+
+    def validate[R: Record](self, record: R) -> "Result[R, Failures]":
+        return self._validate(record)
+
+    def validate_many[R: Record](
+        self, records: Iterable[R]
+    ) -> "list[Result[R, Failures]]":
+        return self._validate_many(records)
+
+    def _generate(
+        self,
+    ) -> tuple[
+        "Callable[[Any], Result[Any, Failures]]",
+        "Callable[[Iterable[Any]], list[Result[Any, Failures]]]",
+    ]:
+        # `result_type` depends on this package, so it is only imported once a
+        # schema is built rather than when this module loads.
+        from shared_kernel.result_type import Err, Ok
+
+        namespace: dict[str, object] = {
+            "Ok": Ok,
+            "Err": Err,
+            "Exc": ArgumentException,
+            "Sized": Sized,
+            "run": _run,
+            "NONE": ArgumentException.NONE_ARGUMENT_MESSAGE,
+            "EMPTY": ArgumentException.EMPTY_ARGUMENT_MESSAGE,
+            "WHITESPACE": ArgumentException.WHITESPACE_ARGUMENT_MESSAGE,
+            "RANGE": ArgumentException.DEFAULT_MESSAGE,
+        }
+        body: list[str] = []
+        for index, (name, guards) in enumerate(self._fields.items()):
+            key = f"k{index}"
+            namespace[key] = name
+            body.append(f"    v = get({key})")
+            for number, guard in enumerate(guards):
+                body += self._compile_guard(
+                    guard, f"{index}_{number}", key, namespace, first=number == 0
+                )
+        record_body = [
+            "    get = record.get",
+            "    failures = []",
+            *body,
+            "    return Err(failures) if failures else Ok(record)",
+        ]
+        batch_body = [
+            "    results = []",
+            "    append = results.append",
+            "    for record in records:",
+            *(f"    {line}" for line in record_body[:-1]),
+            "        append(Err(failures) if failures else Ok(record))",
+            "    return results",
+        ]
+        source = "\n".join(
+            ["def validate(record):", *record_body, "def validate_many(records):"]
+            + batch_body
+        )
+        exec(source, namespace)
+        return namespace["validate"], namespace["validate_many"]  # type: ignore[return-value]
+
+    def _compile_guard(
+        self,
+        guard: Guard,
+        suffix: str,
+        key: str,
+        namespace: dict[str, object],
+        first: bool,
+    ) -> list[str]:
+        keyword = "if" if first else "elif"
+        none = [f"    {keyword} v is None:", self._NONE.format(key=key)]
+        match guard:
+            case ArgumentException.raise_if_none:
+                return none
+            case ArgumentException.raise_if_none_or_empty:
+                condition = "isinstance(v, Sized) and len(v) == 0"
+                message = "EMPTY"
+            case ArgumentException.raise_if_none_or_whitespace:
+                condition = "isinstance(v, str) and v.isspace()"
+                message = "WHITESPACE"
+            case _Range(minimum, maximum):
+                namespace[f"lo{suffix}"], namespace[f"hi{suffix}"] = minimum, maximum
+                bounds = [
+                    *([f"v < lo{suffix}"] if minimum is not None else []),
+                    *([f"v > hi{suffix}"] if maximum is not None else []),
+                ]
+                if not bounds:
+                    return none
+                condition, message = " or ".join(bounds), "RANGE"
+            case _:
+                namespace[f"g{suffix}"] = guard
+                return [
+                    f"    {keyword} run(g{suffix}, v, {key}, failures):",
+                    "        pass",
+                ]
+        return none + [
+            f"    elif {condition}:",
+            self._FAIL.format(message=message, key=key),
+        ]
+
+
+def _run(guard: Guard, value: Any, param: str, failures: "Failures") -> bool:
+    try:
+        guard(value, param)
+    except ArgumentException as error:
+        failures.append(error)
+        return True
+    return False
@@ -0,0 +1,108 @@
+from collections.abc import Iterable, Iterator
+from http import HTTPStatus
+from typing import ClassVar, Self
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.error_struct.error import Error
+from shared_kernel.error_struct.wire import (
+    read_error,
+    read_varint,
+    write_error,
+    write_varint,
+)
+
+
+class ErrorCatalog:
+    """
+    Registry of known errors with small integer IDs and a compact wire encoding.
+
+    Each registered code gets the next free ID, starting at 1, and one canonical
+    `Error` instance. `encode` writes every known error as its ID in LEB128
+    varint form, so the first 127 codes take a single byte. Unknown errors follow
+    the reserved ID 0 as their length-prefixed UTF-8 code and description, the
+    same fields `Error.to_bytes` writes.
+    """
+
+    _UNKNOWN_ID: ClassVar[int] = 0
+    _UNKNOWN_ERROR_ID: ClassVar[str] = "Unknown error id"
+
+    __slots__ = ("_errors", "_ids")
+
+    def __init__(self, errors: Iterable[Error] = ()) -> None:
+        self._errors: list[Error] = []
+        self._ids: dict[str, int] = {}
+        for error in errors:
+            self.register(error)
+
+    @classmethod
+    def from_http_status(cls) -> Self:
+        return cls(Error.from_(status) for status in HTTPStatus)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, error: object) -> bool:
+        code = error.code if isinstance(error, Error) else error
+        return code in self._ids
+
+    def __iter__(self) -> Iterator[Error]:
+        return iter(self._errors)
+
+    def register(self, error: Error) -> int:
+        ArgumentException.raise_if_none(error, "error")
+        error_id = self._ids.get(error.code)
+        if error_id is None:
+            self._errors.append(error)
+            error_id = self._ids[error.code] = len(self._errors)
+        return error_id
+
+    def id_of(self, error: Error | str) -> int | None:
+        return self._ids.get(error.code if isinstance(error, Error) else error)
+
+    def get(self, error_id: int) -> Error:
+        if 0 < error_id <= len(self._errors):
+            return self._errors[error_id - 1]
+        raise ArgumentException(self._UNKNOWN_ERROR_ID, str(error_id))
+
+    def lookup(self, code: str) -> Error | None:
+        error_id = self._ids.get(code)
+        return None if error_id is None else self._errors[error_id - 1]
+
+    def canonical(self, error: Error) -> Error:
+        error_id = self._ids.get(error.code)
+        return error if error_id is None else self._errors[error_id - 1]
+
+    def encode(self, errors: Iterable[Error]) -> bytes:
+        ids = self._ids
+        out = bytearray()
+        for error in errors:
+            error_id = ids.get(error.code, self._UNKNOWN_ID)
+            if error_id == self._UNKNOWN_ID:
+                out.append(self._UNKNOWN_ID)
+                write_error(out, error)
+            elif error_id < 0x80:
+                out.append(error_id)
+            else:
+                write_varint(out, error_id)
+        return bytes(out)
+
+    def decode(self, data: bytes | bytearray | memoryview) -> list[Error]:
+        view = memoryview(data)
+        errors = self._errors
+        end = len(view)
+        decoded: list[Error] = []
+        append = decoded.append
+        position = 0
+        while position < end:
+            error_id = view[position]
+            position += 1
+            if error_id >= 0x80:
+                error_id, position = read_varint(view, position - 1)
+            if error_id == self._UNKNOWN_ID:
+                error, position = read_error(Error, view, position)
+                append(error)
+            elif error_id <= len(errors):
+                append(errors[error_id - 1])
+            else:
+                raise ArgumentException(self._UNKNOWN_ERROR_ID, str(error_id))
+        return decoded
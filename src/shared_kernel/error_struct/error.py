@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, ClassVar, Self, overload
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.error_struct.wire import (
+    TRAILING_DATA_MESSAGE,
+    read_error,
+    write_error,
+)
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo, _lru_cache_wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class Error:
+    _SEPARATOR: ClassVar[str] = ":"
+    _DEFAULT_CODE: ClassVar[str] = "E000"
+    _EMPTY_STRING: ClassVar[str] = ""
+    _INVALID_SOURCE_TYPE: ClassVar[str] = "Invalid source type"
+    _STR_FORMAT: ClassVar[str] = "{}{}{}"
+    _REPR_FORMAT: ClassVar[str] = "Error(code: {}, description:{})"
+
+    code: str
+    description: str = _EMPTY_STRING
+
+    def __str__(self) -> str:
+        return self._STR_FORMAT.format(self.code, self._SEPARATOR, self.description)
+
+    def __repr__(self) -> str:
+        return self._REPR_FORMAT.format(self.code, self.description)
+
+    def __eq__(self, other: object) -> bool:
+        return False if not isinstance(other, Error) else self.code == other.code
+
+    def __hash__(self) -> int:
+        # Equality only looks at the code, so the hash must as well. A str caches
+        # its own hash, so this is computed once per code and needs no extra slot.
+        return hash(self.code)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle HTTP status errors by their status, and everything else by value
+        # instead of by slot names.
+        if type(self) is Error:
+            status = _HTTP_STATUS_CODES.get(self.code)
+            if status is not None and self.description == status.phrase:
+                return _http_status_error, (status.value,)
+        if self.description:
+            return type(self), (self.code, self.description)
+        return type(self), (self.code,)
+
+    @classmethod
+    def default(cls) -> Self:
+        return cls(cls._DEFAULT_CODE, cls._EMPTY_STRING)
+
+    @classmethod
+    @overload
+    def from_(cls, source: str) -> Self: ...
+
+    @classmethod
+    @overload
+    def from_(cls, source: HTTPStatus) -> Self: ...
+
+    @classmethod
+    def from_(cls, source) -> Self:
+        match source:
+            case str():
+                return _parse_cache(cls, source)  # type: ignore[arg-type]
+            case HTTPStatus():
+                table = _HTTP_STATUS_ERRORS.get(cls)
+                if table is None:
+                    table = _HTTP_STATUS_ERRORS[cls] = _http_status_table(cls)
+                return table[source]
+            case _:
+                raise ArgumentException(cls._INVALID_SOURCE_TYPE, str(source))
+
+    def to_bytes(self) -> bytes:
+        out = bytearray()
+        write_error(out, self)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Self:
+        view = memoryview(data)
+        error, end = read_error(cls, view, 0)
+        if end != len(view):
+            raise ArgumentException(TRAILING_DATA_MESSAGE, "data")
+        return error
+
+    @staticmethod
+    def cache_info() -> "_CacheInfo":
+        return _parse_cache.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        _parse_cache.cache_clear()
+
+    @staticmethod
+    def set_cache_size(maxsize: int | None) -> None:
+        global _parse_cache
+        _parse_cache = lru_cache(maxsize=maxsize)(_parse)
+
+
+DEFAULT_PARSE_CACHE_SIZE = 1024
+
+
+def _parse(cls: type[Error], source: str) -> Error:
+    left, *right = source.split(cls._SEPARATOR)
+    return cls(left, next(iter(right), cls._EMPTY_STRING))
+
+
+def _http_status_table(cls: type[Error]) -> dict[HTTPStatus, Any]:
+    return {status: cls(str(status.value), status.phrase) for status in HTTPStatus}
+
+
+_parse_cache: "_lru_cache_wrapper[Any]" = lru_cache(DEFAULT_PARSE_CACHE_SIZE)(_parse)
+_HTTP_STATUS_ERRORS: dict[type[Error], dict[HTTPStatus, Any]] = {
+    Error: _http_status_table(Error)
+}
+_HTTP_STATUS_CODES = {str(status.value): status for status in HTTPStatus}
+
+
+def _http_status_error(status: int) -> Error:
+    return _HTTP_STATUS_ERRORS[Error][HTTPStatus(status)]
@@ -0,0 +1,56 @@
+from typing import Any
+
+from shared_kernel.design_by_contract import ArgumentException
+
+ENCODING = "utf-8"
+TRUNCATED_DATA_MESSAGE = "Truncated error encoding"
+TRAILING_DATA_MESSAGE = "Unexpected data after the encoded value"
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Append a non-negative int in LEB128 form: 7 bits per byte, low bits first."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(
+    view: memoryview, position: int, message: str = TRUNCATED_DATA_MESSAGE
+) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        if position >= len(view):
+            raise ArgumentException(message, "data")
+        byte = view[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def write_text(out: bytearray, text: str) -> None:
+    payload = text.encode(ENCODING)
+    write_varint(out, len(payload))
+    out += payload
+
+
+def read_text(view: memoryview, position: int) -> tuple[str, int]:
+    length, position = read_varint(view, position)
+    end = position + length
+    if end > len(view):
+        raise ArgumentException(TRUNCATED_DATA_MESSAGE, "data")
+    return str(view[position:end], ENCODING), end
+
+
+def write_error(out: bytearray, error: Any) -> None:
+    """Append an error as its length-prefixed UTF-8 code and description."""
+    write_text(out, error.code)
+    write_text(out, error.description)
+
+
+def read_error[E](cls: type[E], view: memoryview, position: int) -> tuple[E, int]:
+    code, position = read_text(view, position)
+    description, position = read_text(view, position)
+    return cls(code, description), position  # type: ignore[call-arg]
@@ -1,3 +1,27 @@
-from .hash_functions import hash_combine
+from typing import TYPE_CHECKING
 
-__all__ = ["hash_combine"]
+if TYPE_CHECKING:
+    from .hash_columns import hash_combine_columns
+    from .hash_functions import Hasher, hash_combine
+    from .partitioner import Partitioner
+    from .stable_hash import stable_hash_combine
+else:
+    from shared_kernel._lazy import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            ".hash_columns": ("hash_combine_columns",),
+            ".hash_functions": ("Hasher", "hash_combine"),
+            ".partitioner": ("Partitioner",),
+            ".stable_hash": ("stable_hash_combine",),
+        },
+    )
+
+__all__ = [
+    "Hasher",
+    "Partitioner",
+    "hash_combine",
+    "hash_combine_columns",
+    "stable_hash_combine",
+]
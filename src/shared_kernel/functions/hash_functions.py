@@ -1,4 +1,4 @@
-from functools import reduce
+from typing import Self
 
 from shared_kernel.design_by_contract import ArgumentException
 
@@ -6,11 +6,15 @@ GOLDEN_RATIO = 0x9E3779B9
 LEFT_SHIFT = 6
 RIGHT_SHIFT = 2
 ACC = 0
+MASK = 0xFFFFFFFFFFFFFFFF
 
 
 def hash_combine(*args: object) -> int:
     """
-    Combine multiple hash values into one using a Boost-like approach with reduce().
+    Combine multiple hash values into one using a Boost-like approach.
+
+    The accumulator is kept at 64 bits, and the common one to three argument
+    cases are unrolled.
 
     Args:
         *args: Any number of hashable objects to combine.
@@ -18,11 +22,66 @@ def hash_combine(*args: object) -> int:
     Returns:
         int: The combined hash value.
     """
-    ArgumentException.raise_if_none_or_empty(args, "args")
-
-    return reduce(
-        lambda acc, arg: acc
-        ^ (hash(arg) + GOLDEN_RATIO + (acc << LEFT_SHIFT) + (acc >> RIGHT_SHIFT)),
-        args,
-        ACC,
-    )
+    match len(args):
+        case 1:
+            return (hash(args[0]) + GOLDEN_RATIO) & MASK
+        case 2:
+            a, b = args
+            acc = (hash(a) + GOLDEN_RATIO) & MASK
+            return (
+                acc
+                ^ (hash(b) + GOLDEN_RATIO + (acc << LEFT_SHIFT) + (acc >> RIGHT_SHIFT))
+            ) & MASK
+        case 3:
+            a, b, c = args
+            acc = (hash(a) + GOLDEN_RATIO) & MASK
+            acc = (
+                acc
+                ^ (hash(b) + GOLDEN_RATIO + (acc << LEFT_SHIFT) + (acc >> RIGHT_SHIFT))
+            ) & MASK
+            return (
+                acc
+                ^ (hash(c) + GOLDEN_RATIO + (acc << LEFT_SHIFT) + (acc >> RIGHT_SHIFT))
+            ) & MASK
+        case 0:
+            ArgumentException.raise_if_none_or_empty(args, "args")
+
+    acc = ACC
+    for arg in args:
+        acc = (
+            acc
+            ^ (hash(arg) + GOLDEN_RATIO + (acc << LEFT_SHIFT) + (acc >> RIGHT_SHIFT))
+        ) & MASK
+    return acc
+
+
+class Hasher:
+    """
+    Incremental form of `hash_combine`.
+
+    `Hasher().update(a, b).update(c).digest()` equals `hash_combine(a, b, c)`, so
+    large composite keys can be hashed piece by piece without building a tuple.
+    """
+
+    __slots__ = ("_acc",)
+
+    def __init__(self) -> None:
+        self._acc = ACC
+
+    def update(self, *args: object) -> Self:
+        acc = self._acc
+        for arg in args:
+            acc = (
+                acc
+                ^ (
+                    hash(arg)
+                    + GOLDEN_RATIO
+                    + (acc << LEFT_SHIFT)
+                    + (acc >> RIGHT_SHIFT)
+                )
+            ) & MASK
+        self._acc = acc
+        return self
+
+    def digest(self) -> int:
+        return self._acc
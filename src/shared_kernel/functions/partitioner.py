@@ -0,0 +1,69 @@
+from bisect import bisect_right, insort
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.functions.stable_hash import stable_hash_combine
+
+VIRTUAL_NODE_KEY = "shared_kernel.partitioner"
+
+
+class Partitioner:
+    """
+    Consistent-hashing ring that maps keys to shards with `stable_hash_combine`.
+
+    Every shard owns `vnodes` points on a 64-bit ring. A key belongs to the shard
+    owning the first point after the key's hash. Adding or removing a shard only
+    moves the keys that land next to that shard's points, about 1/n of all keys.
+    """
+
+    __slots__ = ("_vnodes", "_ring", "_points", "_owners", "_shards")
+
+    def __init__(self, n_shards: int, vnodes: int = 128) -> None:
+        if n_shards < 1:
+            raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, "n_shards")
+        if vnodes < 1:
+            raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, "vnodes")
+        self._vnodes = vnodes
+        self._ring: list[tuple[int, int]] = []
+        self._points: list[int] = []
+        self._owners: list[int] = []
+        self._shards: set[int] = set()
+        for shard in range(n_shards):
+            self._place(shard)
+        self._rebuild()
+
+    @property
+    def n_shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def shards(self) -> tuple[int, ...]:
+        return tuple(sorted(self._shards))
+
+    def shard_for(self, *key: object) -> int:
+        index = bisect_right(self._points, stable_hash_combine(*key))
+        return self._owners[index if index < len(self._owners) else 0]
+
+    def add_shard(self) -> int:
+        shard = max(self._shards, default=-1) + 1
+        self._place(shard)
+        self._rebuild()
+        return shard
+
+    def remove_shard(self, shard: int) -> None:
+        if shard not in self._shards:
+            raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, "shard")
+        if len(self._shards) == 1:
+            raise ArgumentException(ArgumentException.EMPTY_ARGUMENT_MESSAGE, "shard")
+        self._shards.remove(shard)
+        self._ring = [node for node in self._ring if node[1] != shard]
+        self._rebuild()
+
+    def _place(self, shard: int) -> None:
+        self._shards.add(shard)
+        for replica in range(self._vnodes):
+            point = stable_hash_combine(VIRTUAL_NODE_KEY, shard, replica)
+            insort(self._ring, (point, shard))
+
+    def _rebuild(self) -> None:
+        self._points = [point for point, _ in self._ring]
+        self._owners = [shard for _, shard in self._ring]
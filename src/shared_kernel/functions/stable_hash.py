@@ -0,0 +1,114 @@
+from hashlib import blake2b
+from struct import Struct
+from typing import Callable
+
+from shared_kernel.design_by_contract import ArgumentException
+
+UNSUPPORTED_TYPE_MESSAGE = "Unsupported key type"
+DIGEST_SIZE = 8
+
+_LENGTH = Struct(">I")
+_FLOAT = Struct(">d")
+_NONE_TAG = b"N"
+_INT_TAG = b"I"
+_FLOAT_TAG = b"F"
+_STR_TAG = b"S"
+_BYTES_TAG = b"B"
+_TUPLE_TAG = b"T"
+_ERROR_TAG = b"E"
+
+type _Encoder = Callable[[object, list[bytes]], None]
+
+
+def stable_hash_combine(*args: object) -> int:
+    """
+    Combine values into a 64-bit hash that is identical in every process.
+
+    Unlike `hash_combine`, the result does not depend on the per-process salt of
+    the builtin `hash()`, so it can route keys consistently across machines.
+    Values are written to a canonical, type-tagged byte encoding that is
+    hashed in a single call. Values that compare equal get the same encoding,
+    e.g. `1`, `1.0` and `True`.
+
+    Args:
+        *args: None, int, float, str, bytes, tuple or `Error` values.
+
+    Returns:
+        int: The combined hash value in the range [0, 2**64).
+    """
+    ArgumentException.raise_if_none_or_empty(args, "args")
+    parts: list[bytes] = []
+    for arg in args:
+        _encode(arg, parts)
+    digest = blake2b(b"".join(parts), digest_size=DIGEST_SIZE).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _encode(arg: object, parts: list[bytes]) -> None:
+    encoder = _ENCODERS.get(type(arg))
+    if encoder is None:
+        encoder = _resolve_encoder(arg)
+    encoder(arg, parts)
+
+
+def _resolve_encoder(arg: object) -> _Encoder:
+    from shared_kernel.error_struct import Error
+
+    for base, encoder in (*_ENCODERS.items(), (Error, _encode_error)):
+        if base is not type(None) and isinstance(arg, base):
+            _ENCODERS[type(arg)] = encoder
+            return encoder
+    raise ArgumentException(UNSUPPORTED_TYPE_MESSAGE, type(arg).__name__)
+
+
+def _encode_none(arg: object, parts: list[bytes]) -> None:
+    parts.append(_NONE_TAG)
+
+
+def _encode_int(arg: object, parts: list[bytes]) -> None:
+    value = int(arg)  # type: ignore[call-overload]
+    payload = value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True)
+    parts += (_INT_TAG, _LENGTH.pack(len(payload)), payload)
+
+
+def _encode_float(arg: object, parts: list[bytes]) -> None:
+    value = float(arg)  # type: ignore[arg-type]
+    if value.is_integer():
+        _encode_int(int(value), parts)
+    else:
+        parts += (_FLOAT_TAG, _FLOAT.pack(value))
+
+
+def _encode_str(arg: object, parts: list[bytes]) -> None:
+    payload = str(arg).encode("utf-8", "surrogatepass")
+    parts += (_STR_TAG, _LENGTH.pack(len(payload)), payload)
+
+
+def _encode_bytes(arg: object, parts: list[bytes]) -> None:
+    payload = bytes(arg)  # type: ignore[call-overload]
+    parts += (_BYTES_TAG, _LENGTH.pack(len(payload)), payload)
+
+
+def _encode_tuple(arg: object, parts: list[bytes]) -> None:
+    items: tuple[object, ...] = arg  # type: ignore[assignment]
+    parts += (_TUPLE_TAG, _LENGTH.pack(len(items)))
+    for item in items:
+        _encode(item, parts)
+
+
+def _encode_error(arg: object, parts: list[bytes]) -> None:
+    parts.append(_ERROR_TAG)
+    _encode_str(arg.code, parts)  # type: ignore[attr-defined]
+
+
+_ENCODERS: dict[type, _Encoder] = {
+    type(None): _encode_none,
+    bool: _encode_int,
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+    memoryview: _encode_bytes,
+    tuple: _encode_tuple,
+}
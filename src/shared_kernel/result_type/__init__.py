@@ -1,4 +1,136 @@
+from typing import TYPE_CHECKING
+
 from .result import Err, Ok, Result
 from .UnwrapFailedException import UnwrapFailedException
 
-__all__ = ["AttributeNullError", "Err", "Ok", "Result", "UnwrapFailedException"]
+if TYPE_CHECKING:
+    from .async_result import AsyncResult, gather_results
+    from .block import async_result_block, result_block
+    from .catching import catch
+    from .instrumentation import (
+        CounterSink,
+        ResultEvent,
+        ResultSink,
+        disable_instrumentation,
+        enable_instrumentation,
+        instrumentation_enabled,
+    )
+    from .memoize import CachePolicy, ResultCacheInfo, memoize_result
+    from .pipeline import Pipeline
+    from .result_array import ResultArray
+    from .serialization import (
+        BYTES_CODEC,
+        ERROR_CODEC,
+        INT_CODEC,
+        PICKLE_CODEC,
+        STR_CODEC,
+        Codec,
+        ResultBatch,
+        decode_result,
+        decode_results,
+        encode_result,
+        encode_results,
+    )
+    from .stream import ResultStream
+    from .validation import (
+        Failures,
+        collect_none,
+        collect_none_or_empty,
+        collect_none_or_whitespace,
+        collected,
+        try_none,
+        try_none_or_empty,
+        try_none_or_whitespace,
+        validate_all,
+    )
+else:
+    from shared_kernel._lazy import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            ".async_result": ("AsyncResult", "gather_results"),
+            ".block": ("async_result_block", "result_block"),
+            ".catching": ("catch",),
+            ".instrumentation": (
+                "CounterSink",
+                "ResultEvent",
+                "ResultSink",
+                "disable_instrumentation",
+                "enable_instrumentation",
+                "instrumentation_enabled",
+            ),
+            ".memoize": ("CachePolicy", "ResultCacheInfo", "memoize_result"),
+            ".pipeline": ("Pipeline",),
+            ".result_array": ("ResultArray",),
+            ".serialization": (
+                "BYTES_CODEC",
+                "ERROR_CODEC",
+                "INT_CODEC",
+                "PICKLE_CODEC",
+                "STR_CODEC",
+                "Codec",
+                "ResultBatch",
+                "decode_result",
+                "decode_results",
+                "encode_result",
+                "encode_results",
+            ),
+            ".stream": ("ResultStream",),
+            ".validation": (
+                "Failures",
+                "collect_none",
+                "collect_none_or_empty",
+                "collect_none_or_whitespace",
+                "collected",
+                "try_none",
+                "try_none_or_empty",
+                "try_none_or_whitespace",
+                "validate_all",
+            ),
+        },
+    )
+
+__all__ = [
+    "BYTES_CODEC",
+    "ERROR_CODEC",
+    "INT_CODEC",
+    "PICKLE_CODEC",
+    "STR_CODEC",
+    "AsyncResult",
+    "CachePolicy",
+    "Codec",
+    "CounterSink",
+    "Err",
+    "Ok",
+    "Pipeline",
+    "Result",
+    "ResultArray",
+    "ResultBatch",
+    "ResultCacheInfo",
+    "ResultEvent",
+    "ResultSink",
+    "ResultStream",
+    "UnwrapFailedException",
+    "async_result_block",
+    "catch",
+    "decode_result",
+    "decode_results",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "encode_result",
+    "encode_results",
+    "gather_results",
+    "instrumentation_enabled",
+    "memoize_result",
+    "result_block",
+    "Failures",
+    "collect_none",
+    "collect_none_or_empty",
+    "collect_none_or_whitespace",
+    "collected",
+    "try_none",
+    "try_none_or_empty",
+    "try_none_or_whitespace",
+    "validate_all",
+]
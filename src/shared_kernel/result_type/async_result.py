@@ -0,0 +1,140 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from inspect import iscoroutine
+from itertools import islice
+from typing import cast
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type.result import Result
+
+
+class AsyncResult[T, E]:
+    """An awaitable `Result` that chains sync and async steps.
+
+    Every step wraps the previous awaitable in a new coroutine, so a chain runs
+    inside the awaiting task and never schedules tasks of its own.
+    """
+
+    __slots__ = ("_awaitable",)
+
+    def __init__(self, awaitable: Awaitable[Result[T, E]]) -> None:
+        self._awaitable = awaitable
+
+    def __await__(self) -> Generator[object, None, Result[T, E]]:
+        return self._awaitable.__await__()
+
+    @classmethod
+    def from_result(cls, result: Result[T, E]) -> "AsyncResult[T, E]":
+        return cls(_ready(result))
+
+    def map[U](self, op: Callable[[T], U]) -> "AsyncResult[U, E]":
+        return AsyncResult(self._map(op))
+
+    def map_err[F](self, op: Callable[[E], F]) -> "AsyncResult[T, F]":
+        return AsyncResult(self._map_err(op))
+
+    def and_then[U](self, op: Callable[[T], Result[U, E]]) -> "AsyncResult[U, E]":
+        return AsyncResult(self._and_then(op))
+
+    def or_else[F](self, op: Callable[[E], Result[T, F]]) -> "AsyncResult[T, F]":
+        return AsyncResult(self._or_else(op))
+
+    def map_async[U](self, op: Callable[[T], Awaitable[U]]) -> "AsyncResult[U, E]":
+        return AsyncResult(self._map_async(op))
+
+    def map_err_async[F](self, op: Callable[[E], Awaitable[F]]) -> "AsyncResult[T, F]":
+        return AsyncResult(self._map_err_async(op))
+
+    def and_then_async[U](
+        self, op: Callable[[T], Awaitable[Result[U, E]]]
+    ) -> "AsyncResult[U, E]":
+        return AsyncResult(self._and_then_async(op))
+
+    def or_else_async[F](
+        self, op: Callable[[E], Awaitable[Result[T, F]]]
+    ) -> "AsyncResult[T, F]":
+        return AsyncResult(self._or_else_async(op))
+
+    async def _map[U](self, op: Callable[[T], U]) -> Result[U, E]:
+        return (await self._awaitable).map(op)
+
+    async def _map_err[F](self, op: Callable[[E], F]) -> Result[T, F]:
+        return (await self._awaitable).map_err(op)
+
+    async def _and_then[U](self, op: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return (await self._awaitable).and_then(op)
+
+    async def _or_else[F](self, op: Callable[[E], Result[T, F]]) -> Result[T, F]:
+        return (await self._awaitable).or_else(op)
+
+    async def _map_async[U](self, op: Callable[[T], Awaitable[U]]) -> Result[U, E]:
+        return await (await self._awaitable).map_async(op)
+
+    async def _map_err_async[F](self, op: Callable[[E], Awaitable[F]]) -> Result[T, F]:
+        return await (await self._awaitable).map_err_async(op)
+
+    async def _and_then_async[U](
+        self, op: Callable[[T], Awaitable[Result[U, E]]]
+    ) -> Result[U, E]:
+        return await (await self._awaitable).and_then_async(op)
+
+    async def _or_else_async[F](
+        self, op: Callable[[E], Awaitable[Result[T, F]]]
+    ) -> Result[T, F]:
+        return await (await self._awaitable).or_else_async(op)
+
+
+async def _ready[T, E](result: Result[T, E]) -> Result[T, E]:
+    return result
+
+
+async def gather_results[T, E](
+    awaitables: Iterable[Awaitable[Result[T, E]]],
+    limit: int | None = None,
+    fail_fast: bool = True,
+) -> Result[list[T], E]:
+    """
+    Await many Results with at most `limit` of them running at once.
+
+    Args:
+        awaitables: The awaitables to run. They are started lazily, in order.
+        limit: Maximum number of awaitables in flight. `None` runs all at once.
+        fail_fast: Return the first Err as soon as it completes, cancelling the
+            running awaitables and closing the ones that were not started.
+
+    Returns:
+        Result[list[T], E]: The Ok values in input order, or the first Err (by
+        completion time when failing fast, by position otherwise).
+    """
+    if limit is not None and limit < 1:
+        raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, "limit")
+
+    sources = enumerate(awaitables)
+    running: dict[asyncio.Future[Result[T, E]], int] = {}
+    completed: dict[int, Result[T, E]] = {}
+
+    def start(count: int | None) -> None:
+        for index, awaitable in islice(sources, count):
+            running[asyncio.ensure_future(awaitable)] = index
+
+    try:
+        start(limit)
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                index = running.pop(future)
+                if fail_fast and not result._is_ok:
+                    return cast(Result[list[T], E], result)
+                completed[index] = result
+            start(len(done) if limit is not None else None)
+    finally:
+        if running:
+            for future in running:
+                future.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        for _, awaitable in sources:
+            if iscoroutine(awaitable):
+                awaitable.close()
+
+    return Result.collect(completed[index] for index in range(len(completed)))
@@ -0,0 +1,91 @@
+from collections.abc import Callable, Mapping
+from functools import wraps
+from http import HTTPStatus
+from inspect import iscoroutinefunction
+from typing import Any
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.error_struct import Error
+from shared_kernel.result_type.result import Err, Ok, Result
+
+INVALID_EXCEPTION_TYPE_MESSAGE = "Mapping keys must be exception types"
+INVALID_ERROR_MESSAGE = "Mapping values must be an Error, HTTPStatus, str or callable"
+
+type ErrorSpec = Error | HTTPStatus | str | Callable[[Any], Any]
+type _Handler = Err[Any, Any] | Callable[[Any], Any]
+
+
+def catch[**P, T](
+    mapping: Mapping[type[BaseException], ErrorSpec],
+) -> Callable[[Callable[P, T]], Callable[P, Result[T, Any]]]:
+    """
+    Turn the listed exceptions raised by a function into `Err` results.
+
+    Each exception type maps to an `Error`, an `HTTPStatus` or a `str`, which
+    are converted with `Error.from_` once and then shared by every failure, or
+    to a callable that builds the error from the raised exception. An
+    exception is matched by its type first and then by its MRO, so the most
+    specific listed base wins; the outcome is cached per exception type.
+    Exceptions that are not listed propagate.
+
+    A return value is wrapped in `Ok`, unless it already is a `Result`.
+    Coroutine functions are supported.
+    """
+    ArgumentException.raise_if_none_or_empty(mapping, "mapping")
+    handlers = {
+        _exception_type(exception): _handler(spec)
+        for exception, spec in mapping.items()
+    }
+    resolved = dict(handlers)
+    caught = tuple(handlers)
+
+    def to_err(error: BaseException) -> Result[Any, Any]:
+        handler = resolved.get(type(error))
+        if handler is None:
+            handler = resolved[type(error)] = next(
+                handlers[base] for base in type(error).__mro__ if base in handlers
+            )
+        return handler if isinstance(handler, Err) else Err(handler(error))
+
+    def decorate(function: Callable[P, T]) -> Callable[P, Result[T, Any]]:
+        if iscoroutinefunction(function):
+
+            @wraps(function)
+            async def run_async(*args: P.args, **kwargs: P.kwargs) -> Any:
+                try:
+                    value = await function(*args, **kwargs)
+                except caught as error:
+                    return to_err(error)
+                return value if isinstance(value, Result) else Ok(value)
+
+            return run_async  # type: ignore[return-value]
+
+        @wraps(function)
+        def run(*args: P.args, **kwargs: P.kwargs) -> Result[T, Any]:
+            try:
+                value = function(*args, **kwargs)
+            except caught as error:
+                return to_err(error)
+            return value if isinstance(value, Result) else Ok(value)
+
+        return run
+
+    return decorate
+
+
+def _exception_type(exception: Any) -> type[BaseException]:
+    if not (isinstance(exception, type) and issubclass(exception, BaseException)):
+        raise ArgumentException(INVALID_EXCEPTION_TYPE_MESSAGE, str(exception))
+    return exception
+
+
+def _handler(spec: ErrorSpec) -> _Handler:
+    match spec:
+        case Error():
+            return Err(spec)
+        case HTTPStatus() | str():
+            return Err(Error.from_(spec))
+        case _ if callable(spec):
+            return spec
+        case _:
+            raise ArgumentException(INVALID_ERROR_MESSAGE, str(spec))
@@ -0,0 +1,284 @@
+import sys
+from collections.abc import Callable, Iterable
+from enum import StrEnum
+from functools import wraps
+from threading import Lock, local
+from typing import Any, Protocol
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type.result import Err, Ok, Result
+from shared_kernel.result_type.UnwrapFailedException import UnwrapFailedException
+
+COMBINATORS = (
+    "map",
+    "map_err",
+    "and_then",
+    "or_else",
+    "map_or",
+    "map_or_else",
+    "or_",
+    "map_async",
+    "map_err_async",
+    "and_then_async",
+    "or_else_async",
+)
+UNWRAPS = ("expect", "expect_err")
+SITE_FORMAT = "{}:{} ({})"
+
+
+class ResultEvent(StrEnum):
+    OK = "ok"
+    ERR = "err"
+    UNWRAP_FAILED = "unwrap_failed"
+    COMBINATOR = "combinator"
+
+    # Enum hashes in Python code; sinks hash events on every record.
+    __hash__ = str.__hash__
+
+
+class ResultSink(Protocol):
+    def record(self, event: ResultEvent, name: str, site: str | None) -> None: ...
+
+
+type _Tables = tuple[
+    dict[tuple[ResultEvent, str], int], dict[tuple[ResultEvent, str, str], int]
+]
+
+
+class CounterSink:
+    """
+    Thread-safe sink that counts events, and sampled call sites per event.
+
+    Every thread counts into its own plain `int` tables, so recording takes no
+    lock and never races with another thread, with or without the GIL. The
+    lock only guards registering a thread's tables; `counts` and `sites` sum
+    the tables of every thread that recorded an event.
+    """
+
+    __slots__ = ("_lock", "_local", "_tables")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._local = local()
+        self._tables: list[_Tables] = []
+
+    def record(self, event: ResultEvent, name: str, site: str | None) -> None:
+        try:
+            counts, sites = self._local.tables
+        except AttributeError:
+            counts, sites = self._register()
+        key = event, name
+        counts[key] = counts.get(key, 0) + 1
+        if site is not None:
+            site_key = event, name, site
+            sites[site_key] = sites.get(site_key, 0) + 1
+
+    def counts(self) -> dict[tuple[ResultEvent, str], int]:
+        return _sum(counts for counts, _ in self._snapshot())
+
+    def sites(self) -> dict[tuple[ResultEvent, str, str], int]:
+        return _sum(sites for _, sites in self._snapshot())
+
+    def reset(self) -> None:
+        # Threads register new tables on their next event; an event recorded
+        # concurrently with the reset may land in the discarded tables.
+        with self._lock:
+            self._local = local()
+            self._tables = []
+
+    def _register(self) -> _Tables:
+        tables: _Tables = ({}, {})
+        with self._lock:
+            self._local.tables = tables
+            self._tables.append(tables)
+        return tables
+
+    def _snapshot(self) -> list[_Tables]:
+        with self._lock:
+            tables = list(self._tables)
+        # Copying a dict is a single operation, so a table is never read while
+        # its thread resizes it.
+        return [(counts.copy(), sites.copy()) for counts, sites in tables]
+
+
+def _sum[K](tables: Iterable[dict[K, int]]) -> dict[K, int]:
+    total: dict[K, int] = {}
+    for table in tables:
+        for key, value in table.items():
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def enable_instrumentation[S: ResultSink](sink: S, sample_rate: int = 0) -> S:
+    """
+    Report Result events to `sink` until `disable_instrumentation` is called.
+
+    Enabling swaps counting wrappers into the `Ok`, `Err` and `Result` classes;
+    disabling puts the original methods back, so instrumentation costs nothing
+    while it is off.
+
+    Args:
+        sink: Receives `(event, name, site)` for every construction, combinator
+            call and failed `expect`/`expect_err`.
+        sample_rate: Capture the caller's `file:line (function)` as `site` for
+            one construction or combinator call in `sample_rate`, and for
+            every failed unwrap; 0 never captures call sites. Every event is
+            reported either way.
+
+    Returns:
+        S: The given sink.
+    """
+    global _enabled
+    ArgumentException.raise_if_none(sink, "sink")
+    if sample_rate < 0:
+        raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, "sample_rate")
+    wrappers = _Wrappers(sink.record, sample_rate)
+    with _lock:
+        _restore()
+        _patch(Ok, "__init__", wrappers.construction(ResultEvent.OK, "Ok"))
+        _patch(Err, "__init__", wrappers.construction(ResultEvent.ERR, "Err"))
+        for cls in (Result, Ok, Err):
+            for name in COMBINATORS:
+                _patch(cls, name, wrappers.combinator(name))
+            for name in UNWRAPS:
+                _patch(cls, name, wrappers.unwrap(name))
+        _enabled = True
+    return sink
+
+
+def disable_instrumentation() -> None:
+    global _enabled
+    with _lock:
+        _restore()
+        _enabled = False
+
+
+def instrumentation_enabled() -> bool:
+    return _enabled
+
+
+type _Wrap = Callable[[Callable[..., Any]], Callable[..., Any]]
+
+
+class _Wrappers:
+    """
+    Builds the method wrappers with the sink and sample rate bound as closures.
+
+    Every wrapper passes its arguments on unchanged and records every call.
+    With sampling, each wrapper also counts down its own calls and captures
+    the call site on every `rate`-th one. The countdown is unsynchronised, so
+    concurrent calls may shift which call gets a site, never the counts.
+    """
+
+    __slots__ = ("_record", "_rate")
+
+    def __init__(
+        self, record: Callable[[ResultEvent, str, str | None], None], rate: int
+    ) -> None:
+        self._record = record
+        self._rate = rate
+
+    def construction(self, event: ResultEvent, name: str) -> _Wrap:
+        record, rate = self._record, self._rate
+
+        def wrap(init: Callable[..., Any]) -> Callable[..., Any]:
+            if not rate:
+
+                def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+                    init(self, *args, **kwargs)
+                    record(event, name, None)
+
+                return __init__
+
+            countdown = rate
+
+            def sampled_init(self: Any, *args: Any, **kwargs: Any) -> None:
+                nonlocal countdown
+                init(self, *args, **kwargs)
+                countdown -= 1
+                if countdown:
+                    record(event, name, None)
+                else:
+                    countdown = rate
+                    record(event, name, _site())
+
+            return sampled_init
+
+        return wrap
+
+    def combinator(self, name: str) -> _Wrap:
+        record, rate, event = self._record, self._rate, ResultEvent.COMBINATOR
+
+        def wrap(method: Callable[..., Any]) -> Callable[..., Any]:
+            if not rate:
+
+                def combinator(self: Any, *args: Any, **kwargs: Any) -> Any:
+                    record(event, name, None)
+                    return method(self, *args, **kwargs)
+
+                return combinator
+
+            countdown = rate
+
+            def sampled_combinator(self: Any, *args: Any, **kwargs: Any) -> Any:
+                nonlocal countdown
+                countdown -= 1
+                if countdown:
+                    record(event, name, None)
+                else:
+                    countdown = rate
+                    record(event, name, _site())
+                return method(self, *args, **kwargs)
+
+            return sampled_combinator
+
+        return wrap
+
+    def unwrap(self, name: str) -> _Wrap:
+        record, rate, event = self._record, self._rate, ResultEvent.UNWRAP_FAILED
+
+        def wrap(method: Callable[..., Any]) -> Callable[..., Any]:
+            def unwrap(self: Any, *args: Any, **kwargs: Any) -> Any:
+                try:
+                    return method(self, *args, **kwargs)
+                except UnwrapFailedException:
+                    # Failures are rare, so every one is recorded, with its
+                    # site when sampling is on.
+                    record(event, name, _site() if rate else None)
+                    raise
+
+            return unwrap
+
+        return wrap
+
+
+def _site() -> str | None:
+    """Return `file:line (function)` of the nearest frame outside this package."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_globals.get("__name__", "").startswith(
+        _PACKAGE
+    ):
+        frame = frame.f_back  # type: ignore[assignment]
+    if frame is None:
+        return None
+    code = frame.f_code
+    return SITE_FORMAT.format(code.co_filename, frame.f_lineno, code.co_name)
+
+
+def _patch(cls: type, name: str, wrap: _Wrap) -> None:
+    original = cls.__dict__.get(name)
+    if original is not None:
+        _originals.append((cls, name, original))
+        setattr(cls, name, wraps(original)(wrap(original)))
+
+
+def _restore() -> None:
+    while _originals:
+        cls, name, original = _originals.pop()
+        setattr(cls, name, original)
+
+
+_PACKAGE = f"{__name__.partition('.')[0]}."
+_lock = Lock()
+_originals: list[tuple[type, str, Any]] = []
+_enabled = False
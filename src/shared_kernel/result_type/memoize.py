@@ -0,0 +1,207 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AbstractContextManager, nullcontext
+from enum import StrEnum
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Lock
+from time import monotonic
+from typing import Any, NamedTuple
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.functions import hash_combine
+from shared_kernel.result_type.result import Result
+
+DEFAULT_MAXSIZE = 128
+
+_KWARGS_MARK = object()
+_FAST_TYPES = frozenset((int, str))
+
+
+class CachePolicy(StrEnum):
+    OK_ONLY = "ok_only"
+    BOTH = "both"
+
+
+class ResultCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class _HashedKey(list):
+    """Argument key whose hash is computed once, with `hash_combine`."""
+
+    __slots__ = ("hash_value",)
+
+    hash_value: int
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return self.hash_value
+
+
+def memoize_result[F: Callable[..., Any]](
+    maxsize: int | None = DEFAULT_MAXSIZE,
+    ttl: float | None = None,
+    policy: CachePolicy = CachePolicy.OK_ONLY,
+    err_ttl: float | None = None,
+    thread_safe: bool = False,
+    clock: Callable[[], float] = monotonic,
+) -> Callable[[F], F]:
+    """
+    Cache the `Result`s of a pure function, treating Ok and Err separately.
+
+    Arguments are keyed with `hash_combine`, so they must be hashable. The
+    decorated function gets `cache_info()` and `cache_clear()`. Coroutine
+    functions are supported; concurrent calls with the same arguments on the
+    same event loop then share one computation.
+
+    Args:
+        maxsize: Most entries kept, evicting the least recently used; None
+            keeps every entry.
+        ttl: Seconds an Ok entry stays valid; None never expires.
+        policy: Whether Err results are cached as well.
+        err_ttl: Seconds an Err entry stays valid; defaults to `ttl`.
+        thread_safe: Guard the cache with a lock for use from many threads,
+            including coroutine functions awaited on event loops in several
+            threads.
+        clock: Time source for the TTLs.
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, "maxsize")
+    for name, seconds in (("ttl", ttl), ("err_ttl", err_ttl)):
+        if seconds is not None and seconds <= 0:
+            raise ArgumentException(ArgumentException.DEFAULT_MESSAGE, name)
+    cache_err = CachePolicy(policy) is CachePolicy.BOTH
+    ok_ttl, err_ttl = ttl, err_ttl if err_ttl is not None else ttl
+
+    def decorate(function: F) -> F:
+        entries: OrderedDict[Hashable, tuple[Result[Any, Any], float | None]] = (
+            OrderedDict()
+        )
+        stats = [0, 0]
+        lock = Lock()
+
+        def lookup(key: Hashable) -> Result[Any, Any] | None:
+            entry = entries.get(key)
+            if entry is not None:
+                result, expires = entry
+                if expires is None or clock() < expires:
+                    entries.move_to_end(key)
+                    stats[0] += 1
+                    return result
+                del entries[key]
+            stats[1] += 1
+            return None
+
+        def store(key: Hashable, result: Result[Any, Any]) -> None:
+            if result._is_ok:
+                seconds = ok_ttl
+            elif cache_err:
+                seconds = err_ttl
+            else:
+                return
+            if maxsize == 0:
+                return
+            entries[key] = (result, None if seconds is None else clock() + seconds)
+            entries.move_to_end(key)
+            if maxsize is not None and len(entries) > maxsize:
+                entries.popitem(last=False)
+
+        def cache_info() -> ResultCacheInfo:
+            with lock:
+                return ResultCacheInfo(stats[0], stats[1], maxsize, len(entries))
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                stats[:] = [0, 0]
+
+        if iscoroutinefunction(function):
+            wrapper = _async_wrapper(
+                function, lookup, store, stats, lock if thread_safe else nullcontext()
+            )
+        elif thread_safe:
+
+            @wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = _make_key(args, kwargs)
+                with lock:
+                    result = lookup(key)
+                if result is None:
+                    result = function(*args, **kwargs)
+                    with lock:
+                        store(key, result)
+                return result
+
+        else:
+
+            @wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = _make_key(args, kwargs)
+                result = lookup(key)
+                if result is None:
+                    result = function(*args, **kwargs)
+                    store(key, result)
+                return result
+
+        wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _async_wrapper(
+    function: Callable[..., Awaitable[Result[Any, Any]]],
+    lookup: Callable[[Hashable], Result[Any, Any] | None],
+    store: Callable[[Hashable, Result[Any, Any]], None],
+    stats: list[int],
+    lock: AbstractContextManager[Any],
+) -> Callable[..., Any]:
+    # A task can only be awaited on its own event loop, so calls are merged
+    # per loop. The cache itself is shared by every loop; with `thread_safe`,
+    # `lock` guards it against loops running in other threads.
+    in_flight: dict[
+        tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[Result[Any, Any]]
+    ] = {}
+
+    def finish(
+        flight: tuple[asyncio.AbstractEventLoop, Hashable],
+        task: asyncio.Task[Result[Any, Any]],
+    ) -> None:
+        with lock:
+            del in_flight[flight]
+            if not task.cancelled() and task.exception() is None:
+                store(flight[1], task.result())
+
+    @wraps(function)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        flight = asyncio.get_running_loop(), _make_key(args, kwargs)
+        with lock:
+            task = in_flight.get(flight)
+            if task is None:
+                result = lookup(flight[1])
+                if result is not None:
+                    return result
+                task = asyncio.ensure_future(function(*args, **kwargs))
+                in_flight[flight] = task
+                task.add_done_callback(lambda done: finish(flight, done))
+            else:
+                stats[0] += 1
+        # Shielded, so one cancelled caller does not cancel the shared call.
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if kwargs:
+        args += (_KWARGS_MARK, *kwargs.items())
+    elif len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]  # type: ignore[no-any-return]
+    key = _HashedKey(args)
+    key.hash_value = hash_combine(*args) if args else 0
+    return key
@@ -0,0 +1,95 @@
+from typing import Callable, ClassVar, Iterable, Iterator
+
+from shared_kernel.result_type.result import Err, Ok, Result
+
+type _Step = tuple[str, Callable]
+
+
+class Pipeline[T, E, U, F]:
+    """A reusable chain of Result combinators compiled into a single function.
+
+    The recorded steps run on the unwrapped value or error, so applying the
+    pipeline allocates at most the final `Result`.
+    """
+
+    _MAP: ClassVar[str] = "map"
+    _MAP_ERR: ClassVar[str] = "map_err"
+    _AND_THEN: ClassVar[str] = "and_then"
+    _OR_ELSE: ClassVar[str] = "or_else"
+    _OK_SIDE: ClassVar[frozenset[str]] = frozenset((_MAP, _AND_THEN))
+    _BINDS: ClassVar[frozenset[str]] = frozenset((_AND_THEN, _OR_ELSE))
+
+    __slots__ = ("_steps", "_compiled")
+
+    def __init__(self, steps: tuple[_Step, ...] = ()) -> None:
+        self._steps = steps
+        self._compiled: Callable[[Result[T, E]], Result[U, F]] | None = None
+
+    def __call__(self, result: Result[T, E]) -> Result[U, F]:
+        return self.compile()(result)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def map[V](self, op: Callable[[U], V]) -> "Pipeline[T, E, V, F]":
+        return Pipeline(self._steps + ((self._MAP, op),))
+
+    def map_err[G](self, op: Callable[[F], G]) -> "Pipeline[T, E, U, G]":
+        return Pipeline(self._steps + ((self._MAP_ERR, op),))
+
+    def and_then[V](self, op: Callable[[U], Result[V, F]]) -> "Pipeline[T, E, V, F]":
+        return Pipeline(self._steps + ((self._AND_THEN, op),))
+
+    def or_else[G](self, op: Callable[[F], Result[U, G]]) -> "Pipeline[T, E, U, G]":
+        return Pipeline(self._steps + ((self._OR_ELSE, op),))
+
+    def stream(self, results: Iterable[Result[T, E]]) -> Iterator[Result[U, F]]:
+        return map(self.compile(), results)
+
+    def compile(self) -> Callable[[Result[T, E]], Result[U, F]]:
+        if self._compiled is None:
+            self._compiled = self._generate()
+        return self._compiled
+
+    def _generate(self) -> Callable[[Result[T, E]], Result[U, F]]:
+        namespace: dict[str, object] = {"Ok": Ok, "Err": Err}
+        lines = [
+            "def pipeline(result):",
+            "    r = result",
+            "    ok = r._is_ok",
+            "    x = r._value if ok else r._error",
+        ]
+        side: str | None = None
+        dirty = False
+        for index, (kind, op) in enumerate(self._steps):
+            name = f"step{index}"
+            namespace[name] = op
+            step_side = "ok" if kind in self._OK_SIDE else "not ok"
+            if step_side != side:
+                if dirty:
+                    lines.append("        r = None")
+                lines.append(f"    if {step_side}:")
+                side, dirty = step_side, False
+            if kind in self._BINDS:
+                lines += [
+                    f"        r = {name}(x)",
+                    "        ok = r._is_ok",
+                    "        x = r._value if ok else r._error",
+                ]
+                side, dirty = None, False
+            else:
+                lines += [
+                    f"        x = {name}(x)",
+                    "        if x is None:",
+                    f"            {'Ok' if kind == self._MAP else 'Err'}(x)",
+                ]
+                dirty = True
+        if dirty:
+            lines.append("        r = None")
+        lines += [
+            "    if r is None:",
+            "        return Ok(x) if ok else Err(x)",
+            "    return r",
+        ]
+        exec("\n".join(lines), namespace)
+        return namespace["pipeline"]  # type: ignore[return-value]
@@ -1,12 +1,14 @@
-from dataclasses import dataclass
-from typing import Callable, ClassVar, cast
+from typing import TYPE_CHECKING, Awaitable, Callable, ClassVar, Iterable, Mapping, cast
 
 from shared_kernel.design_by_contract import ArgumentException
 from shared_kernel.functions import hash_combine
 from shared_kernel.result_type.UnwrapFailedException import UnwrapFailedException
 
+if TYPE_CHECKING:
+    from shared_kernel.result_type.pipeline import Pipeline
+    from shared_kernel.result_type.serialization import Buffer, Codec
+
 
-@dataclass
 class Result[T: object, E]:
     __match_args__ = ("_is_ok", "_value", "_error")
     __slots__ = ("_is_ok", "_value", "_error")
@@ -18,6 +20,11 @@ class Result[T: object, E]:
     _value: T | None
     _error: E | None
 
+    def __init__(self, _is_ok: bool, _value: T | None, _error: E | None) -> None:
+        self._is_ok = _is_ok
+        self._value = _value
+        self._error = _error
+
     def __str__(self):
         return self.STRING_FORMAT.format(self._value, self._error)
 
@@ -36,15 +43,85 @@ class Result[T: object, E]:
     def __hash__(self) -> int:
         return hash_combine(self._is_ok, self._value, self._error)
 
+    def __reduce__(self) -> tuple[object, ...]:
+        return type(self), (self._is_ok, self._value, self._error)
+
     @classmethod
     def Ok(cls, value: T) -> "Result[T, E]":
-        ArgumentException.raise_if_none(value, "Ok.value")
-        return cls(True, value, None)
+        return Ok(value)
 
     @classmethod
     def Err(cls, error: E) -> "Result[T, E]":
-        ArgumentException.raise_if_none(error, "Err.error")
-        return cls(False, None, error)
+        return Err(error)
+
+    @classmethod
+    def pipeline(cls) -> "Pipeline[T, E, T, E]":
+        from shared_kernel.result_type.pipeline import Pipeline
+
+        return Pipeline()
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: "Buffer",
+        value_codec: "Codec[T]",
+        error_codec: "Codec[E] | None" = None,
+    ) -> "Result[T, E]":
+        from shared_kernel.result_type import serialization
+
+        return serialization.decode_result(
+            data,
+            value_codec,
+            cast("Codec[E]", error_codec or serialization.ERROR_CODEC),
+        )
+
+    @classmethod
+    def collect[U, F](cls, results: Iterable["Result[U, F]"]) -> "Result[list[U], F]":
+        values: list[U] = []
+        append = values.append
+        for result in results:
+            if not result._is_ok:
+                return cast(Result[list[U], F], result)
+            append(cast(U, result._value))
+        return Ok(values)
+
+    @classmethod
+    def partition[U, F](
+        cls, results: Iterable["Result[U, F]"]
+    ) -> tuple[list[U], list[F]]:
+        values: list[U] = []
+        errors: list[F] = []
+        append_value, append_error = values.append, errors.append
+        for result in results:
+            if result._is_ok:
+                append_value(cast(U, result._value))
+            else:
+                append_error(cast(F, result._error))
+        return values, errors
+
+    @classmethod
+    def sequence[K, U, F](
+        cls, results: Mapping[K, "Result[U, F]"]
+    ) -> "Result[dict[K, U], F]":
+        values: dict[K, U] = {}
+        for key, result in results.items():
+            if not result._is_ok:
+                return cast(Result[dict[K, U], F], result)
+            values[key] = cast(U, result._value)
+        return Ok(values)
+
+    def to_bytes(
+        self,
+        value_codec: "Codec[T]",
+        error_codec: "Codec[E] | None" = None,
+    ) -> bytes:
+        from shared_kernel.result_type import serialization
+
+        return serialization.encode_result(
+            self,
+            value_codec,
+            cast("Codec[E]", error_codec or serialization.ERROR_CODEC),
+        )
 
     def is_ok(self) -> bool:
         return self._is_ok
@@ -105,6 +182,30 @@ class Result[T: object, E]:
             return op(self._error)
         return cast(Result[T, F], self)
 
+    async def map_async[U](self, op: Callable[[T], Awaitable[U]]) -> "Result[U, E]":
+        if self._is_ok and self._value is not None:
+            return Ok(await op(self._value))
+        return cast(Result[U, E], self)
+
+    async def map_err_async[F](self, op: Callable[[E], Awaitable[F]]) -> "Result[T, F]":
+        if not self._is_ok and self._error is not None:
+            return Err(await op(self._error))
+        return cast(Result[T, F], self)
+
+    async def and_then_async[U](
+        self, op: Callable[[T], Awaitable["Result[U, E]"]]
+    ) -> "Result[U, E]":
+        if self._is_ok and self._value is not None:
+            return await op(self._value)
+        return cast(Result[U, E], self)
+
+    async def or_else_async[F](
+        self, op: Callable[[E], Awaitable["Result[T, F]"]]
+    ) -> "Result[T, F]":
+        if not self._is_ok and self._error is not None:
+            return await op(self._error)
+        return cast(Result[T, F], self)
+
     def ok(self) -> T | None:
         return self._value
 
@@ -112,9 +213,160 @@ class Result[T: object, E]:
         return self._error
 
 
-def Ok[T, E](value: T) -> Result[T, E]:
-    return Result.Ok(value)
+class Ok[T, E](Result[T, E]):
+    """A successful `Result` whose methods never inspect `_is_ok`."""
+
+    __match_args__ = ("_value",)
+    __slots__ = ()
+
+    _value: T
+
+    def __init__(self, value: T) -> None:
+        if value is None:
+            raise ArgumentException(ArgumentException.NONE_ARGUMENT_MESSAGE, "Ok.value")
+        self._is_ok = True
+        self._value = value
+        self._error = None
+
+    def __reduce__(self) -> tuple[object, ...]:
+        return type(self), (self._value,)
+
+    def is_ok(self) -> bool:
+        return True
+
+    def is_ok_and(self, predicate: Callable[[T], bool]) -> bool:
+        return predicate(self._value)
+
+    def is_err(self) -> bool:
+        return False
+
+    def is_err_and(self, predicate: Callable[[E], bool]) -> bool:
+        return False
+
+    def expect(self, message: str) -> T:
+        return self._value
+
+    def expect_err(self, message: str) -> E:
+        raise UnwrapFailedException(message)
+
+    def map[U](self, op: Callable[[T], U]) -> Result[U, E]:
+        return Ok(op(self._value))
+
+    def map_err[F](self, op: Callable[[E], F]) -> Result[T, F]:
+        return self  # type: ignore[return-value]
 
+    def and_then[U](self, op: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return op(self._value)
 
-def Err[T, E](error: E) -> Result[T, E]:
-    return Result.Err(error)
+    def map_or[U](self, default: U, op: Callable[[T], U]) -> U:
+        return op(self._value)
+
+    def map_or_else[U](self, default: Callable[[], U], op: Callable[[T], U]) -> U:
+        return op(self._value)
+
+    def or_else[F](self, op: Callable[[E], Result[T, F]]) -> Result[T, F]:
+        return self  # type: ignore[return-value]
+
+    async def map_async[U](self, op: Callable[[T], Awaitable[U]]) -> Result[U, E]:
+        return Ok(await op(self._value))
+
+    async def map_err_async[F](self, op: Callable[[E], Awaitable[F]]) -> Result[T, F]:
+        return self  # type: ignore[return-value]
+
+    async def and_then_async[U](
+        self, op: Callable[[T], Awaitable[Result[U, E]]]
+    ) -> Result[U, E]:
+        return await op(self._value)
+
+    async def or_else_async[F](
+        self, op: Callable[[E], Awaitable[Result[T, F]]]
+    ) -> Result[T, F]:
+        return self  # type: ignore[return-value]
+
+    def ok(self) -> T:
+        return self._value
+
+    def err(self) -> None:
+        return None
+
+
+class Err[T, E](Result[T, E]):
+    """A failed `Result` whose methods never inspect `_is_ok`."""
+
+    __match_args__ = ("_error",)
+    __slots__ = ()
+
+    _error: E
+
+    def __init__(self, error: E) -> None:
+        if error is None:
+            raise ArgumentException(
+                ArgumentException.NONE_ARGUMENT_MESSAGE, "Err.error"
+            )
+        self._is_ok = False
+        self._value = None
+        self._error = error
+
+    def __reduce__(self) -> tuple[object, ...]:
+        return type(self), (self._error,)
+
+    def is_ok(self) -> bool:
+        return False
+
+    def is_ok_and(self, predicate: Callable[[T], bool]) -> bool:
+        return False
+
+    def is_err(self) -> bool:
+        return True
+
+    def is_err_and(self, predicate: Callable[[E], bool]) -> bool:
+        return predicate(self._error)
+
+    def expect(self, message: str) -> T:
+        raise UnwrapFailedException(message)
+
+    def expect_err(self, message: str) -> E:
+        return self._error
+
+    def map[U](self, op: Callable[[T], U]) -> Result[U, E]:
+        return self  # type: ignore[return-value]
+
+    def map_err[F](self, op: Callable[[E], F]) -> Result[T, F]:
+        return Err(op(self._error))
+
+    def and_then[U](self, op: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return self  # type: ignore[return-value]
+
+    def map_or[U](self, default: U, op: Callable[[T], U]) -> U:
+        return default
+
+    def map_or_else[U](self, default: Callable[[], U], op: Callable[[T], U]) -> U:
+        return default()
+
+    def or_[U](self, default: U) -> U:
+        return default
+
+    def or_else[F](self, op: Callable[[E], Result[T, F]]) -> Result[T, F]:
+        return op(self._error)
+
+    async def map_async[U](self, op: Callable[[T], Awaitable[U]]) -> Result[U, E]:
+        return self  # type: ignore[return-value]
+
+    async def map_err_async[F](self, op: Callable[[E], Awaitable[F]]) -> Result[T, F]:
+        return Err(await op(self._error))
+
+    async def and_then_async[U](
+        self, op: Callable[[T], Awaitable[Result[U, E]]]
+    ) -> Result[U, E]:
+        return self  # type: ignore[return-value]
+
+    async def or_else_async[F](
+        self, op: Callable[[E], Awaitable[Result[T, F]]]
+    ) -> Result[T, F]:
+        return await op(self._error)
+
+    def ok(self) -> None:
+        return None
+
+    def err(self) -> E:
+        return self._error
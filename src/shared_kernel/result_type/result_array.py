@@ -0,0 +1,240 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Sequence,
+)
+from itertools import compress
+from typing import TYPE_CHECKING, Any, Self
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type.result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+NUMPY_REQUIRED_MESSAGE = (
+    "ResultArray.to_numpy requires NumPy. Install it with 'shared-kernel[numpy]'."
+)
+TYPED_COLUMN_MESSAGE = "ResultArray.to_numpy requires a typecode-backed value column."
+COLUMN_LENGTH_MESSAGE = "A vectorized op must return one item per input item."
+COLUMN_TYPE_MESSAGE = "A vectorized op must return a one-dimensional sequence."
+COLUMN_TYPECODE_MESSAGE = "Mapped values do not fit the column typecode."
+NONE_VALUE_MESSAGE = "A mapped Ok value cannot be None."
+
+type Column[T] = MutableSequence[T]
+
+
+class ResultArray[T, E]:
+    """
+    Stores many Results column-wise instead of as one object per Result.
+
+    The layout is an ok mask with one byte per Result, a dense value column and
+    a sparse error column that only holds the errors and their positions. With a
+    `typecode` the value column is an `array.array`, so numeric values cost
+    their machine size instead of a Python object each. Err positions hold a
+    zero (or None in a list column) in the value column.
+
+    The columns are never modified after construction, so derived arrays share
+    them, and the NumPy views handed out are read-only.
+    """
+
+    __slots__ = ("_mask", "_values", "_error_index", "_errors")
+
+    def __init__(
+        self, results: Iterable[Result[T, E]] = (), typecode: str | None = None
+    ) -> None:
+        self._mask = bytearray()
+        self._values: Column[Any] = array(typecode) if typecode else []
+        self._error_index = array("q")
+        self._errors: list[E] = []
+        filler = 0 if typecode else None
+        mask, values = self._mask.append, self._values.append
+        error_index, errors = self._error_index.append, self._errors.append
+        for index, result in enumerate(results):
+            if result._is_ok:
+                mask(1)
+                values(result._value)
+            else:
+                mask(0)
+                values(filler)
+                error_index(index)
+                errors(result._error)  # type: ignore[arg-type]
+
+    @classmethod
+    def _from_columns(
+        cls,
+        mask: bytearray,
+        values: Column[Any],
+        error_index: "array[int]",
+        errors: list[Any],
+    ) -> Self:
+        instance = cls.__new__(cls)
+        instance._mask = mask
+        instance._values = values
+        instance._error_index = error_index
+        instance._errors = errors
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        errors = iter(self._errors)
+        for ok, value in zip(self._mask, self._values):
+            yield Ok(value) if ok else Err(next(errors))
+
+    def __getitem__(self, index: int) -> Result[T, E]:
+        if self._mask[index]:
+            return Ok(self._values[index])
+        position = bisect_left(self._error_index, index % len(self._mask))
+        return Err(self._errors[position])
+
+    @property
+    def typecode(self) -> str | None:
+        values = self._values
+        return values.typecode if isinstance(values, array) else None
+
+    def count_ok(self) -> int:
+        return len(self._mask) - len(self._errors)
+
+    def count_err(self) -> int:
+        return len(self._errors)
+
+    def to_results(self) -> list[Result[T, E]]:
+        return list(self)
+
+    def partition(self) -> tuple[list[T], list[E]]:
+        """Split into the Ok values and the Err errors, like `Result.partition`."""
+        return list(compress(self._values, self._mask)), list(self._errors)
+
+    def map[U](
+        self,
+        op: Callable[[T], U],
+        typecode: str | None = None,
+        vectorized: bool = False,
+    ) -> "ResultArray[U, E]":
+        """
+        Apply `op` to every Ok value; errors are shared, not copied.
+
+        The new value column is checked here, not when it is read: a wrong
+        length, a value that does not fit `typecode` or a None Ok value
+        raise `ArgumentException`.
+
+        Args:
+            op: Called per Ok value, or once with the whole value column when
+                `vectorized` is set. A typed column is passed as a NumPy array
+                if NumPy is installed. Err positions are included in the column
+                and their results are discarded. The op gets a read-only view
+                or a copy of the column, never the column itself.
+            typecode: The `array.array` typecode of the new value column. By
+                default, a vectorized op returning a NumPy array keeps its
+                dtype and any other result becomes a list column.
+            vectorized: Call `op` once on the column instead of per value.
+        """
+        if vectorized:
+            values = self._map_column(op, typecode)  # type: ignore[arg-type]
+        else:
+            filler = 0 if typecode else None
+            mapped = (
+                op(value) if ok else filler
+                for ok, value in zip(self._mask, self._values)
+            )
+            values = _column(mapped, typecode)
+        if not isinstance(values, array) and None in compress(values, self._mask):
+            raise ArgumentException(NONE_VALUE_MESSAGE, "op")
+        return ResultArray._from_columns(
+            self._mask, values, self._error_index, self._errors
+        )
+
+    def map_err[F](
+        self, op: Callable[[E], F], vectorized: bool = False
+    ) -> "ResultArray[T, F]":
+        """Apply `op` to every Err error, or once to the error list if `vectorized`."""
+        if vectorized:
+            errors = list(op(self._errors))  # type: ignore[arg-type, call-overload]
+            if len(errors) != len(self._errors):
+                raise ArgumentException(COLUMN_LENGTH_MESSAGE, "op")
+        else:
+            errors = [op(error) for error in self._errors]
+        return ResultArray._from_columns(
+            self._mask, self._values, self._error_index, errors
+        )
+
+    def to_numpy(self) -> "tuple[NDArray[np.bool_], NDArray[Any]]":
+        """
+        Return the ok mask and the value column as NumPy arrays without copying.
+
+        The arrays are read-only views, because the columns may be shared with
+        the arrays derived by `map` and `map_err`.
+        """
+        try:
+            import numpy as np
+        except ImportError as error:
+            raise ImportError(NUMPY_REQUIRED_MESSAGE) from error
+
+        values = self._values
+        if not isinstance(values, array):
+            raise ArgumentException(TYPED_COLUMN_MESSAGE, "typecode")
+        return (
+            _read_only(np.frombuffer(self._mask, dtype=np.bool_)),
+            _read_only(np.frombuffer(values, dtype=values.typecode)),
+        )
+
+    def _map_column(
+        self, op: Callable[[Sequence[Any]], Any], typecode: str | None
+    ) -> Column[Any]:
+        column: Any = self._values
+        numpy = _optional_numpy() if isinstance(column, array) else None
+        if numpy is not None:
+            column = _read_only(numpy.frombuffer(column, dtype=column.typecode))
+        else:
+            column = column[:]
+        mapped = op(column)
+        if not isinstance(mapped, Collection) or getattr(mapped, "ndim", 1) != 1:
+            raise ArgumentException(COLUMN_TYPE_MESSAGE, "op")
+        if len(mapped) != len(self._mask):
+            raise ArgumentException(COLUMN_LENGTH_MESSAGE, "op")
+        if numpy is not None and isinstance(mapped, numpy.ndarray):
+            code = typecode or mapped.dtype.char
+            if code not in _ARRAY_TYPECODES:
+                return mapped.tolist()  # type: ignore[no-any-return]
+            result = array(code)
+            try:
+                result.frombytes(mapped.astype(code, casting="same_kind").tobytes())
+            except TypeError as error:
+                raise ArgumentException(COLUMN_TYPECODE_MESSAGE, "op") from error
+            return result
+        # Always copied, so the op's own sequence can change without
+        # affecting this column.
+        return _column(mapped, typecode)
+
+
+def _column(values: Iterable[Any], typecode: str | None) -> Column[Any]:
+    if not typecode:
+        return list(values)
+    try:
+        return array(typecode, values)
+    except (TypeError, OverflowError) as error:
+        raise ArgumentException(COLUMN_TYPECODE_MESSAGE, "op") from error
+
+
+def _read_only[A](view: A) -> A:
+    view.flags.writeable = False  # type: ignore[attr-defined]
+    return view
+
+
+def _optional_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+_ARRAY_TYPECODES = frozenset("bBhHiIlLqQfd")
@@ -0,0 +1,229 @@
+import pickle
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.error_struct import Error
+from shared_kernel.error_struct.wire import (
+    ENCODING,
+    TRAILING_DATA_MESSAGE,
+    read_varint,
+    write_varint,
+)
+from shared_kernel.result_type.result import Err, Ok, Result
+
+INVALID_TAG_MESSAGE = "Invalid result tag"
+TRUNCATED_RESULT_MESSAGE = "Truncated result encoding"
+
+_ERR_TAG = 0
+_OK_TAG = 1
+
+type Buffer = bytes | bytearray | memoryview
+
+
+@dataclass(frozen=True, slots=True)
+class Codec[T]:
+    """
+    Converts the value or error of a `Result` to bytes and back.
+
+    `decode` receives a `memoryview` over exactly the encoded payload, sliced
+    from the input buffer without copying.
+    """
+
+    encode: Callable[[T], bytes]
+    decode: Callable[[memoryview], T]
+
+
+def _encode_str(value: str) -> bytes:
+    return value.encode(ENCODING)
+
+
+def _decode_str(view: memoryview) -> str:
+    return str(view, ENCODING)
+
+
+def _encode_int(value: int) -> bytes:
+    return value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+
+
+def _decode_int(view: memoryview) -> int:
+    return int.from_bytes(view, "little", signed=True)
+
+
+STR_CODEC: Codec[str] = Codec(_encode_str, _decode_str)
+BYTES_CODEC: Codec[bytes] = Codec(bytes, bytes)
+INT_CODEC: Codec[int] = Codec(_encode_int, _decode_int)
+ERROR_CODEC: Codec[Error] = Codec(Error.to_bytes, Error.from_bytes)
+PICKLE_CODEC: Codec[Any] = Codec(
+    partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads
+)
+
+
+def encode_result[T, E](
+    result: Result[T, E],
+    value_codec: Codec[T],
+    error_codec: Codec[E] = ERROR_CODEC,  # type: ignore[assignment]
+) -> bytes:
+    """
+    Encode a single `Result` as a tag byte, a varint length and the payload.
+
+    Args:
+        result: The Result to encode.
+        value_codec: Encodes the Ok value. Pass `PICKLE_CODEC` explicitly to
+            pickle it; only decode pickled data from trusted sources.
+        error_codec: Encodes the Err error; expects an `Error` by default.
+
+    Returns:
+        bytes: The encoded Result.
+    """
+    return encode_results((result,), value_codec, error_codec)
+
+
+def decode_result[T, E](
+    data: Buffer,
+    value_codec: Codec[T],
+    error_codec: Codec[E] = ERROR_CODEC,  # type: ignore[assignment]
+) -> Result[T, E]:
+    view = memoryview(data)
+    result, end = _read_result(view, 0, value_codec.decode, error_codec.decode)
+    if end != len(view):
+        raise ArgumentException(TRAILING_DATA_MESSAGE, "data")
+    return result
+
+
+def encode_results[T, E](
+    results: Iterable[Result[T, E]],
+    value_codec: Codec[T],
+    error_codec: Codec[E] = ERROR_CODEC,  # type: ignore[assignment]
+) -> bytes:
+    """
+    Encode many Results back to back into one contiguous buffer.
+
+    Returns:
+        bytes: The concatenated encodings, readable with `decode_results`.
+    """
+    encode_value, encode_error = value_codec.encode, error_codec.encode
+    out = bytearray()
+    append = out.append
+    for result in results:
+        if result._is_ok:
+            append(_OK_TAG)
+            payload = encode_value(result._value)  # type: ignore[arg-type]
+        else:
+            append(_ERR_TAG)
+            payload = encode_error(result._error)  # type: ignore[arg-type]
+        length = len(payload)
+        if length < 0x80:
+            append(length)
+        else:
+            write_varint(out, length)
+        out += payload
+    return bytes(out)
+
+
+def decode_results[T, E](
+    data: Buffer,
+    value_codec: Codec[T],
+    error_codec: Codec[E] = ERROR_CODEC,  # type: ignore[assignment]
+) -> list[Result[T, E]]:
+    """
+    Decode a buffer written by `encode_results`.
+
+    Never decode untrusted input with `PICKLE_CODEC`: unpickling can run
+    arbitrary code.
+
+    The buffer is read through a `memoryview`, so codecs get slices of `data`
+    and nothing is copied before they run.
+    """
+    view = memoryview(data)
+    decode_value, decode_error = value_codec.decode, error_codec.decode
+    results: list[Result[T, E]] = []
+    append = results.append
+    position, end = 0, len(view)
+    # Inlines `_read_result` for the common case of a payload under 128 bytes.
+    while position < end:
+        if position + 1 >= end or view[position + 1] >= 0x80:
+            result, position = _read_result(view, position, decode_value, decode_error)
+            append(result)
+            continue
+        tag = view[position]
+        start = position + 2
+        position = start + view[start - 1]
+        if position > end:
+            raise ArgumentException(TRUNCATED_RESULT_MESSAGE, "data")
+        if tag == _OK_TAG:
+            append(Ok(decode_value(view[start:position])))
+        elif tag == _ERR_TAG:
+            append(Err(decode_error(view[start:position])))
+        else:
+            raise ArgumentException(INVALID_TAG_MESSAGE, str(tag))
+    return results
+
+
+def _read_result[T, E](
+    view: memoryview,
+    position: int,
+    decode_value: Callable[[memoryview], T],
+    decode_error: Callable[[memoryview], E],
+) -> tuple[Result[T, E], int]:
+    tag = view[position]
+    length, start = read_varint(view, position + 1, TRUNCATED_RESULT_MESSAGE)
+    stop = start + length
+    if stop > len(view):
+        raise ArgumentException(TRUNCATED_RESULT_MESSAGE, "data")
+    if tag == _OK_TAG:
+        return Ok(decode_value(view[start:stop])), stop
+    if tag == _ERR_TAG:
+        return Err(decode_error(view[start:stop])), stop
+    raise ArgumentException(INVALID_TAG_MESSAGE, str(tag))
+
+
+class ResultBatch[T, E]:
+    """
+    A list of Results that pickles as one columnar payload.
+
+    Instead of one object per Result, the payload holds an ok-flag column, the
+    Ok values and the Err errors. Return a `ResultBatch` from a process pool
+    worker to send many Results back at once.
+    """
+
+    __slots__ = ("_results",)
+
+    def __init__(self, results: Iterable[Result[T, E]] = ()) -> None:
+        self._results = list(results)
+
+    def __reduce__(self) -> tuple[object, ...]:
+        results = self._results
+        flags = bytes([result._is_ok for result in results])
+        values = [result._value for result in results if result._is_ok]
+        errors = [result._error for result in results if not result._is_ok]
+        return _unpack_batch, (flags, values, errors)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        return iter(self._results)
+
+    def __getitem__(self, index: int) -> Result[T, E]:
+        return self._results[index]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ResultBatch) and self._results == other._results
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def results(self) -> list[Result[T, E]]:
+        return self._results
+
+
+def _unpack_batch[T, E](
+    flags: bytes, values: list[T], errors: list[E]
+) -> ResultBatch[T, E]:
+    next_value, next_error = iter(values).__next__, iter(errors).__next__
+    batch: ResultBatch[T, E] = ResultBatch()
+    batch._results = [Ok(next_value()) if flag else Err(next_error()) for flag in flags]
+    return batch
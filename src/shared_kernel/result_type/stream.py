@@ -0,0 +1,191 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from itertools import islice
+from typing import Any, ClassVar
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type.result import Result
+from shared_kernel.result_type.serialization import ResultBatch
+
+DEFAULT_CHUNKSIZE = 256
+DEFAULT_MAX_IN_FLIGHT = 8
+
+type _Stage = tuple[str, Callable[..., Any], Executor | None, int, int]
+
+
+class ResultStream[T, E]:
+    """
+    A lazy pipeline of `map`, `and_then` and `filter` stages over an iterable.
+
+    Iterating the stream yields the values that made it through every stage.
+    A stage that returns an `Err` sends its error to the side channel, which
+    is `on_err` if given and the stream's own `errors` list otherwise, and the
+    stream goes on with the next item. Each iteration starts a new `errors`
+    list, so iterating twice does not report an error twice.
+
+    A stage given an `executor` runs in chunks of `chunksize` items with at
+    most `max_in_flight` chunks submitted at a time, and yields results in
+    input order. With a `ProcessPoolExecutor`, stage functions must be
+    picklable.
+    """
+
+    _MAP: ClassVar[str] = "map"
+    _AND_THEN: ClassVar[str] = "and_then"
+    _FILTER: ClassVar[str] = "filter"
+
+    __slots__ = ("_source", "_stages", "_on_err", "_errors")
+
+    def __init__(
+        self,
+        source: Iterable[T],
+        on_err: Callable[[E], object] | None = None,
+    ) -> None:
+        ArgumentException.raise_if_none(source, "source")
+        self._source: Iterable[Any] = source
+        self._stages: tuple[_Stage, ...] = ()
+        self._errors: list[E] = []
+        self._on_err = on_err
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[Result[T, E]],
+        on_err: Callable[[E], object] | None = None,
+    ) -> "ResultStream[T, E]":
+        """Stream the values of Ok results and send Errs to the side channel."""
+        stream: ResultStream[Result[T, E], E] = cls(results, on_err)  # type: ignore[arg-type, assignment]
+        return stream.and_then(_identity)
+
+    @property
+    def errors(self) -> list[E]:
+        """The errors of the latest iteration; empty if `on_err` was given."""
+        return self._errors
+
+    def __iter__(self) -> Iterator[T]:
+        on_err = self._on_err
+        if on_err is None:
+            errors: list[E] = []
+            self._errors, on_err = errors, errors.append
+        items: Iterator[Any] = iter(self._source)
+        for kind, op, executor, chunksize, max_in_flight in self._stages:
+            if executor is None:
+                items = _run(kind, op, items, on_err)
+            else:
+                items = _run_parallel(
+                    kind, op, items, on_err, executor, chunksize, max_in_flight
+                )
+        return items
+
+    def map[U](
+        self,
+        op: Callable[[T], U],
+        executor: Executor | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> "ResultStream[U, E]":
+        return self._then(self._MAP, op, executor, chunksize, max_in_flight)
+
+    def and_then[U](
+        self,
+        op: Callable[[T], Result[U, E]],
+        executor: Executor | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> "ResultStream[U, E]":
+        return self._then(self._AND_THEN, op, executor, chunksize, max_in_flight)
+
+    def filter(
+        self,
+        predicate: Callable[[T], bool],
+        executor: Executor | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> "ResultStream[T, E]":
+        return self._then(self._FILTER, predicate, executor, chunksize, max_in_flight)
+
+    def _then(
+        self,
+        kind: str,
+        op: Callable[..., Any],
+        executor: Executor | None,
+        chunksize: int,
+        max_in_flight: int,
+    ) -> Any:
+        ArgumentException.raise_if_none(op, "op")
+        ArgumentException.raise_if_out_of_range(chunksize, 1, param="chunksize")
+        ArgumentException.raise_if_out_of_range(max_in_flight, 1, param="max_in_flight")
+        stream = ResultStream.__new__(ResultStream)
+        stream._source = self._source
+        stream._stages = self._stages + (
+            (kind, op, executor, chunksize, max_in_flight),
+        )
+        stream._errors = []
+        stream._on_err = self._on_err
+        return stream
+
+
+def _run(
+    kind: str,
+    op: Callable[..., Any],
+    items: Iterator[Any],
+    on_err: Callable[[Any], object],
+) -> Iterator[Any]:
+    if kind == ResultStream._MAP:
+        return map(op, items)
+    if kind == ResultStream._FILTER:
+        return filter(op, items)
+    return _unwrap(map(op, items), on_err)
+
+
+def _run_parallel(
+    kind: str,
+    op: Callable[..., Any],
+    items: Iterator[Any],
+    on_err: Callable[[Any], object],
+    executor: Executor,
+    chunksize: int,
+    max_in_flight: int,
+) -> Iterator[Any]:
+    pending: deque[Future[Any]] = deque()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                chunk = list(islice(items, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_run_chunk, kind, op, chunk))
+            if not pending:
+                return
+            done = pending.popleft().result()
+            if kind == ResultStream._AND_THEN:
+                yield from _unwrap(iter(done), on_err)
+            else:
+                yield from done
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _unwrap(
+    results: Iterator[Result[Any, Any]], on_err: Callable[[Any], object]
+) -> Iterator[Any]:
+    for result in results:
+        if result._is_ok:
+            yield result._value
+        else:
+            on_err(result._error)
+
+
+def _run_chunk(kind: str, op: Callable[..., Any], chunk: list[Any]) -> Any:
+    match kind:
+        case ResultStream._MAP:
+            return [op(item) for item in chunk]
+        case ResultStream._FILTER:
+            return [item for item in chunk if op(item)]
+        case _:
+            return ResultBatch(op(item) for item in chunk)
+
+
+def _identity[R](result: R) -> R:
+    return result
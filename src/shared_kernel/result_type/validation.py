@@ -0,0 +1,115 @@
+from collections.abc import Sized
+from typing import TYPE_CHECKING
+
+from shared_kernel.design_by_contract.arguments import ArgumentException
+from shared_kernel.result_type.result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    from shared_kernel.error_struct import Error
+
+type Failures = list[ArgumentException | Error]
+
+
+def try_none[T](arg: T | None, param: str | None = None) -> Result[T, Failures]:
+    if arg is None:
+        return Err([ArgumentException(ArgumentException.NONE_ARGUMENT_MESSAGE, param)])
+    return Ok(arg)
+
+
+def try_none_or_empty[S: Sized](
+    arg: S | None, param: str | None = None
+) -> Result[S, Failures]:
+    match arg:
+        case None:
+            return try_none(arg, param)
+        case Sized() as sized if len(sized) == 0:
+            return Err(
+                [ArgumentException(ArgumentException.EMPTY_ARGUMENT_MESSAGE, param)]
+            )
+    return Ok(arg)
+
+
+def try_none_or_whitespace(
+    arg: str | None, param: str | None = None
+) -> Result[str, Failures]:
+    match arg:
+        case None:
+            return try_none(arg, param)
+        case str() as string if string.isspace():
+            return Err(
+                [
+                    ArgumentException(
+                        ArgumentException.WHITESPACE_ARGUMENT_MESSAGE, param
+                    )
+                ]
+            )
+    return Ok(arg)
+
+
+def validate_all(
+    *results: Result[object, Failures],
+) -> Result[tuple[object, ...], Failures]:
+    """
+    Combine validation results, collecting every failure instead of the first.
+
+    Returns:
+        Result[tuple[object, ...], Failures]: The validated values in argument
+        order, or all failures of all Err results.
+    """
+    for result in results:
+        if not result._is_ok:
+            break
+    else:
+        return Ok(tuple([result._value for result in results]))
+
+    failures: Failures = []
+    for result in results:
+        if not result._is_ok:
+            failures += result._error  # type: ignore[arg-type]
+    return Err(failures)
+
+
+def collect_none[T](failures: Failures, arg: T | None, param: str | None = None) -> T:
+    """
+    Append an `ArgumentException` to `failures` if `arg` is None.
+
+    The `collect_*` checks return their argument unchanged, so the fields of a
+    record are validated into one shared list without building a `Result` per
+    field; `collected` turns the list into the record's single `Result`.
+    """
+    if arg is None:
+        failures.append(
+            ArgumentException(ArgumentException.NONE_ARGUMENT_MESSAGE, param)
+        )
+    return arg  # type: ignore[return-value]
+
+
+def collect_none_or_empty[S: Sized](
+    failures: Failures, arg: S | None, param: str | None = None
+) -> S:
+    if arg is None:
+        return collect_none(failures, arg, param)
+    # `hasattr` rather than `isinstance(arg, Sized)`, which walks the ABC
+    # registry and costs more than the rest of the check.
+    if hasattr(arg, "__len__") and len(arg) == 0:
+        failures.append(
+            ArgumentException(ArgumentException.EMPTY_ARGUMENT_MESSAGE, param)
+        )
+    return arg
+
+
+def collect_none_or_whitespace(
+    failures: Failures, arg: str | None, param: str | None = None
+) -> str:
+    if arg is None:
+        return collect_none(failures, arg, param)
+    if isinstance(arg, str) and arg.isspace():
+        failures.append(
+            ArgumentException(ArgumentException.WHITESPACE_ARGUMENT_MESSAGE, param)
+        )
+    return arg
+
+
+def collected[T](failures: Failures, value: T) -> Result[T, Failures]:
+    """Return `Ok(value)`, or `Err(failures)` if any check failed."""
+    return Err(failures) if failures else Ok(value)
@@ -82,3 +82,26 @@ def test_argument_exception_raise_if_none_or_whitespace_when_valid_should_not_ra
     None
 ):
     assert ArgumentException.raise_if_none_or_whitespace("valid", "test_param") is None
+
+
+def test_argument_exception_raise_if_out_of_range_when_none_should_raise_exception() -> (
+    None
+):
+    with pytest.raises(ArgumentException, match="Argument cannot be none."):
+        ArgumentException.raise_if_out_of_range(None, 0, 10, "test_param")
+
+
+def test_argument_exception_raise_if_out_of_range_when_outside_should_raise_exception() -> (
+    None
+):
+    with pytest.raises(
+        ArgumentException, match="Value does not fall within the expected range."
+    ):
+        ArgumentException.raise_if_out_of_range(11, 0, 10, "test_param")
+
+
+def test_argument_exception_raise_if_out_of_range_when_on_bound_should_not_raise() -> (
+    None
+):
+    assert ArgumentException.raise_if_out_of_range(10, 0, 10, "test_param") is None
+    assert ArgumentException.raise_if_out_of_range(-5, maximum=0) is None
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from shared_kernel import (
+    ArgumentException,
+    AsyncResult,
+    Err,
+    Ok,
+    Result,
+    gather_results,
+)
+
+
+async def _double(x: int) -> int:
+    return x * 2
+
+
+async def _positive(x: int) -> Result[int, str]:
+    return Ok(x) if x > 0 else Err("not positive")
+
+
+async def _length(e: str) -> int:
+    return len(e)
+
+
+def test_map_async_when_ok_then_awaits_function() -> None:
+    assert asyncio.run(Ok(21).map_async(_double)) == Ok(42)
+
+
+def test_map_async_when_err_then_preserves_error() -> None:
+    assert asyncio.run(Err("error").map_async(_double)) == Err("error")
+
+
+def test_and_then_async_when_ok_then_chains_result() -> None:
+    assert asyncio.run(Ok(-1).and_then_async(_positive)) == Err("not positive")
+
+
+def test_map_err_async_when_err_then_awaits_function() -> None:
+    assert asyncio.run(Err("error").map_err_async(_length)) == Err(5)
+
+
+def test_or_else_async_when_ok_then_returns_value() -> None:
+    async def recover(e: str) -> Result[int, str]:
+        return Ok(0)
+
+    assert asyncio.run(Ok(1).or_else_async(recover)) == Ok(1)
+    assert asyncio.run(Err("e").or_else_async(recover)) == Ok(0)
+
+
+def test_async_variants_when_called_on_plain_result_then_match_subclasses() -> None:
+    ok: Result[int, str] = Result(True, 21, None)
+    err: Result[int, str] = Result(False, None, "error")
+    assert asyncio.run(ok.map_async(_double)) == Ok(42)
+    assert asyncio.run(ok.and_then_async(_positive)) == Ok(21)
+    assert asyncio.run(err.map_err_async(_length)) == Err(5)
+    assert asyncio.run(err.map_async(_double)) is err
+
+
+def test_async_result_when_chaining_sync_and_async_steps_then_applies_in_order() -> (
+    None
+):
+    async def run() -> Result[int, int]:
+        return await (
+            AsyncResult.from_result(Ok(10))
+            .map(lambda x: x + 1)
+            .map_async(_double)
+            .and_then_async(_positive)
+            .and_then(lambda x: Err("too big") if x > 20 else Ok(x))
+            .map_err_async(_length)
+        )
+
+    assert asyncio.run(run()) == Err(7)
+
+
+def test_async_result_when_chaining_then_does_not_create_tasks() -> None:
+    async def run() -> tuple[Result[int, str], int]:
+        before = len(asyncio.all_tasks())
+        chain = AsyncResult.from_result(Ok(1)).map_async(_double).map(str)
+        during = len(asyncio.all_tasks())
+        return await chain, during - before
+
+    result, created = asyncio.run(run())
+    assert result == Ok("2")
+    assert created == 0
+
+
+def test_gather_results_when_all_ok_then_returns_values_in_input_order() -> None:
+    async def delayed(x: int) -> Result[int, str]:
+        await asyncio.sleep(0.001 * (5 - x))
+        return Ok(x)
+
+    result = asyncio.run(gather_results([delayed(x) for x in range(5)], limit=2))
+    assert result == Ok([0, 1, 2, 3, 4])
+
+
+def test_gather_results_when_limited_then_never_exceeds_limit() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def tracked(x: int) -> Result[int, str]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return Ok(x)
+
+    result = asyncio.run(gather_results((tracked(x) for x in range(20)), limit=3))
+    assert result == Ok(list(range(20)))
+    assert peak == 3
+
+
+def test_gather_results_when_fail_fast_then_cancels_running_and_skips_rest() -> None:
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def step(x: int) -> Result[int, str]:
+        started.append(x)
+        try:
+            await asyncio.sleep(0 if x == 1 else 1)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return Err("boom") if x == 1 else Ok(x)
+
+    result = asyncio.run(gather_results([step(x) for x in range(10)], limit=3))
+    assert result == Err("boom")
+    assert started == [0, 1, 2]
+    assert sorted(cancelled) == [0, 2]
+
+
+def test_gather_results_when_not_fail_fast_then_returns_first_err_by_position() -> None:
+    async def step(x: int) -> Result[int, str]:
+        await asyncio.sleep(0.001 * (10 - x))
+        return Err(f"error{x}") if x in (3, 7) else Ok(x)
+
+    result = asyncio.run(
+        gather_results([step(x) for x in range(10)], limit=4, fail_fast=False)
+    )
+    assert result == Err("error3")
+
+
+def test_gather_results_when_empty_then_returns_ok_empty_list() -> None:
+    assert asyncio.run(gather_results([])) == Ok([])
+
+
+def test_gather_results_when_limit_below_one_then_raises_argument_exception() -> None:
+    with pytest.raises(ArgumentException) as exc:
+        asyncio.run(gather_results([], limit=0))
+
+    assert exc.value.param_name == "limit"
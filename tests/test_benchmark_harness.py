@@ -0,0 +1,61 @@
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from benchmarks import harness
+from benchmarks.harness import Case, Measurement, Regression
+
+
+def _measurement(name: str, ns_per_op: float) -> Measurement:
+    return Measurement(name, ns_per_op, number=1, ops=1, repeat=1)
+
+
+def test_compare_when_slower_than_threshold_then_reports_regression() -> None:
+    current = {"a": _measurement("a", 130.0), "b": _measurement("b", 110.0)}
+
+    regressions = harness.compare(current, {"a": 100.0, "b": 100.0}, threshold=0.2)
+
+    assert regressions == [Regression("a", 100.0, 130.0)]
+    assert regressions[0].ratio == 1.3
+
+
+def test_compare_when_at_threshold_or_faster_then_reports_nothing() -> None:
+    current = {"a": _measurement("a", 120.0), "b": _measurement("b", 50.0)}
+
+    assert harness.compare(current, {"a": 100.0, "b": 100.0}, threshold=0.2) == []
+
+
+def test_compare_when_case_missing_from_baseline_then_skips_it() -> None:
+    current = {"new": _measurement("new", 1_000.0)}
+
+    assert harness.compare(current, {}, threshold=0.0) == []
+
+
+def test_compare_when_baseline_has_extra_case_then_ignores_it() -> None:
+    current = {"a": _measurement("a", 100.0)}
+
+    assert harness.compare(current, {"a": 100.0, "gone": 1.0}, threshold=0.0) == []
+
+
+def test_load_baseline_when_dumped_then_reads_ns_per_op(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    harness.dump({"a": _measurement("a", 12.5), "b": _measurement("b", 3.0)}, str(path))
+
+    assert harness.load_baseline(str(path)) == {"a": 12.5, "b": 3.0}
+    assert set(json.loads(path.read_text())) >= {"python", "results"}
+
+
+def test_measure_when_setup_is_context_manager_then_exits_after_timing() -> None:
+    events: list[str] = []
+
+    @contextmanager
+    def setup() -> Iterator[object]:
+        events.append("enter")
+        yield lambda: events.append("run")
+        events.append("exit")
+
+    measurement = harness.measure(Case("cm", setup, number=2, ops=1), repeat=1)
+
+    assert events == ["enter", "run", "run", "exit"]
+    assert measurement.number == 2
@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Self
+
+import pytest
+
+from shared_kernel.abstractions import try_from_many, try_into_many
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import Err, Ok, Result
+
+
+@dataclass(frozen=True)
+class Port:
+    value: int
+
+    @classmethod
+    def try_from(cls, source: str) -> Result[Self, str]:
+        return Ok(cls(int(source))) if source.isdigit() else Err(source)
+
+    def try_into(self) -> Result[str, str]:
+        return Ok(str(self.value)) if self.value < 1000 else Err(str(self.value))
+
+
+def test_try_from_many_when_all_ok_then_returns_values_in_order() -> None:
+    sources = [str(number) for number in range(100)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = try_from_many(Port, sources, executor=executor, chunksize=7)
+
+    assert result == Ok([Port(number) for number in range(100)])
+
+
+def test_try_from_many_when_errors_then_returns_first_err_in_order() -> None:
+    sources = ["1", "a", "2", "b"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = try_from_many(Port, sources, executor=executor, chunksize=1)
+
+    assert result == Err("a")
+    assert try_from_many(Port, sources) == Err("a")
+
+
+def test_try_from_many_when_partition_then_returns_values_and_errors() -> None:
+    sources = ["1", "a", "2", "b"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        partitioned = try_from_many(
+            Port, sources, executor=executor, chunksize=1, partition=True
+        )
+
+    assert partitioned == ([Port(1), Port(2)], ["a", "b"])
+
+
+def test_try_from_many_when_fail_fast_then_stops_after_first_err() -> None:
+    seen: list[str] = []
+
+    def sources():
+        for number in range(10_000):
+            seen.append(str(number))
+            yield "x" if number == 3 else str(number)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        partitioned = try_from_many(
+            Port,
+            sources(),
+            executor=executor,
+            chunksize=2,
+            max_in_flight=2,
+            fail_fast=True,
+            partition=True,
+        )
+
+    assert partitioned == ([Port(0), Port(1), Port(2)], ["x"])
+    assert len(seen) <= 8
+
+
+def test_try_into_many_when_serial_then_converts_every_source() -> None:
+    ports = [Port(80), Port(8080), Port(443)]
+
+    assert try_into_many(ports) == Err("8080")
+    assert try_into_many(ports, partition=True) == (["80", "443"], ["8080"])
+
+
+def test_try_from_many_when_chunksize_invalid_then_raises() -> None:
+    with pytest.raises(ArgumentException) as raised:
+        try_from_many(Port, ["1"], chunksize=0)
+    assert raised.value.param_name == "chunksize"
@@ -0,0 +1,95 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.error_struct import Error
+from shared_kernel.result_type import Err, Ok, catch
+
+NOT_FOUND = Error("E404", "missing")
+
+
+@catch(
+    {
+        OSError: HTTPStatus.SERVICE_UNAVAILABLE,
+        FileNotFoundError: NOT_FOUND,
+        ValueError: lambda error: Error("E400", str(error)),
+        KeyError: "E422:unknown key",
+    }
+)
+def load(kind: str) -> str:
+    match kind:
+        case "missing":
+            raise FileNotFoundError(kind)
+        case "down":
+            raise ConnectionError(kind)
+        case "bad":
+            raise ValueError("bad value")
+        case "key":
+            raise KeyError(kind)
+        case "type":
+            raise TypeError(kind)
+    return kind
+
+
+def test_catch_when_no_exception_then_returns_ok() -> None:
+    assert load("data") == Ok("data")
+
+
+def test_catch_when_mapped_to_error_then_shares_one_instance() -> None:
+    first, second = load("missing"), load("missing")
+
+    assert first == Err(NOT_FOUND)
+    assert first.err() is NOT_FOUND
+    assert first is second
+
+
+def test_catch_when_subclass_raised_then_uses_nearest_mapped_base() -> None:
+    result = load("down")
+
+    assert result == Err(Error.from_(HTTPStatus.SERVICE_UNAVAILABLE))
+    assert result.err() is Error.from_(HTTPStatus.SERVICE_UNAVAILABLE)
+
+
+def test_catch_when_mapped_to_callable_then_builds_error_from_exception() -> None:
+    assert load("bad") == Err(Error("E400", "bad value"))
+
+
+def test_catch_when_mapped_to_str_then_parses_error_once() -> None:
+    assert load("key") == Err(Error("E422", "unknown key"))
+
+
+def test_catch_when_exception_not_listed_then_propagates() -> None:
+    with pytest.raises(TypeError):
+        load("type")
+
+
+def test_catch_when_function_returns_result_then_passes_it_through() -> None:
+    @catch({ValueError: NOT_FOUND})
+    def parse(raw: str):
+        return Err("empty") if not raw else int(raw)
+
+    assert parse("") == Err("empty")
+    assert parse("3") == Ok(3)
+    assert parse("x") == Err(NOT_FOUND)
+
+
+def test_catch_when_coroutine_function_then_catches_awaited_exceptions() -> None:
+    @catch({TimeoutError: HTTPStatus.GATEWAY_TIMEOUT})
+    async def fetch(fail: bool) -> str:
+        if fail:
+            raise TimeoutError
+        return "body"
+
+    assert asyncio.run(fetch(False)) == Ok("body")
+    assert asyncio.run(fetch(True)) == Err(Error.from_(HTTPStatus.GATEWAY_TIMEOUT))
+
+
+@pytest.mark.parametrize(
+    "mapping",
+    [{}, {"ValueError": NOT_FOUND}, {ValueError: 404}],
+)
+def test_catch_when_mapping_invalid_then_raises(mapping: dict) -> None:
+    with pytest.raises(ArgumentException):
+        catch(mapping)
@@ -0,0 +1,216 @@
+import asyncio
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from inspect import iscoroutinefunction
+
+import pytest
+
+from shared_kernel import (
+    ArgumentException,
+    ContractMode,
+    Ok,
+    catch,
+    configure_contracts,
+    contract_mode,
+    ensures,
+    requires,
+)
+
+raise_if_none = ArgumentException.raise_if_none
+raise_if_none_or_empty = ArgumentException.raise_if_none_or_empty
+raise_if_none_or_whitespace = ArgumentException.raise_if_none_or_whitespace
+
+
+@pytest.fixture(autouse=True)
+def restore_contract_mode() -> Iterator[None]:
+    mode, sample_rate = contract_mode()
+    yield
+    configure_contracts(mode, sample_rate)
+
+
+def test_requires_when_on_and_argument_invalid_then_raises_with_param_name() -> None:
+    @requires(name=raise_if_none_or_whitespace)
+    def greet(name: str) -> str:
+        return f"hello {name}"
+
+    assert greet("bob") == "hello bob"
+    with pytest.raises(ArgumentException) as exc:
+        greet("   ")
+
+    assert exc.value.message == (
+        "String argument cannot be whitespace. (Parameter 'name')"
+    )
+
+
+def test_requires_when_given_keyword_defaults_and_methods_then_resolves_values() -> (
+    None
+):
+    class Repository:
+        @requires(
+            key=raise_if_none_or_empty, tags=(raise_if_none, raise_if_none_or_empty)
+        )
+        def find(self, key: str, *, tags: list[str] | None = None) -> str:
+            return key
+
+    repository = Repository()
+    assert repository.find("a", tags=["x"]) == "a"
+    assert repository.find(key="b", tags=["x"]) == "b"
+    with pytest.raises(ArgumentException, match="none") as exc:
+        repository.find("a")
+    assert exc.value.param_name == "tags"
+    with pytest.raises(ArgumentException, match="empty"):
+        repository.find("a", tags=[])
+
+
+def test_requires_when_wrapping_then_preserves_metadata() -> None:
+    @requires(value=raise_if_none)
+    def documented(value: int) -> int:
+        """Docs."""
+        return value
+
+    assert documented.__name__ == "documented"
+    assert documented.__doc__ == "Docs."
+
+
+def test_requires_when_parameter_unknown_then_raises_at_decoration() -> None:
+    with pytest.raises(ArgumentException) as exc:
+
+        @requires(missing=raise_if_none)
+        def function(value: int) -> int:
+            return value
+
+    assert exc.value.param_name == "missing"
+
+
+def test_requires_when_off_then_returns_original_function() -> None:
+    configure_contracts(ContractMode.OFF)
+
+    def function(value: int | None) -> int | None:
+        return value
+
+    assert requires(value=raise_if_none)(function) is function
+    assert ensures(raise_if_none)(function) is function
+
+
+def test_requires_when_sampled_then_checks_one_call_in_n() -> None:
+    configure_contracts(ContractMode.SAMPLED, sample_rate=3)
+    checked: list[object] = []
+
+    def guard(value: object, param: str | None) -> None:
+        checked.append(value)
+
+    @requires(value=guard)
+    def function(value: int) -> int:
+        return value
+
+    assert [function(i) for i in range(7)] == list(range(7))
+    assert checked == [0, 3, 6]
+
+
+def test_configure_contracts_when_mode_changes_then_existing_wrappers_keep_mode() -> (
+    None
+):
+    @requires(value=raise_if_none)
+    def function(value: int | None) -> int | None:
+        return value
+
+    configure_contracts("off")
+    with pytest.raises(ArgumentException):
+        function(None)
+
+
+@pytest.mark.parametrize("mode", ["sometimes", "on:5", "sampled:0", "sampled:x"])
+def test_configure_contracts_when_mode_invalid_then_raises(mode: str) -> None:
+    with pytest.raises(ArgumentException) as exc:
+        configure_contracts(mode)
+
+    assert exc.value.param_name == "mode"
+
+
+def test_configure_contracts_when_sampled_string_then_parses_rate() -> None:
+    configure_contracts("sampled:25")
+    assert contract_mode() == (ContractMode.SAMPLED, 25)
+
+
+def test_ensures_when_result_invalid_then_raises_with_return_param() -> None:
+    @ensures(raise_if_none_or_empty)
+    def load(items: list[int]) -> list[int]:
+        return items
+
+    assert load([1]) == [1]
+    with pytest.raises(ArgumentException) as exc:
+        load([])
+
+    assert exc.value.param_name == "return"
+
+
+def test_ensures_when_coroutine_function_then_checks_awaited_result() -> None:
+    @ensures(raise_if_none)
+    async def fetch(value: int | None) -> int | None:
+        return value
+
+    assert asyncio.run(fetch(1)) == 1
+    with pytest.raises(ArgumentException):
+        asyncio.run(fetch(None))
+
+
+@pytest.mark.parametrize("mode", [ContractMode.ON, ContractMode.SAMPLED])
+def test_requires_when_coroutine_function_under_catch_then_returns_err(
+    mode: ContractMode,
+) -> None:
+    configure_contracts(mode, sample_rate=1)
+
+    @catch({ArgumentException: "invalid"})
+    @requires(value=raise_if_none)
+    async def fetch(value: int | None) -> int | None:
+        return value
+
+    assert iscoroutinefunction(fetch)
+    assert asyncio.run(fetch(1)) == Ok(1)
+    assert asyncio.run(fetch(None)).is_err()
+
+
+def test_ensures_when_sampled_then_checks_one_call_in_n() -> None:
+    configure_contracts(ContractMode.SAMPLED, sample_rate=2)
+
+    @ensures(raise_if_none)
+    def identity(value: int | None) -> int | None:
+        return value
+
+    with pytest.raises(ArgumentException):
+        identity(None)
+    assert identity(None) is None
+    with pytest.raises(ArgumentException):
+        identity(None)
+
+
+@pytest.mark.parametrize(
+    "flags, env, expected",
+    [
+        (["-O"], {}, "off"),
+        ([], {"SHARED_KERNEL_CONTRACTS": "off"}, "off"),
+        ([], {"SHARED_KERNEL_CONTRACTS": "sampled:10"}, "sampled 10"),
+        ([], {}, "on"),
+    ],
+)
+def test_contract_mode_when_process_starts_then_reads_optimize_flag_and_env(
+    flags: list[str], env: dict[str, str], expected: str
+) -> None:
+    script = (
+        "from shared_kernel import contract_mode;"
+        "mode, rate = contract_mode();"
+        "print(mode if mode != 'sampled' else f'{mode} {rate}')"
+    )
+    environment = {
+        k: v for k, v in os.environ.items() if k != "SHARED_KERNEL_CONTRACTS"
+    }
+    output = subprocess.run(
+        [sys.executable, *flags, "-c", script],
+        env={**environment, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.strip() == expected
@@ -0,0 +1,108 @@
+from http import HTTPStatus
+
+import pytest
+
+from shared_kernel import ArgumentException, Error, ErrorCatalog
+
+NOT_FOUND = Error("404", "Not Found")
+CONFLICT = Error("409", "Conflict")
+
+
+def test_register_when_new_codes_then_assigns_sequential_ids_from_one() -> None:
+    catalog = ErrorCatalog()
+    assert catalog.register(NOT_FOUND) == 1
+    assert catalog.register(CONFLICT) == 2
+    assert len(catalog) == 2
+
+
+def test_register_when_code_already_known_then_returns_existing_id() -> None:
+    catalog = ErrorCatalog([NOT_FOUND])
+    assert catalog.register(Error("404", "Other description")) == 1
+    assert catalog.get(1) is NOT_FOUND
+
+
+def test_lookups_when_registered_then_resolve_by_id_code_and_error() -> None:
+    catalog = ErrorCatalog([NOT_FOUND, CONFLICT])
+    assert catalog.get(2) is CONFLICT
+    assert catalog.lookup("404") is NOT_FOUND
+    assert catalog.id_of("409") == 2
+    assert catalog.id_of(Error("409")) == 2
+    assert catalog.canonical(Error("404")) is NOT_FOUND
+    assert "404" in catalog and Error("409") in catalog
+    assert list(catalog) == [NOT_FOUND, CONFLICT]
+
+
+def test_lookups_when_unknown_then_return_none_or_input() -> None:
+    catalog = ErrorCatalog([NOT_FOUND])
+    unknown = Error("E999", "Unknown")
+    assert catalog.lookup("E999") is None
+    assert catalog.id_of(unknown) is None
+    assert catalog.canonical(unknown) is unknown
+    assert "E999" not in catalog
+
+
+@pytest.mark.parametrize("error_id", [0, 2, -1])
+def test_get_when_id_unknown_then_raises_argument_exception(error_id: int) -> None:
+    with pytest.raises(ArgumentException, match="Unknown error id"):
+        ErrorCatalog([NOT_FOUND]).get(error_id)
+
+
+def test_encode_when_all_errors_known_then_uses_one_byte_each() -> None:
+    catalog = ErrorCatalog([NOT_FOUND, CONFLICT])
+    assert catalog.encode([CONFLICT, NOT_FOUND, CONFLICT]) == bytes([2, 1, 2])
+
+
+def test_decode_when_errors_known_then_returns_canonical_instances() -> None:
+    catalog = ErrorCatalog([NOT_FOUND, CONFLICT])
+    decoded = catalog.decode(catalog.encode([Error("404"), Error("409")]))
+    assert decoded[0] is NOT_FOUND and decoded[1] is CONFLICT
+
+
+def test_encode_when_error_unknown_then_writes_code_and_description() -> None:
+    catalog = ErrorCatalog([NOT_FOUND])
+    unknown = Error("E042", "Something odd")
+    encoded = catalog.encode([NOT_FOUND, unknown])
+    assert encoded.endswith(b"\x00\x04E042\x0dSomething odd")
+
+    decoded = catalog.decode(encoded)
+    assert decoded == [NOT_FOUND, unknown]
+    assert decoded[1].description == "Something odd"
+
+
+def test_round_trip_when_unknown_description_contains_colons_then_keeps_it() -> None:
+    catalog = ErrorCatalog([NOT_FOUND])
+    unknown = Error("X9", "time: 12:30")
+
+    decoded = catalog.decode(catalog.encode([unknown, NOT_FOUND]))
+
+    assert decoded == [unknown, NOT_FOUND]
+    assert (decoded[0].code, decoded[0].description) == ("X9", "time: 12:30")
+
+
+def test_round_trip_when_ids_exceed_one_byte_then_uses_varints() -> None:
+    catalog = ErrorCatalog(Error(f"E{i}") for i in range(1, 20_000))
+    errors = [catalog.get(1), catalog.get(127), catalog.get(128), catalog.get(19_999)]
+    encoded = catalog.encode(errors)
+    assert len(encoded) == 1 + 1 + 2 + 3
+    assert catalog.decode(encoded) == errors
+
+
+def test_decode_when_given_memoryview_then_decodes() -> None:
+    catalog = ErrorCatalog([NOT_FOUND])
+    assert catalog.decode(memoryview(catalog.encode([NOT_FOUND]))) == [NOT_FOUND]
+
+
+def test_decode_when_empty_then_returns_empty_list() -> None:
+    assert ErrorCatalog().decode(b"") == []
+
+
+@pytest.mark.parametrize("data", [b"\x05", b"\x80", b"\x00\x10abc"])
+def test_decode_when_data_invalid_then_raises_argument_exception(data: bytes) -> None:
+    with pytest.raises(ArgumentException):
+        ErrorCatalog([NOT_FOUND]).decode(data)
+
+
+def test_from_http_status_when_created_then_contains_every_status() -> None:
+    catalog = ErrorCatalog.from_http_status()
+    assert len(catalog) == len(HTTPStatus)
+    assert catalog.lookup("404") is Error.from_(HTTPStatus.NOT_FOUND)
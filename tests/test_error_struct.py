@@ -87,3 +87,96 @@ def test_error_idempotence_when_converted_to_string_and_back_with_empty_descript
     assert original_error == reconstructed_error
     assert original_error.code == reconstructed_error.code
     assert original_error.description == reconstructed_error.description == ""
+
+
+def test_error_from_when_same_string_parsed_twice_then_returns_same_instance() -> None:
+    assert Error.from_("409:Conflict") is Error.from_("409:Conflict")
+
+
+def test_error_from_when_same_http_status_converted_twice_then_returns_same_instance() -> (
+    None
+):
+    assert Error.from_(HTTPStatus.CONFLICT) is Error.from_(HTTPStatus.CONFLICT)
+
+
+def test_error_from_when_every_http_status_converted_then_matches_status() -> None:
+    for status in HTTPStatus:
+        error = Error.from_(status)
+        assert (error.code, error.description) == (str(status.value), status.phrase)
+
+
+def test_error_cache_info_when_parsing_repeatedly_then_counts_hits_and_misses() -> None:
+    Error.cache_clear()
+    Error.from_("400:Bad Request")
+    Error.from_("400:Bad Request")
+    Error.from_("401:Unauthorized")
+
+    info = Error.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_error_cache_clear_when_called_then_next_parse_returns_new_instance() -> None:
+    first = Error.from_("410:Gone")
+    Error.cache_clear()
+    second = Error.from_("410:Gone")
+    assert first is not second and first == second
+    assert Error.cache_info().currsize == 1
+
+
+def test_error_set_cache_size_when_bounded_then_evicts_least_recently_used() -> None:
+    Error.set_cache_size(2)
+    try:
+        first = Error.from_("1:a")
+        Error.from_("2:b")
+        Error.from_("3:c")
+        assert Error.cache_info().maxsize == 2
+        assert Error.cache_info().currsize == 2
+        assert Error.from_("1:a") is not first
+    finally:
+        Error.set_cache_size(1024)
+
+
+def test_error_from_when_called_on_subclass_then_returns_subclass_instances() -> None:
+    class DomainError(Error): ...
+
+    assert type(DomainError.from_("500:Boom")) is DomainError
+    assert type(DomainError.from_(HTTPStatus.NOT_FOUND)) is DomainError
+    assert type(Error.from_("500:Boom")) is Error
+    assert type(Error.from_(HTTPStatus.NOT_FOUND)) is Error
+
+
+def test_error_when_created_then_has_no_instance_dict() -> None:
+    assert not hasattr(Error("404", "Not Found"), "__dict__")
+
+
+def test_error_hash_when_equal_with_different_descriptions_then_returns_same_hash() -> (
+    None
+):
+    error1 = Error("400", "Bad Request")
+    error2 = Error("400", "Different Description")
+    assert error1 == error2 and hash(error1) == hash(error2)
+
+
+def test_error_when_used_as_dict_key_then_equal_errors_share_entry() -> None:
+    counts = {Error("400", "Bad Request"): 1}
+    counts[Error("400", "Different Description")] += 1
+    assert counts == {Error("400"): 2}
+
+
+def test_error_when_assigning_attribute_then_raises() -> None:
+    error = Error("404", "Not Found")
+    with pytest.raises(AttributeError):
+        error.code = "500"  # type: ignore[misc]
+
+
+def test_error_to_bytes_when_round_tripped_then_keeps_code_and_description() -> None:
+    error = Error("E500", "Kaputt: ü")
+
+    decoded = Error.from_bytes(memoryview(error.to_bytes()))
+
+    assert (decoded.code, decoded.description) == (error.code, error.description)
+
+
+def test_error_from_bytes_when_truncated_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="Truncated error encoding"):
+        Error.from_bytes(Error("E500", "x").to_bytes()[:-1])
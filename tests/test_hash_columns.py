@@ -0,0 +1,61 @@
+import pytest
+
+from shared_kernel import ArgumentException, hash_combine, hash_combine_columns
+
+np = pytest.importorskip("numpy")
+
+EDGE_INT64 = [0, 1, -1, -2, 2**61 - 2, 2**61 - 1, 2**61, -(2**61), 2**63 - 1, -(2**63)]
+
+
+def test_hash_combine_columns_when_given_int64_edges_should_match_scalar() -> None:
+    column = np.array(EDGE_INT64, dtype=np.int64)
+    assert hash_combine_columns(column).tolist() == [
+        hash_combine(v) for v in EDGE_INT64
+    ]
+
+
+def test_hash_combine_columns_when_given_multiple_columns_should_match_scalar() -> None:
+    rng = np.random.default_rng(42)
+    a = rng.integers(-(2**63), 2**63 - 1, size=1000, dtype=np.int64)
+    b = rng.integers(0, 2**64 - 1, size=1000, dtype=np.uint64)
+    c = rng.integers(-5, 5, size=1000, dtype=np.int8)
+    expected = [
+        hash_combine(int(x), int(y), int(z)) for x, y, z in zip(a, b, c, strict=True)
+    ]
+    assert hash_combine_columns(a, b, c).tolist() == expected
+
+
+def test_hash_combine_columns_when_given_lists_and_bools_should_match_scalar() -> None:
+    ids, flags = [3, -4, 5], [True, False, True]
+    expected = [hash_combine(i, f) for i, f in zip(ids, flags, strict=True)]
+    assert hash_combine_columns(ids, np.array(flags)).tolist() == expected
+
+
+def test_hash_combine_columns_when_given_object_column_should_use_builtin_hash() -> (
+    None
+):
+    names = np.array(["a", "b", "c"], dtype=object)
+    ids = np.arange(3)
+    expected = [hash_combine(n, i) for n, i in zip(names.tolist(), range(3))]
+    assert hash_combine_columns(names, ids).tolist() == expected
+
+
+def test_hash_combine_columns_when_called_should_return_uint64_array() -> None:
+    assert hash_combine_columns(np.arange(4)).dtype == np.uint64
+
+
+def test_hash_combine_columns_when_given_no_columns_should_raise() -> None:
+    with pytest.raises(ArgumentException):
+        hash_combine_columns()
+
+
+def test_hash_combine_columns_when_lengths_differ_should_raise() -> None:
+    with pytest.raises(ArgumentException) as exc:
+        hash_combine_columns(np.arange(3), np.arange(4))
+
+    assert exc.value.param_name == "columns"
+
+
+def test_hash_combine_columns_when_column_is_not_one_dimensional_should_raise() -> None:
+    with pytest.raises(ArgumentException):
+        hash_combine_columns(np.zeros((2, 2), dtype=np.int64))
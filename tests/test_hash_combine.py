@@ -1,6 +1,6 @@
 import pytest
 
-from shared_kernel import ArgumentException, hash_combine
+from shared_kernel import ArgumentException, Hasher, hash_combine
 
 
 def test_when_given_one_argument_should_return_expected_hash() -> None:
@@ -36,3 +36,48 @@ def test_when_given_different_types_should_create_hash() -> None:
 
 def test_when_given_large_input_should_create_hash() -> None:
     assert isinstance(hash_combine(*list(range(1000))), int)
+
+
+def _reference(*args: object) -> int:
+    acc = 0
+    for arg in args:
+        acc = (acc ^ (hash(arg) + 0x9E3779B9 + (acc << 6) + (acc >> 2))) & (2**64 - 1)
+    return acc
+
+
+@pytest.mark.parametrize(
+    "args",
+    [(1,), (-1,), ("a", 2), (None, -7, "x"), (2**70, 3.5, b"b", (1, 2))],
+)
+def test_when_given_few_arguments_should_match_general_mixing(
+    args: tuple[object, ...],
+) -> None:
+    assert hash_combine(*args) == _reference(*args)
+
+
+def test_when_given_large_input_should_stay_within_64_bits() -> None:
+    assert 0 <= hash_combine(*range(1000)) < 2**64
+
+
+def test_when_given_negative_hashes_should_return_non_negative_hash() -> None:
+    assert 0 <= hash_combine(-(2**40), -1, -2) < 2**64
+
+
+def test_hasher_when_updated_incrementally_should_match_hash_combine() -> None:
+    assert Hasher().update(1, "two").update(3.0).digest() == hash_combine(1, "two", 3.0)
+
+
+def test_hasher_when_updated_with_many_values_should_match_hash_combine() -> None:
+    hasher = Hasher()
+    for value in range(500):
+        hasher.update(value)
+    assert hasher.digest() == hash_combine(*range(500))
+
+
+def test_hasher_when_not_updated_should_return_initial_accumulator() -> None:
+    assert Hasher().digest() == 0
+
+
+def test_hasher_update_when_called_should_return_same_hasher() -> None:
+    hasher = Hasher()
+    assert hasher.update(1) is hasher
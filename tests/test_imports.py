@@ -0,0 +1,78 @@
+import importlib
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+import shared_kernel
+
+PACKAGES = (
+    "shared_kernel",
+    "shared_kernel.abstractions",
+    "shared_kernel.design_by_contract",
+    "shared_kernel.error_struct",
+    "shared_kernel.functions",
+    "shared_kernel.result_type",
+)
+HEAVY_MODULES = ("asyncio", "concurrent.futures", "dataclasses", "http", "pickle")
+IMPORT_BUDGET_US = 50_000
+RUNS = 3
+TOP_LEVEL_IMPORT = re.compile(
+    r"import time:\s+\d+ \|\s+(?P<cumulative>\d+) \| (?P<name>\S+)$"
+)
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def _import_cost_us(statement: str) -> int:
+    # Sums the cumulative time of the top-level `shared_kernel` imports, which
+    # includes every module they pulled in.
+    total = 0
+    for line in _run(statement, "-X", "importtime").stderr.splitlines():
+        match = TOP_LEVEL_IMPORT.match(line)
+        if match and match["name"].startswith("shared_kernel"):
+            total += int(match["cumulative"])
+    return total
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_package_when_name_in_all_then_attribute_resolves(package: str) -> None:
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_package_when_unknown_name_then_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        shared_kernel.NotExported  # noqa: B018
+
+
+def test_import_when_ok_and_err_then_skips_heavy_modules() -> None:
+    code = (
+        "import sys\n"
+        "from shared_kernel import Err, Ok\n"
+        f"print(*sorted(set({HEAVY_MODULES!r}) & set(sys.modules)))"
+    )
+
+    assert _run(code).stdout.strip() == ""
+
+
+def test_import_when_ok_and_err_then_stays_within_budget() -> None:
+    cost = min(
+        _import_cost_us("from shared_kernel import Err, Ok") for _ in range(RUNS)
+    )
+
+    assert 0 < cost < IMPORT_BUDGET_US
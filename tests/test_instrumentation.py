@@ -0,0 +1,170 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import (
+    CounterSink,
+    Err,
+    Ok,
+    ResultEvent,
+    UnwrapFailedException,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumentation_enabled,
+)
+
+
+@pytest.fixture
+def sink() -> Iterator[CounterSink]:
+    yield enable_instrumentation(CounterSink())
+    disable_instrumentation()
+
+
+def test_instrumentation_when_enabled_then_counts_constructions(
+    sink: CounterSink,
+) -> None:
+    Ok(1)
+    Ok(2)
+    Err("boom")
+
+    assert sink.counts() == {(ResultEvent.OK, "Ok"): 2, (ResultEvent.ERR, "Err"): 1}
+
+
+def test_instrumentation_when_combinator_called_then_counts_per_name(
+    sink: CounterSink,
+) -> None:
+    result = Ok(1)
+    sink.reset()
+
+    result.map(lambda x: x + 1).and_then(lambda x: Err(x)).map(str)
+
+    counts = sink.counts()
+    assert counts[ResultEvent.COMBINATOR, "map"] == 2
+    assert counts[ResultEvent.COMBINATOR, "and_then"] == 1
+
+
+def test_instrumentation_when_expect_fails_then_counts_unwrap_failure(
+    sink: CounterSink,
+) -> None:
+    with pytest.raises(UnwrapFailedException):
+        Err("boom").expect("value")
+    with pytest.raises(UnwrapFailedException):
+        Ok(1).expect_err("error")
+    Ok(1).expect("value")
+
+    counts = sink.counts()
+    assert counts[ResultEvent.UNWRAP_FAILED, "expect"] == 1
+    assert counts[ResultEvent.UNWRAP_FAILED, "expect_err"] == 1
+
+
+def test_instrumentation_when_sampled_then_records_caller_site() -> None:
+    sink = enable_instrumentation(CounterSink(), sample_rate=1)
+    try:
+        Err("boom")
+    finally:
+        disable_instrumentation()
+
+    ((event, name, site),) = sink.sites()
+    assert (event, name) == (ResultEvent.ERR, "Err")
+    assert __file__ in site
+    assert site.endswith(
+        f"({test_instrumentation_when_sampled_then_records_caller_site.__name__})"
+    )
+
+
+def test_instrumentation_when_sampled_then_counts_all_and_captures_one_site_in_rate() -> (
+    None
+):
+    sink = enable_instrumentation(CounterSink(), sample_rate=3)
+    try:
+        for value in range(7):
+            Ok(value)
+    finally:
+        disable_instrumentation()
+
+    assert sink.counts() == {(ResultEvent.OK, "Ok"): 7}
+    assert list(sink.sites().values()) == [2]
+
+
+def test_instrumentation_when_library_constructs_then_records_user_site() -> None:
+    sink = enable_instrumentation(CounterSink(), sample_rate=1)
+    try:
+        Ok(1).map(lambda x: x + 1).and_then(Err)
+    finally:
+        disable_instrumentation()
+
+    sites = {site for _, _, site in sink.sites()}
+    assert len(sites) == 1
+    assert sites.pop().endswith(
+        f"({test_instrumentation_when_library_constructs_then_records_user_site.__name__})"
+    )
+
+
+@pytest.mark.parametrize("sample_rate", [0, 1])
+def test_instrumentation_when_enabled_then_keyword_arguments_pass_through(
+    sample_rate: int,
+) -> None:
+    sink = enable_instrumentation(CounterSink(), sample_rate)
+    try:
+        ok, err = Ok(value=1), Err(error="boom")
+        assert ok.map(op=str) == Ok("1")
+        assert err.map_or(default=0, op=str) == 0
+        assert ok.expect(message="value") == 1
+        with pytest.raises(UnwrapFailedException):
+            err.expect(message="value")
+    finally:
+        disable_instrumentation()
+
+    counts = sink.counts()
+    assert counts[ResultEvent.OK, "Ok"] == 3
+    assert counts[ResultEvent.UNWRAP_FAILED, "expect"] == 1
+
+
+def test_instrumentation_when_disabled_then_restores_original_methods() -> None:
+    originals = (Ok.__init__, Ok.map, Err.expect)
+    sink = enable_instrumentation(CounterSink())
+    disable_instrumentation()
+
+    Ok(1).map(str)
+
+    assert not instrumentation_enabled()
+    assert (Ok.__init__, Ok.map, Err.expect) == originals
+    assert sink.counts() == {}
+
+
+def test_instrumentation_when_enabled_twice_then_reports_to_latest_sink_only() -> None:
+    first = enable_instrumentation(CounterSink())
+    second = enable_instrumentation(CounterSink())
+    try:
+        Ok(1)
+    finally:
+        disable_instrumentation()
+
+    assert first.counts() == {}
+    assert second.counts() == {(ResultEvent.OK, "Ok"): 1}
+
+
+def test_instrumentation_when_threads_construct_then_counts_every_event(
+    sink: CounterSink,
+) -> None:
+    def construct() -> None:
+        for value in range(1_000):
+            Ok(value)
+
+    threads = [threading.Thread(target=construct) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sink.counts()[ResultEvent.OK, "Ok"] == 8_000
+    sink.reset()
+    assert sink.counts() == {}
+
+
+def test_instrumentation_when_sample_rate_negative_then_raises() -> None:
+    with pytest.raises(ArgumentException):
+        enable_instrumentation(CounterSink(), sample_rate=-1)
+    assert not instrumentation_enabled()
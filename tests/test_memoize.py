@@ -0,0 +1,206 @@
+import asyncio
+import threading
+
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import CachePolicy, Err, Ok, Result, memoize_result
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting(results: dict[int, Result[int, str]]):
+    calls: list[int] = []
+
+    def lookup(key: int) -> Result[int, str]:
+        calls.append(key)
+        return results[key]
+
+    return lookup, calls
+
+
+def test_memoize_result_when_ok_then_caches_and_counts_hits() -> None:
+    lookup, calls = _counting({1: Ok(10)})
+    cached = memoize_result()(lookup)
+
+    assert cached(1) == Ok(10)
+    assert cached(1) == Ok(10)
+
+    assert calls == [1]
+    assert cached.cache_info() == (1, 1, 128, 1)
+
+
+def test_memoize_result_when_ok_only_policy_then_recomputes_errors() -> None:
+    lookup, calls = _counting({1: Err("missing")})
+    cached = memoize_result()(lookup)
+
+    cached(1)
+    cached(1)
+
+    assert calls == [1, 1]
+    assert cached.cache_info().currsize == 0
+
+
+def test_memoize_result_when_both_policy_then_errors_use_err_ttl() -> None:
+    clock = FakeClock()
+    lookup, calls = _counting({1: Ok(10), 2: Err("missing")})
+    cached = memoize_result(ttl=60, policy=CachePolicy.BOTH, err_ttl=5, clock=clock)(
+        lookup
+    )
+    cached(1)
+    cached(2)
+
+    clock.now = 10
+    cached(1)
+    cached(2)
+
+    assert calls == [1, 2, 2]
+
+
+def test_memoize_result_when_ttl_expired_then_recomputes() -> None:
+    clock = FakeClock()
+    lookup, calls = _counting({1: Ok(10)})
+    cached = memoize_result(ttl=1, clock=clock)(lookup)
+
+    cached(1)
+    clock.now = 1
+    cached(1)
+
+    assert calls == [1, 1]
+
+
+def test_memoize_result_when_maxsize_exceeded_then_evicts_least_recently_used() -> None:
+    lookup, calls = _counting({1: Ok(1), 2: Ok(2), 3: Ok(3)})
+    cached = memoize_result(maxsize=2)(lookup)
+
+    cached(1)
+    cached(2)
+    cached(1)
+    cached(3)
+    cached(1)
+    cached(2)
+
+    assert calls == [1, 2, 3, 2]
+
+
+def test_memoize_result_when_args_and_kwargs_then_keys_differ_by_both() -> None:
+    calls: list[tuple[object, ...]] = []
+
+    @memoize_result()
+    def add(a: int, b: int = 0) -> Result[int, str]:
+        calls.append((a, b))
+        return Ok(a + b)
+
+    assert add(1, 2) == add(1, 2) == Ok(3)
+    assert add(1, b=2) == Ok(3)
+    assert add(2, 1) == Ok(3)
+    assert calls == [(1, 2), (1, 2), (2, 1)]
+
+
+def test_memoize_result_cache_clear_when_called_then_resets_entries_and_stats() -> None:
+    lookup, calls = _counting({1: Ok(10)})
+    cached = memoize_result()(lookup)
+    cached(1)
+
+    cached.cache_clear()
+    cached(1)
+
+    assert calls == [1, 1]
+    assert cached.cache_info() == (0, 1, 128, 1)
+
+
+def test_memoize_result_when_thread_safe_then_counts_every_call() -> None:
+    @memoize_result(maxsize=16, thread_safe=True)
+    def square(value: int) -> Result[int, str]:
+        return Ok(value * value)
+
+    def work() -> None:
+        for value in range(1_000):
+            square(value % 32)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = square.cache_info()
+    assert info.hits + info.misses == 4_000
+    assert info.currsize == 16
+
+
+def test_memoize_result_when_async_then_merges_concurrent_calls() -> None:
+    calls: list[int] = []
+
+    @memoize_result()
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return Ok(key * 2)
+
+    async def main() -> list[Result[int, str]]:
+        first = await asyncio.gather(*(fetch(1) for _ in range(5)))
+        return [*first, await fetch(1)]
+
+    assert asyncio.run(main()) == [Ok(2)] * 6
+    assert calls == [1]
+    assert fetch.cache_info().hits == 5
+
+
+def test_memoize_result_when_async_call_raises_then_does_not_cache() -> None:
+    calls: list[int] = []
+
+    @memoize_result()
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        raise RuntimeError("down")
+
+    async def main() -> None:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await fetch(1)
+
+    asyncio.run(main())
+    assert calls == [1, 1]
+
+
+def test_memoize_result_when_async_on_loops_in_threads_then_merges_per_loop() -> None:
+    calls: list[int] = []
+    started = threading.Barrier(2)
+
+    @memoize_result(thread_safe=True)
+    async def fetch(key: int) -> Result[int, str]:
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return Ok(key * 2)
+
+    async def main() -> list[Result[int, str]]:
+        first = asyncio.ensure_future(fetch(1))
+        await asyncio.sleep(0)
+        started.wait()
+        return await asyncio.gather(first, *(fetch(1) for _ in range(3)))
+
+    outcomes: list[list[Result[int, str]]] = []
+    threads = [
+        threading.Thread(target=lambda: outcomes.append(asyncio.run(main())))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes == [[Ok(2)] * 4] * 2
+    assert calls == [1, 1]
+    assert fetch.cache_info().hits == 6
+
+
+def test_memoize_result_when_ttl_not_positive_then_raises() -> None:
+    with pytest.raises(ArgumentException):
+        memoize_result(ttl=0)
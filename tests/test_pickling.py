@@ -0,0 +1,80 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from shared_kernel.error_struct import Error
+from shared_kernel.result_type import Err, Ok, Result, ResultBatch
+
+
+def _round_trip[T](obj: T) -> T:
+    return pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+
+def _batch(count: int) -> ResultBatch[int, Error]:
+    return ResultBatch(
+        Err(Error.from_(HTTPStatus.BAD_GATEWAY)) if i % 3 == 0 else Ok(i)
+        for i in range(count)
+    )
+
+
+def test_ok_err_pickle_when_round_tripped_then_keep_type_and_payload() -> None:
+    for result in (Ok("value"), Err(Error("E1", "failed")), Result(True, 1, None)):
+        restored = _round_trip(result)
+        assert type(restored) is type(result)
+        assert restored == result
+
+
+class _TracedResult(Result[int, str]):
+    __slots__ = ()
+
+
+def test_result_subclass_pickle_when_round_tripped_then_keeps_subclass() -> None:
+    result = _TracedResult(True, 1, None)
+
+    restored = _round_trip(result)
+
+    assert type(restored) is _TracedResult
+    assert restored == result
+
+
+def test_ok_pickle_when_reduced_then_stores_only_the_value() -> None:
+    assert Ok("value").__reduce__() == (Ok, ("value",))
+    assert Err("boom").__reduce__() == (Err, ("boom",))
+
+
+def test_error_pickle_when_http_status_then_restores_canonical_instance() -> None:
+    error = Error.from_(HTTPStatus.NOT_FOUND)
+
+    assert _round_trip(error) is error
+
+
+def test_error_pickle_when_custom_then_keeps_code_and_description() -> None:
+    for error in (Error("E1", "failed"), Error("E2"), Error("404", "Other text")):
+        restored = _round_trip(error)
+        assert (restored.code, restored.description) == (
+            error.code,
+            error.description,
+        )
+
+
+def test_result_batch_pickle_when_round_tripped_then_preserves_order() -> None:
+    batch = _batch(10)
+
+    restored = _round_trip(batch)
+
+    assert list(restored) == list(batch)
+    assert len(restored) == 10
+    assert restored[1] == Ok(1)
+
+
+def test_result_batch_pickle_when_many_results_then_smaller_than_list() -> None:
+    batch = _batch(1_000)
+
+    assert len(pickle.dumps(batch)) < len(pickle.dumps(batch.results))
+
+
+def test_result_batch_when_returned_from_process_pool_then_arrives_intact() -> None:
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        restored = pool.submit(_batch, 100).result()
+
+    assert restored == _batch(100)
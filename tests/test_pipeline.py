@@ -0,0 +1,97 @@
+import pytest
+
+from shared_kernel import ArgumentException, Err, Ok, Pipeline, Result
+
+
+def _half(x: int) -> Result[int, str]:
+    return Ok(x // 2) if x % 2 == 0 else Err("odd")
+
+
+def _recover(e: str) -> Result[int, str]:
+    return Ok(0) if e == "odd" else Err(e)
+
+
+def _eager(result: Result[int, str]) -> Result[str, int]:
+    return (
+        result.map(lambda x: x + 1)
+        .and_then(_half)
+        .map(lambda x: x * 3)
+        .or_else(_recover)
+        .map(str)
+        .map_err(len)
+    )
+
+
+PIPELINE = (
+    Result[int, str]
+    .pipeline()
+    .map(lambda x: x + 1)
+    .and_then(_half)
+    .map(lambda x: x * 3)
+    .or_else(_recover)
+    .map(str)
+    .map_err(len)
+)
+
+
+@pytest.mark.parametrize("result", [Ok(1), Ok(2), Ok(7), Err("odd"), Err("bad")])
+def test_pipeline_when_applied_then_matches_eager_chain(
+    result: Result[int, str],
+) -> None:
+    assert PIPELINE(result) == _eager(result)
+
+
+def test_pipeline_when_empty_then_returns_input_unchanged() -> None:
+    result: Result[int, str] = Ok(1)
+    assert Result.pipeline()(result) is result
+
+
+def test_pipeline_when_no_step_applies_then_returns_same_instance() -> None:
+    result: Result[int, str] = Err("error")
+    pipeline = Result.pipeline().map(lambda x: x + 1).and_then(_half)
+    assert pipeline(result) is result
+
+
+def test_pipeline_when_last_step_binds_then_returns_bound_result() -> None:
+    target: Result[int, str] = Ok(99)
+    pipeline = Result.pipeline().map(lambda x: x + 1).and_then(lambda _: target)
+    assert pipeline(Ok(1)) is target
+
+
+def test_pipeline_when_map_returns_none_then_raises_like_eager_map() -> None:
+    pipeline = Result.pipeline().map(lambda _: None).map(str)
+    with pytest.raises(ArgumentException) as exc:
+        pipeline(Ok(1))
+
+    assert exc.value.param_name == "Ok.value"
+
+
+def test_pipeline_when_map_err_returns_none_then_raises_like_eager_map_err() -> None:
+    pipeline = Result.pipeline().map_err(lambda _: None)
+    with pytest.raises(ArgumentException) as exc:
+        pipeline(Err("e"))
+
+    assert exc.value.param_name == "Err.error"
+
+
+def test_pipeline_when_extended_then_original_is_unchanged() -> None:
+    base = Result.pipeline().map(lambda x: x + 1)
+    extended = base.map(lambda x: x * 10)
+    assert base(Ok(1)) == Ok(2)
+    assert extended(Ok(1)) == Ok(20)
+    assert (len(base), len(extended)) == (1, 2)
+
+
+def test_pipeline_when_compiled_twice_then_reuses_function() -> None:
+    assert PIPELINE.compile() is PIPELINE.compile()
+
+
+def test_pipeline_stream_when_given_results_then_applies_lazily_in_order() -> None:
+    results = [Ok(1), Err("bad"), Ok(3)]
+    stream = PIPELINE.stream(iter(results))
+    assert list(stream) == [_eager(r) for r in results]
+
+
+def test_pipeline_when_applied_to_plain_result_then_matches_subclass() -> None:
+    pipeline: Pipeline[int, str, int, str] = Pipeline().map(lambda x: x * 2)
+    assert pipeline(Result(True, 2, None)) == Ok(4)
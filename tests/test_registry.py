@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Self
+
+import pytest
+
+from shared_kernel.abstractions import ConversionRegistry
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import Err, Ok, Result
+
+
+@dataclass(frozen=True)
+class UserId:
+    value: int
+
+    @classmethod
+    def try_from(cls, source: str) -> Result[Self, str]:
+        return Ok(cls(int(source))) if source.isdigit() else Err("not a number")
+
+
+@dataclass(frozen=True)
+class User:
+    id: UserId
+
+    @classmethod
+    def from_(cls, source: UserId) -> Self:
+        return cls(source)
+
+
+class Label(str):
+    pass
+
+
+@pytest.fixture
+def registry() -> ConversionRegistry:
+    registry = ConversionRegistry()
+    registry.register_try_from(UserId, str)
+    registry.register_from(User, UserId)
+    return registry
+
+
+def test_convert_when_single_hop_then_returns_ok(
+    registry: ConversionRegistry,
+) -> None:
+    assert registry.convert("7", UserId) == Ok(UserId(7))
+
+
+def test_convert_when_multi_hop_then_chains_converters(
+    registry: ConversionRegistry,
+) -> None:
+    assert registry.convert("7", User) == Ok(User(UserId(7)))
+    assert registry.path(str, User) == (str, UserId, User)
+
+
+def test_convert_when_fallible_step_fails_then_returns_its_err(
+    registry: ConversionRegistry,
+) -> None:
+    assert registry.convert("seven", User) == Err("not a number")
+
+
+def test_convert_when_value_is_subclass_then_uses_base_converters(
+    registry: ConversionRegistry,
+) -> None:
+    assert registry.convert(Label("7"), User) == Ok(User(UserId(7)))
+    assert registry.path(Label, User) == (Label, UserId, User)
+
+
+def test_convert_when_value_is_target_then_returns_value(
+    registry: ConversionRegistry,
+) -> None:
+    user_id = UserId(7)
+
+    assert registry.convert(user_id, UserId) == Ok(user_id)
+
+
+def test_convert_when_no_path_then_raises(registry: ConversionRegistry) -> None:
+    with pytest.raises(ArgumentException):
+        registry.convert(User(UserId(7)), str)
+
+
+def test_register_when_shorter_path_added_then_cache_is_cleared(
+    registry: ConversionRegistry,
+) -> None:
+    assert registry.path(str, User) == (str, UserId, User)
+
+    registry.register(str, User, lambda source: User(UserId(len(source))))
+
+    assert registry.path(str, User) == (str, User)
+    assert registry.convert("abc", User) == Ok(User(UserId(3)))
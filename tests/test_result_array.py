@@ -0,0 +1,164 @@
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import Err, Ok, Result, ResultArray
+
+RESULTS: list[Result[int, str]] = [Ok(1), Err("a"), Ok(3), Ok(4), Err("b")]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_result_array_when_built_from_results_then_round_trips(
+    typecode: str | None,
+) -> None:
+    results = ResultArray(RESULTS, typecode)
+
+    assert results.to_results() == RESULTS
+    assert list(results) == RESULTS
+    assert len(results) == 5
+    assert results.typecode == typecode
+
+
+def test_result_array_getitem_when_indexed_then_returns_result_view() -> None:
+    results = ResultArray(RESULTS, "q")
+
+    assert results[0] == Ok(1)
+    assert results[1] == Err("a")
+    assert results[-1] == Err("b")
+
+
+def test_result_array_counts_when_mixed_then_counts_each_side() -> None:
+    results = ResultArray(RESULTS)
+
+    assert (results.count_ok(), results.count_err()) == (3, 2)
+
+
+def test_result_array_partition_when_mixed_then_matches_result_partition() -> None:
+    assert ResultArray(RESULTS, "q").partition() == Result.partition(RESULTS)
+
+
+def test_result_array_map_when_per_value_then_maps_only_ok_values() -> None:
+    seen: list[int] = []
+
+    def double(value: int) -> int:
+        seen.append(value)
+        return value * 2
+
+    mapped = ResultArray(RESULTS, "q").map(double, typecode="q")
+
+    assert mapped.to_results() == [Ok(2), Err("a"), Ok(6), Ok(8), Err("b")]
+    assert seen == [1, 3, 4]
+
+
+def test_result_array_map_when_vectorized_then_calls_op_once_per_column() -> None:
+    calls: list[object] = []
+
+    def double(column: list[int | None]) -> list[int | None]:
+        calls.append(column)
+        return [None if value is None else value * 2 for value in column]
+
+    mapped = ResultArray(RESULTS).map(double, vectorized=True)
+
+    assert mapped.to_results() == [Ok(2), Err("a"), Ok(6), Ok(8), Err("b")]
+    assert len(calls) == 1
+
+
+def test_result_array_map_when_vectorized_with_numpy_then_keeps_typed_column() -> None:
+    pytest.importorskip("numpy")
+
+    mapped = ResultArray(RESULTS, "q").map(lambda column: column * 0.5, vectorized=True)
+
+    assert mapped.typecode == "d"
+    assert mapped.to_results() == [Ok(0.5), Err("a"), Ok(1.5), Ok(2.0), Err("b")]
+
+
+def test_result_array_map_when_vectorized_length_differs_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="one item per input item"):
+        ResultArray(RESULTS).map(lambda column: column[:1], vectorized=True)
+
+
+def test_result_array_map_err_when_applied_then_maps_only_errors() -> None:
+    mapped = ResultArray(RESULTS).map_err(str.upper)
+
+    assert mapped.to_results() == [Ok(1), Err("A"), Ok(3), Ok(4), Err("B")]
+
+
+def test_result_array_to_numpy_when_typed_then_shares_memory() -> None:
+    np = pytest.importorskip("numpy")
+    results = ResultArray(RESULTS, "q")
+
+    mask, values = results.to_numpy()
+
+    assert mask.tolist() == [True, False, True, True, False]
+    assert values[mask].tolist() == [1, 3, 4]
+    assert np.shares_memory(values, np.frombuffer(results._values, dtype="q"))
+
+
+def test_result_array_to_numpy_when_untyped_then_raises() -> None:
+    pytest.importorskip("numpy")
+
+    with pytest.raises(ArgumentException, match="typecode-backed"):
+        ResultArray(RESULTS).to_numpy()
+
+
+def test_result_array_to_numpy_when_view_written_then_raises_and_keeps_columns() -> (
+    None
+):
+    pytest.importorskip("numpy")
+    results = ResultArray(RESULTS, "q")
+    derived = results.map_err(str.upper)
+
+    mask, values = results.to_numpy()
+
+    with pytest.raises(ValueError, match="read-only"):
+        mask[1] = True
+    with pytest.raises(ValueError, match="read-only"):
+        values[0] = 9
+    assert derived.to_results() == [Ok(1), Err("A"), Ok(3), Ok(4), Err("B")]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_result_array_map_when_vectorized_op_writes_column_then_source_unchanged(
+    typecode: str | None,
+) -> None:
+    results = ResultArray(RESULTS, typecode)
+
+    def overwrite(column: list[int]) -> list[int]:
+        try:
+            column[0] = 9
+        except ValueError:
+            pass
+        return [1] * len(column)
+
+    results.map(overwrite, vectorized=True)
+
+    assert results.to_results() == RESULTS
+
+
+def test_result_array_map_when_ok_value_mapped_to_none_then_raises_on_map() -> None:
+    with pytest.raises(ArgumentException, match="cannot be None"):
+        ResultArray(RESULTS).map(lambda value: None)
+
+
+def test_result_array_map_when_vectorized_result_not_sequence_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="one-dimensional"):
+        ResultArray(RESULTS).map(lambda column: iter(column), vectorized=True)
+
+
+def test_result_array_map_when_values_do_not_fit_typecode_then_raises_on_map() -> None:
+    with pytest.raises(ArgumentException, match="typecode"):
+        ResultArray(RESULTS).map(str, typecode="q")
+    with pytest.raises(ArgumentException, match="typecode"):
+        ResultArray(RESULTS).map(
+            lambda column: [str(value) for value in column], "q", vectorized=True
+        )
+
+
+def test_result_array_map_when_vectorized_with_typecode_then_converts_column() -> None:
+    mapped = ResultArray(RESULTS).map(
+        lambda column: [0 if value is None else value for value in column],
+        "q",
+        vectorized=True,
+    )
+
+    assert mapped.typecode == "q"
+    assert mapped.to_results() == RESULTS
@@ -0,0 +1,184 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import (
+    Err,
+    Ok,
+    Result,
+    async_result_block,
+    result_block,
+)
+
+
+def parse(raw: str) -> Result[int, str]:
+    return Ok(int(raw)) if raw.isdigit() else Err(f"not a number: {raw}")
+
+
+def positive(value: int) -> Result[int, str]:
+    return Ok(value) if value > 0 else Err("not positive")
+
+
+async def halve(value: int) -> Result[int, str]:
+    return Ok(value // 2) if value % 2 == 0 else Err("odd")
+
+
+@result_block
+def total(first: str, second: str = "1"):
+    a = yield parse(first)
+    b: int = yield positive(a)
+    c = yield parse(second)
+    return a + b + c
+
+
+@result_block
+def checked_sum(raws: list[str], trace: list[str]):
+    result = 0
+    for raw in raws:
+        try:
+            value = yield parse(raw)
+            if value > 100:
+                return Err("too large")
+            result += value
+        finally:
+            trace.append(raw)
+    return result
+
+
+@result_block
+def guarded(raw: str, seen: list[type[BaseException]]):
+    try:
+        value = yield parse(raw)
+    except BaseException as error:
+        seen.append(type(error))
+        raise
+    return value
+
+
+@contextmanager
+def transaction(events: list[str]) -> Iterator[None]:
+    try:
+        yield
+    except GeneratorExit:
+        events.append("rollback")
+        raise
+    events.append("commit")
+
+
+@result_block
+def transfer(raw: str, events: list[str]):
+    with transaction(events):
+        value = yield parse(raw)
+        checked = yield positive(value)
+    return checked
+
+
+@async_result_block
+def halved(raw: str):
+    value = yield parse(raw)
+    half = yield halve(value)
+    return half
+
+
+def test_result_block_when_all_ok_then_returns_ok_of_return_value() -> None:
+    assert total("2", "3") == Ok(7)
+    assert total("2") == Ok(5)
+
+
+def test_result_block_when_step_fails_then_matches_nested_and_then() -> None:
+    def nested(first: str, second: str) -> Result[int, str]:
+        return parse(first).and_then(
+            lambda a: positive(a).and_then(
+                lambda b: parse(second).map(lambda c: a + b + c)
+            )
+        )
+
+    for first, second in (("2", "3"), ("x", "3"), ("0", "3"), ("2", "y")):
+        assert total(first, second) == nested(first, second)
+
+
+def test_result_block_when_err_then_skips_rest_and_runs_finally() -> None:
+    trace: list[str] = []
+
+    assert checked_sum(["1", "x", "2"], trace) == Err("not a number: x")
+    assert trace == ["1", "x"]
+
+
+def test_result_block_when_returning_result_then_passes_it_through() -> None:
+    assert checked_sum(["1", "500"], []) == Err("too large")
+    assert checked_sum(["1", "2"], []) == Ok(3)
+
+
+def test_result_block_when_err_then_context_manager_sees_generator_exit() -> None:
+    events: list[str] = []
+
+    assert transfer("0", events) == Err("not positive")
+    assert transfer("2", events) == Ok(2)
+    assert events == ["rollback", "commit"]
+
+
+def test_result_block_when_closure_then_exits_the_same_way() -> None:
+    events: list[str] = []
+
+    @result_block
+    def block(raw: str):
+        with transaction(events):
+            value = yield parse(raw)
+            checked = yield positive(value)
+        return checked
+
+    assert block.__wrapped__.__code__.co_freevars == ("events",)
+    assert block("0") == Err("not positive")
+    assert block("2") == Ok(2)
+    assert events == ["rollback", "commit"]
+
+
+def test_result_block_when_err_then_except_base_exception_sees_exit() -> None:
+    seen: list[type[BaseException]] = []
+
+    assert guarded("x", seen) == Err("not a number: x")
+    assert seen == [GeneratorExit]
+
+
+def test_result_block_when_method_then_binds_self() -> None:
+    class Parser:
+        offset = 10
+
+        @result_block
+        def parse(self, raw: str):
+            value = yield parse(raw)
+            return value + self.offset
+
+    assert Parser().parse("5") == Ok(15)
+    assert Parser().parse("x") == Err("not a number: x")
+
+
+def test_result_block_when_not_generator_then_raises() -> None:
+    with pytest.raises(ArgumentException):
+        result_block(parse)
+
+
+def test_async_result_block_when_steps_awaitable_then_awaits_them() -> None:
+    assert asyncio.run(halved("8")) == Ok(4)
+    assert asyncio.run(halved("7")) == Err("odd")
+    assert asyncio.run(halved("x")) == Err("not a number: x")
+
+
+def test_async_result_block_when_err_then_runs_finally() -> None:
+    trace: list[str] = []
+
+    @async_result_block
+    def shifted(raw: str):
+        try:
+            value = yield parse(raw)
+            half = yield halve(value)
+            return half + 1
+        finally:
+            trace.append(raw)
+
+    assert asyncio.run(shifted("8")) == Ok(5)
+    assert asyncio.run(shifted("7")) == Err("odd")
+    assert trace == ["8", "7"]
@@ -274,3 +274,94 @@ def test_result_repr_and_str_with_complex_objects_when_converted_then_uses_objec
     assert str(Ok(obj)) == "Result(ComplexObject(), None)"
     assert repr(Err(obj)) == "Result(is_ok=False, value=None, error=ComplexObject())"
     assert str(Err(obj)) == "Result(None, ComplexObject())"
+
+
+def test_collect_when_all_ok_then_returns_ok_with_values_in_order() -> None:
+    assert Result.collect([Ok(1), Ok(2), Ok(3)]) == Ok([1, 2, 3])
+
+
+def test_collect_when_empty_then_returns_ok_with_empty_list() -> None:
+    assert Result.collect([]) == Ok([])
+
+
+def test_collect_when_err_present_then_returns_first_err_and_stops_consuming() -> None:
+    consumed: list[int] = []
+
+    def results():
+        for i in range(10):
+            consumed.append(i)
+            yield Err(f"error{i}") if i in (2, 5) else Ok(i)
+
+    assert Result.collect(results()) == Err("error2")
+    assert consumed == [0, 1, 2]
+
+
+def test_partition_when_mixed_results_then_splits_values_and_errors() -> None:
+    values, errors = Result.partition(iter([Ok(1), Err("a"), Ok(2), Err("b")]))
+    assert values == [1, 2]
+    assert errors == ["a", "b"]
+
+
+def test_partition_when_empty_then_returns_two_empty_lists() -> None:
+    assert Result.partition([]) == ([], [])
+
+
+def test_sequence_when_all_ok_then_returns_ok_mapping() -> None:
+    assert Result.sequence({"a": Ok(1), "b": Ok(2)}) == Ok({"a": 1, "b": 2})
+
+
+def test_sequence_when_err_present_then_returns_first_err() -> None:
+    assert Result.sequence({"a": Ok(1), "b": Err("bad"), "c": Err("worse")}) == Err(
+        "bad"
+    )
+
+
+def test_ok_and_err_when_created_then_are_result_subclasses_without_dict() -> None:
+    assert isinstance(Ok(1), Result) and isinstance(Err("e"), Result)
+    assert not hasattr(Ok(1), "__dict__")
+    assert not hasattr(Err("e"), "__dict__")
+
+
+def test_result_classmethods_when_called_then_return_ok_and_err_instances() -> None:
+    assert type(Result.Ok(1)) is Ok
+    assert type(Result.Err("e")) is Err
+
+
+def test_ok_and_err_when_compared_with_plain_results_then_equal_and_same_hash() -> None:
+    assert Ok(42) == Result(True, 42, None)
+    assert Err("e") == Result(False, None, "e")
+    assert hash(Ok(42)) == hash(Result(True, 42, None))
+    assert hash(Err("e")) == hash(Result(False, None, "e"))
+
+
+def test_pattern_matching_when_matching_on_ok_and_err_then_binds_payload() -> None:
+    def describe(result: Result[int, str]) -> str:
+        match result:
+            case Ok(value):
+                return f"ok {value}"
+            case Err(error):
+                return f"err {error}"
+        return "unreachable"
+
+    assert describe(Ok(1)) == "ok 1"
+    assert describe(Err("e")) == "err e"
+
+
+def test_pattern_matching_when_matching_on_result_fields_then_still_supported() -> None:
+    match Ok(1):
+        case Result(True, value, None):
+            assert value == 1
+        case _:
+            pytest.fail("Ok did not match the Result field pattern")
+
+
+def test_map_when_err_then_returns_same_instance() -> None:
+    error: Result[int, str] = Err("error")
+    assert error.map(lambda x: x + 1) is error
+    assert error.and_then(lambda x: Ok(x + 1)) is error
+
+
+def test_map_err_when_ok_then_returns_same_instance() -> None:
+    ok: Result[int, str] = Ok(1)
+    assert ok.map_err(str.upper) is ok
+    assert ok.or_else(lambda e: Err(len(e))) is ok
@@ -0,0 +1,96 @@
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException, Schema, in_range
+
+SCHEMA = Schema(
+    {
+        "id": ArgumentException.raise_if_none,
+        "name": ArgumentException.raise_if_none_or_whitespace,
+        "tags": ArgumentException.raise_if_none_or_empty,
+        "age": in_range(0, 150),
+    }
+)
+
+
+def _messages(record: dict) -> list[str]:
+    return [failure.message for failure in SCHEMA.validate(record).err()]
+
+
+def test_schema_validate_when_record_valid_then_returns_ok_with_record() -> None:
+    record = {"id": 1, "name": "bob", "tags": ["a"], "age": 42}
+
+    assert SCHEMA.validate(record).ok() is record
+
+
+def test_schema_validate_when_fields_invalid_then_reports_every_field() -> None:
+    record = {"id": None, "name": "  ", "tags": [], "age": 151}
+
+    assert _messages(record) == [
+        "Argument cannot be none. (Parameter 'id')",
+        "String argument cannot be whitespace. (Parameter 'name')",
+        "Argument cannot be empty. (Parameter 'tags')",
+        "Value does not fall within the expected range. (Parameter 'age')",
+    ]
+
+
+def test_schema_validate_when_key_missing_then_reports_none() -> None:
+    record = {"id": 1, "name": "bob", "tags": ["a"]}
+
+    assert _messages(record) == ["Argument cannot be none. (Parameter 'age')"]
+
+
+def test_schema_validate_when_guard_sequence_then_reports_first_failure_only() -> None:
+    schema = Schema({"age": (in_range(minimum=0), in_range(maximum=10))})
+
+    assert schema.validate({"age": 5}).is_ok()
+    assert len(schema.validate({"age": -1}).err()) == 1
+    assert schema.validate({"age": 11}).err()[0].param_name == "age"
+
+
+def test_schema_validate_when_custom_guard_then_collects_its_exception() -> None:
+    def even(value: int, param: str | None = None) -> None:
+        if value % 2:
+            raise ArgumentException("Value must be even.", param)
+
+    schema = Schema({"count": (ArgumentException.raise_if_none, even)})
+
+    assert schema.validate({"count": 2}).is_ok()
+    assert schema.validate({"count": None}).err()[0].message == (
+        "Argument cannot be none. (Parameter 'count')"
+    )
+    assert schema.validate({"count": 3}).err()[0].message == (
+        "Value must be even. (Parameter 'count')"
+    )
+
+
+def test_schema_validate_many_when_batch_then_matches_validate() -> None:
+    records = [
+        {"id": 1, "name": "bob", "tags": ["a"], "age": 1},
+        {"id": 2, "name": "", "tags": (), "age": -1},
+        {},
+    ]
+
+    results = SCHEMA.validate_many(records)
+
+    assert [result.is_ok() for result in results] == [True, False, False]
+    for record, result in zip(records, results):
+        expected = SCHEMA.validate(record)
+        assert result.is_ok() == expected.is_ok()
+        if result.is_err():
+            assert [e.message for e in result.err()] == [
+                e.message for e in expected.err()
+            ]
+
+
+def test_schema_when_fields_empty_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="Argument cannot be empty."):
+        Schema({})
+
+
+def test_schema_when_guard_not_callable_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="Schema guards must be callable."):
+        Schema({"id": 1})  # type: ignore[dict-item]
+
+
+def test_schema_fields_when_created_then_preserves_order() -> None:
+    assert SCHEMA.fields == ("id", "name", "tags", "age")
@@ -0,0 +1,86 @@
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.error_struct import Error
+from shared_kernel.result_type import (
+    BYTES_CODEC,
+    INT_CODEC,
+    PICKLE_CODEC,
+    STR_CODEC,
+    Codec,
+    Err,
+    Ok,
+    Result,
+    decode_results,
+    encode_results,
+)
+
+
+def test_result_to_bytes_when_round_tripped_then_equals_original() -> None:
+    for result in (Ok({"id": 1}), Err(Error("E404", "Not found"))):
+        assert Result.from_bytes(result.to_bytes(PICKLE_CODEC), PICKLE_CODEC) == result
+
+
+def test_result_to_bytes_when_codecs_given_then_uses_them() -> None:
+    data = Ok("hé").to_bytes(STR_CODEC)
+
+    assert data == b"\x01\x03h\xc3\xa9"
+    assert Result.from_bytes(data, STR_CODEC) == Ok("hé")
+
+
+@pytest.mark.parametrize("value", [0, -1, 127, 128, -(2**70), 2**64])
+def test_int_codec_when_round_tripped_then_preserves_value(value: int) -> None:
+    encoded = encode_results([Ok(value)], INT_CODEC)
+
+    assert decode_results(encoded, INT_CODEC) == [Ok(value)]
+
+
+def test_encode_results_when_bulk_then_decodes_in_order() -> None:
+    results: list[Result[str, Error]] = [
+        Ok("a"),
+        Err(Error("E1", "first")),
+        Ok("b" * 300),
+        Err(Error("E2")),
+    ]
+
+    decoded = decode_results(encode_results(results, STR_CODEC), STR_CODEC)
+
+    assert decoded == results
+    assert [r.err().description for r in decoded if r.is_err()] == ["first", ""]
+
+
+def test_decode_results_when_memoryview_then_codecs_see_slices_of_it() -> None:
+    seen: list[memoryview] = []
+
+    def decode(view: memoryview) -> bytes:
+        seen.append(view)
+        return bytes(view)
+
+    buffer = bytearray(encode_results([Ok(b"xy"), Ok(b"z")], BYTES_CODEC))
+    decoded = decode_results(memoryview(buffer), Codec(bytes, decode))
+
+    assert decoded == [Ok(b"xy"), Ok(b"z")]
+    assert all(view.obj is buffer for view in seen)
+
+
+def test_decode_results_when_truncated_then_raises() -> None:
+    data = encode_results([Ok("abc")], STR_CODEC)
+
+    with pytest.raises(ArgumentException, match="Truncated result encoding"):
+        decode_results(data[:-1], STR_CODEC)
+
+
+@pytest.mark.parametrize("data", [b"\x01", b"\x01\x80"])
+def test_decode_results_when_length_truncated_then_raises(data: bytes) -> None:
+    with pytest.raises(ArgumentException, match="Truncated result encoding"):
+        decode_results(data, STR_CODEC)
+
+
+def test_decode_results_when_tag_invalid_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="Invalid result tag"):
+        decode_results(b"\x07\x00", STR_CODEC)
+
+
+def test_result_from_bytes_when_trailing_data_then_raises() -> None:
+    with pytest.raises(ArgumentException, match="Unexpected data"):
+        Result.from_bytes(Ok("a").to_bytes(STR_CODEC) + b"\x00", STR_CODEC)
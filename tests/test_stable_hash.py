@@ -0,0 +1,126 @@
+import os
+import subprocess
+import sys
+from collections import Counter
+
+import pytest
+
+from shared_kernel import ArgumentException, Error, Partitioner, stable_hash_combine
+
+SCRIPT = (
+    "from shared_kernel import Error, stable_hash_combine;"
+    "print(stable_hash_combine('tenant', b'id', 42, -1.5, ('a', 1), Error('E1')))"
+)
+
+
+def test_stable_hash_combine_when_given_known_key_should_return_pinned_value() -> None:
+    assert stable_hash_combine("a", 1) == 4724768002416830079
+
+
+def test_stable_hash_combine_when_run_with_different_hash_seeds_should_match() -> None:
+    def run(seed: str) -> str:
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        return subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    assert run("1") == run("2") == run("random")
+
+
+def test_stable_hash_combine_when_values_compare_equal_should_match() -> None:
+    assert (
+        stable_hash_combine(1) == stable_hash_combine(1.0) == stable_hash_combine(True)
+    )
+    assert stable_hash_combine(b"x") == stable_hash_combine(bytearray(b"x"))
+    assert stable_hash_combine(Error("404", "a")) == stable_hash_combine(
+        Error("404", "b")
+    )
+
+
+def test_stable_hash_combine_when_values_differ_by_type_should_differ() -> None:
+    assert stable_hash_combine("1") != stable_hash_combine(1)
+    assert stable_hash_combine("x") != stable_hash_combine(b"x")
+    assert stable_hash_combine(("a", "b")) != stable_hash_combine("a", "b")
+    assert stable_hash_combine("ab", "c") != stable_hash_combine("a", "bc")
+
+
+def test_stable_hash_combine_when_argument_order_changed_should_differ() -> None:
+    assert stable_hash_combine(1, 2) != stable_hash_combine(2, 1)
+
+
+def test_stable_hash_combine_when_called_should_return_64_bit_value() -> None:
+    assert all(0 <= stable_hash_combine(i, -(2**100)) < 2**64 for i in range(100))
+
+
+def test_stable_hash_combine_when_given_no_arguments_should_raise() -> None:
+    with pytest.raises(ArgumentException):
+        stable_hash_combine()
+
+
+def test_stable_hash_combine_when_given_unsupported_type_should_raise() -> None:
+    with pytest.raises(ArgumentException, match="Unsupported key type") as exc:
+        stable_hash_combine(object())
+
+    assert exc.value.param_name == "object"
+
+
+def test_stable_hash_combine_when_low_bits_bucketed_should_be_uniform() -> None:
+    counts = Counter(stable_hash_combine("key", i) % 16 for i in range(32_000))
+    assert len(counts) == 16
+    assert max(counts.values()) / min(counts.values()) < 1.15
+
+
+def test_partitioner_when_distributing_keys_should_stay_close_to_even() -> None:
+    partitioner = Partitioner(8)
+    counts = Counter(partitioner.shard_for("user", i) for i in range(40_000))
+    mean = 40_000 / 8
+    assert set(counts) == set(range(8))
+    assert all(0.8 * mean < count < 1.2 * mean for count in counts.values())
+
+
+def test_partitioner_when_shard_added_should_only_move_keys_to_new_shard() -> None:
+    partitioner = Partitioner(8)
+    before = [partitioner.shard_for(i) for i in range(20_000)]
+    new_shard = partitioner.add_shard()
+    after = [partitioner.shard_for(i) for i in range(20_000)]
+
+    moved = [new for old, new in zip(before, after, strict=True) if old != new]
+    assert new_shard == 8 and partitioner.n_shards == 9
+    assert set(moved) == {new_shard}
+    assert 0.07 < len(moved) / 20_000 < 0.15
+
+
+def test_partitioner_when_shard_removed_should_only_move_its_keys() -> None:
+    partitioner = Partitioner(4)
+    before = [partitioner.shard_for(i) for i in range(10_000)]
+    partitioner.remove_shard(2)
+    after = [partitioner.shard_for(i) for i in range(10_000)]
+
+    assert partitioner.shards == (0, 1, 3)
+    assert all(old == new for old, new in zip(before, after, strict=True) if old != 2)
+    assert 2 not in after
+
+
+def test_partitioner_when_created_twice_should_route_identically() -> None:
+    first, second = Partitioner(5, vnodes=64), Partitioner(5, vnodes=64)
+    assert all(first.shard_for("k", i) == second.shard_for("k", i) for i in range(1000))
+
+
+@pytest.mark.parametrize("n_shards, vnodes", [(0, 128), (4, 0)])
+def test_partitioner_when_given_invalid_sizes_should_raise(
+    n_shards: int, vnodes: int
+) -> None:
+    with pytest.raises(ArgumentException):
+        Partitioner(n_shards, vnodes)
+
+
+def test_partitioner_remove_shard_when_unknown_or_last_should_raise() -> None:
+    partitioner = Partitioner(1)
+    with pytest.raises(ArgumentException):
+        partitioner.remove_shard(5)
+    with pytest.raises(ArgumentException):
+        partitioner.remove_shard(0)
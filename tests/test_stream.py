@@ -0,0 +1,135 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from shared_kernel.design_by_contract import ArgumentException
+from shared_kernel.result_type import Err, Ok, Result, ResultStream
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+def reject_multiples_of_five(value: int) -> Result[int, str]:
+    return Err(f"{value} rejected") if value % 5 == 0 else Ok(value)
+
+
+def is_even(value: int) -> bool:
+    return value % 2 == 0
+
+
+def test_result_stream_when_iterated_then_applies_stages_in_order() -> None:
+    stream = ResultStream(range(1, 11)).and_then(reject_multiples_of_five).map(double)
+
+    assert list(stream) == [2, 4, 6, 8, 12, 14, 16, 18]
+    assert stream.errors == ["5 rejected", "10 rejected"]
+
+
+def test_result_stream_when_built_then_consumes_nothing_until_iterated() -> None:
+    consumed: list[int] = []
+
+    def source():
+        for value in range(3):
+            consumed.append(value)
+            yield value
+
+    stream = ResultStream(source()).map(double)
+    assert consumed == []
+
+    assert next(iter(stream)) == 0
+    assert consumed == [0]
+
+
+def test_result_stream_filter_when_predicate_false_then_drops_item() -> None:
+    assert list(ResultStream(range(6)).filter(is_even)) == [0, 2, 4]
+
+
+def test_result_stream_when_on_err_given_then_sends_errors_there() -> None:
+    seen: list[str] = []
+
+    values = list(
+        ResultStream(range(11), seen.append).and_then(reject_multiples_of_five)
+    )
+
+    assert values == [1, 2, 3, 4, 6, 7, 8, 9]
+    assert seen == ["0 rejected", "5 rejected", "10 rejected"]
+
+
+def test_result_stream_from_results_when_err_then_goes_to_side_channel() -> None:
+    stream = ResultStream.from_results([Ok(1), Err("boom"), Ok(3)])
+
+    assert list(stream) == [1, 3]
+    assert stream.errors == ["boom"]
+
+
+def test_result_stream_when_iterated_twice_then_errors_hold_latest_iteration() -> None:
+    stream = ResultStream(range(11)).and_then(reject_multiples_of_five)
+    first = stream.errors
+
+    list(stream)
+    list(stream)
+
+    assert stream.errors == ["0 rejected", "5 rejected", "10 rejected"]
+    assert first == []
+
+
+def test_result_stream_when_derived_then_each_stream_keeps_own_errors() -> None:
+    checked = ResultStream(range(6)).and_then(reject_multiples_of_five)
+    doubled = checked.map(double)
+
+    assert list(doubled) == [2, 4, 6, 8]
+    assert checked.errors == []
+    assert doubled.errors == ["0 rejected", "5 rejected"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 7, 1_000])
+def test_result_stream_when_stage_in_thread_pool_then_keeps_input_order(
+    chunksize: int,
+) -> None:
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        stream = (
+            ResultStream(range(100))
+            .map(double, pool, chunksize=chunksize, max_in_flight=2)
+            .and_then(reject_multiples_of_five, pool, chunksize=chunksize)
+            .filter(is_even, pool, chunksize=chunksize)
+        )
+        values = list(stream)
+
+    expected = [v * 2 for v in range(100) if (v * 2) % 5 and (v * 2) % 2 == 0]
+    assert values == expected
+    assert len(stream.errors) == 20
+
+
+def test_result_stream_when_parallel_then_bounds_work_in_flight() -> None:
+    pulled: list[int] = []
+
+    def source():
+        for value in range(1_000):
+            pulled.append(value)
+            yield value
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        iterator = iter(
+            ResultStream(source()).map(double, pool, chunksize=10, max_in_flight=3)
+        )
+        next(iterator)
+
+    assert len(pulled) <= 3 * 10 + 1
+
+
+def test_result_stream_when_stage_in_process_pool_then_matches_sequential() -> None:
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        values = list(
+            ResultStream(range(50))
+            .and_then(reject_multiples_of_five, pool, chunksize=8)
+            .map(double, pool, chunksize=8)
+        )
+
+    assert values == list(
+        ResultStream(range(50)).and_then(reject_multiples_of_five).map(double)
+    )
+
+
+def test_result_stream_when_chunksize_invalid_then_raises() -> None:
+    with pytest.raises(ArgumentException):
+        ResultStream(range(3)).map(double, chunksize=0)
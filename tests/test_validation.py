@@ -0,0 +1,118 @@
+import os
+import subprocess
+import sys
+
+from shared_kernel import (
+    ArgumentException,
+    Err,
+    Error,
+    Ok,
+    collect_none,
+    collect_none_or_empty,
+    collect_none_or_whitespace,
+    collected,
+    try_none,
+    try_none_or_empty,
+    try_none_or_whitespace,
+    validate_all,
+)
+from shared_kernel.result_type import Failures
+
+
+def test_try_none_when_value_present_then_returns_ok_value() -> None:
+    assert try_none(0, "count") == Ok(0)
+
+
+def test_try_none_when_none_then_returns_err_with_argument_exception() -> None:
+    failures = try_none(None, "count").expect_err("should fail")
+    assert len(failures) == 1
+    assert isinstance(failures[0], ArgumentException)
+    assert failures[0].message == "Argument cannot be none. (Parameter 'count')"
+
+
+def test_try_none_or_empty_when_empty_then_returns_err_with_empty_message() -> None:
+    failures = try_none_or_empty([], "items").expect_err("should fail")
+    assert str(failures[0]) == ArgumentException.EMPTY_ARGUMENT_MESSAGE
+    assert failures[0].param_name == "items"
+
+
+def test_try_none_or_empty_when_none_or_valid_then_matches_raising_guard() -> None:
+    assert try_none_or_empty(None, "items").is_err()
+    assert try_none_or_empty("abc", "items") == Ok("abc")
+
+
+def test_try_none_or_whitespace_when_whitespace_then_returns_err() -> None:
+    failures = try_none_or_whitespace("  ", "name").expect_err("should fail")
+    assert str(failures[0]) == ArgumentException.WHITESPACE_ARGUMENT_MESSAGE
+
+
+def test_try_none_or_whitespace_when_none_or_valid_then_matches_raising_guard() -> None:
+    assert try_none_or_whitespace(None, "name").is_err()
+    assert try_none_or_whitespace("bob", "name") == Ok("bob")
+    assert try_none_or_whitespace("", "name") == Ok("")
+
+
+def test_validate_all_when_all_valid_then_returns_values_in_order() -> None:
+    result = validate_all(
+        try_none(1, "id"),
+        try_none_or_whitespace("bob", "name"),
+        try_none_or_empty(["a"], "tags"),
+    )
+    assert result == Ok((1, "bob", ["a"]))
+
+
+def test_validate_all_when_several_invalid_then_collects_every_failure() -> None:
+    domain_error = Error("E100", "Unknown tenant")
+    result = validate_all(
+        try_none(None, "id"),
+        try_none_or_whitespace("bob", "name"),
+        try_none_or_empty([], "tags"),
+        Err([domain_error]),
+    )
+    failures = result.expect_err("should fail")
+    assert [getattr(f, "param_name", None) for f in failures[:2]] == ["id", "tags"]
+    assert failures[2] is domain_error
+
+
+def test_validate_all_when_no_results_then_returns_empty_tuple() -> None:
+    assert validate_all() == Ok(())
+
+
+def test_collect_when_all_valid_then_returns_values_and_leaves_failures_empty() -> None:
+    failures: Failures = []
+    record_id = collect_none(failures, 1, "id")
+    name = collect_none_or_whitespace(failures, "", "name")
+    tags = collect_none_or_empty(failures, ["a"], "tags")
+    assert collected(failures, (record_id, name, tags)) == Ok((1, "", ["a"]))
+
+
+def test_collect_when_several_invalid_then_collects_every_failure_in_order() -> None:
+    failures: Failures = []
+    collect_none_or_empty(failures, None, "id")
+    collect_none_or_whitespace(failures, "  ", "name")
+    collect_none_or_empty(failures, (), "tags")
+    collect_none_or_empty(failures, 0, "count")
+    result = collected(failures, None).expect_err("should fail")
+    assert [(str(f), getattr(f, "param_name")) for f in result] == [
+        (ArgumentException.NONE_ARGUMENT_MESSAGE, "id"),
+        (ArgumentException.WHITESPACE_ARGUMENT_MESSAGE, "name"),
+        (ArgumentException.EMPTY_ARGUMENT_MESSAGE, "tags"),
+    ]
+
+
+def test_design_by_contract_when_imported_alone_then_does_not_import_result_type() -> (
+    None
+):
+    code = (
+        "import sys, shared_kernel.design_by_contract.schema;"
+        "print('shared_kernel.result_type' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    assert output.strip() == "False"